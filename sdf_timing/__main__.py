@@ -18,32 +18,88 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import argparse
-import json
-from .sdfparse import emit
+import sys
+from . import batch
+from . import diff
+from . import sdfjson
+from .sdfparse import iterparse
 from .sdfparse import parse
+from .sdfparse import write
 
 
-def main():
-    parser = argparse.ArgumentParser()
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == 'diff':
+        return diff.main(argv[1:])
+
+    parser = argparse.ArgumentParser(
+        epilog="Run 'python -m sdf_timing diff --help' to compare two SDF "
+        "files.")
     parser.add_argument('--emit', action='store_const', const=True,
                         help='When set SDF file will be generated from JSON.')
     parser.add_argument('--sdf', type=str, help='Path to SDF file')
     parser.add_argument('--json', type=str, help='Path to JSON file')
+    parser.add_argument('--format', choices=sdfjson.FORMATS,
+                        default='pretty',
+                        help='Format of the written JSON: indented, compact '
+                        'or one line per cell instance (default: '
+                        '%(default)s). --emit reads all of them.')
+
+    group = parser.add_argument_group(
+        'batch mode', 'Convert many files in a pool of processes, the '
+        'outputs get the name of the inputs with the extension of the '
+        'output format.')
+    group.add_argument('--batch', nargs='+', metavar='GLOB', default=[],
+                       help='Input files, ** matches any subdirectories')
+    group.add_argument('--manifest', type=str,
+                       help='File listing an input and optionally an output '
+                       'path per line')
+    group.add_argument('--output-dir', type=str,
+                       help='Directory of the outputs, by default they are '
+                       'written next to the inputs')
+    group.add_argument('--jobs', '-j', type=int,
+                       help='Number of processes, by default the number of '
+                       'CPUs')
+    group.add_argument('--check', choices=batch.CHECKS, default='mtime',
+                       help='How to find outputs which are up to date: '
+                       'newer than the input (in any format), written '
+                       'from an input with the same hash in the same '
+                       'format or never (default: %(default)s)')
+
+    args = parser.parse_args(argv)
+
+    if args.batch or args.manifest:
+        tasks = batch.make_tasks(args.batch, args.manifest, args.output_dir,
+                                 bool(args.emit), args.format)
+        summary = batch.run(tasks, args.jobs, args.check)
+        for error in summary.errors:
+            print(error, file=sys.stderr)
+        print(summary)
+        return 1 if summary.errors else 0
 
-    args = parser.parse_args()
+    if args.sdf is None or args.json is None:
+        parser.error('--sdf and --json are required without --batch or '
+                     '--manifest')
 
     if args.emit:
+        # the SDF file is only replaced once the whole input has been read,
+        # cells of a JSON document are written sorted as by emit()
         with open(args.json, 'r') as fp:
-            input = json.loads(fp.read())
-            timings = emit(input)
-            open(args.sdf, 'w').write(timings)
+            batch.write_atomic(args.sdf, lambda out: write(
+                sdfjson.load_events(fp, sort=True), out))
+    elif args.format == 'ndjson':
+        # one cell at a time from the SDF file to the JSON file
+        with open(args.sdf, 'r') as fp, open(args.json, 'w') as out:
+            sdfjson.write_events(iterparse(fp), out)
     else:
         with open(args.sdf, 'r') as fp:
             timings = parse(fp.read())
 
         with open(args.json, 'w') as fp:
-            json.dump(timings, fp, indent=4, sort_keys=True)
+            sdfjson.dump(timings, fp, args.format)
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
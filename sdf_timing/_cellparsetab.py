@@ -0,0 +1,170 @@
+
+# _cellparsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'cell_listABSOLUTE ARITHMETIC ASTERISK BIT_AND BIT_NOT BIT_OR CASEEQUAL CASENEQUAL CELL CELLTYPE COLON COND DATE DELAY DELAYFILE DESIGN DEVICE DIVIDER DOT EQUAL FLOAT GT GTE HOLD INCREMENT INSTANCE INTERCONNECT IOPATH LEFTSHIFT LOGIC_AND LOGIC_NOT LOGIC_OR LPAR LT LTE MODULO NAND NEGEDGE NEQUAL NOR PATHCONSTRAINT PORT POSEDGE PROCESS PROGRAM QFLOAT QSTRING RECOVERY REMOVAL RIGHTSHIFT RPAR SCALARCONSTANT SDFVERSION SETUP SETUPHOLD SLASH STRING TEMPERATURE TIMESCALE TIMINGCHECK TIMINGENV VENDOR VERSION VOLTAGE WIDTH XNOR XORsdf_file : LPAR DELAYFILE sdf_header RPAR\n                | LPAR DELAYFILE sdf_header cell_list RPARsdf_header : sdf_header_qstring\n                  | sdf_header_qfloat\n                  | sdf_header sdf_header_qstring\n                  | sdf_header sdf_header_qfloat\n                  | sdf_header voltage\n                  | sdf_header temperature\n                  | sdf_header hierarchy_divider\n                  | sdf_header timescalesdf_header_qstring : LPAR qstring_header_entry QSTRING RPAR\n                          | LPAR qstring_header_entry RPARqstring_header_entry : SDFVERSION\n                            | DATE\n                            | PROCESS\n                            | DESIGN\n                            | VENDOR\n                            | PROGRAM\n                            | VERSIONsdf_header_qfloat : LPAR qfloat_header_entry QFLOAT RPARqfloat_header_entry : SDFVERSION\n                           | VERSIONvoltage : LPAR VOLTAGE real_triple RPARtemperature : LPAR TEMPERATURE real_triple RPARhierarchy_divider : LPAR DIVIDER DOT RPAR\n               | LPAR DIVIDER SLASH RPARtimescale : LPAR TIMESCALE FLOAT STRING RPARcell_list : cell\n                 | cell_list cellcell : LPAR CELL celltype instance timing_cell_lst RPAR\n            | LPAR CELL celltype instance RPARtiming_cell_lst : timing_cell_entry\n                       | timing_cell_lst timing_cell_entrytiming_cell_entry : timing_check\n                         | delay\n                         | timingenvcelltype : LPAR CELLTYPE QSTRING RPARinstance : LPAR INSTANCE STRING RPAR\n                | LPAR INSTANCE ASTERISK RPAR\n                | LPAR INSTANCE RPARtiming_check : LPAR TIMINGCHECK timing_check_list RPARtiming_port : port_check\n                   | cond_checkport_check : port_speccond_check : LPAR COND equation port_spec RPARtiming_check_list : t_check\n                         | timing_check_list t_checkt_check : removal_check\n               | recovery_check\n               | hold_check\n               | setup_check\n               | width_check\n               | setuphold_checkremoval_check : LPAR REMOVAL timing_port timing_port real_triple RPARrecovery_check : LPAR RECOVERY timing_port timing_port real_triple     RPARhold_check : LPAR HOLD timing_port timing_port real_triple RPARsetup_check : LPAR SETUP timing_port timing_port real_triple RPARwidth_check : LPAR WIDTH timing_port real_triple RPARsetuphold_check : LPAR SETUPHOLD timing_port timing_port real_triple     real_triple RPARtimingenv : LPAR TIMINGENV constraints_list RPARconstraints_list : path_constraint\n                        | constraints_list path_constraintpath_constraint : LPAR PATHCONSTRAINT port_spec port_spec real_triple     real_triple RPARdelay : LPAR DELAY absolute_list RPAR\n             | LPAR DELAY increment_list RPARabsolute_list : absolute\n                     | absolute_list absoluteabsolute : LPAR ABSOLUTE RPARabsolute : LPAR ABSOLUTE delay_list RPARincrement_list : increment\n                      | increment_list incrementincrement : LPAR INCREMENT delay_list RPARcond_delay : LPAR COND delay_condition delay_list RPARdelay_condition : LPAR equation RPARdelay_condition : equationdelay_list : del\n                  | delay_list deldel : interconnect\n           | iopath\n           | port\n           | device\n           | cond_delaydelval_list : real_triple\n                   | real_triple real_triple\n                   | real_triple real_triple real_tripledevice : LPAR DEVICE port_spec delval_list RPARiopath : LPAR IOPATH port_spec port_spec delval_list RPARport_spec : STRING\n                 | LPAR port_condition STRING RPAR\n                 | FLOATinterconnect : LPAR INTERCONNECT port_spec port_spec delval_list RPARport : LPAR PORT port_spec delval_list RPARport_condition : POSEDGE\n                      | NEGEDGEreal_triple : FLOAT COLON FLOAT COLON FLOAT\n                   | COLON FLOAT COLON FLOAT\n                   | FLOAT COLON COLON FLOAT\n                   | FLOAT COLON FLOAT COLON\n                   | COLON COLON FLOAT\n                   | COLON FLOAT COLON\n                   | FLOAT COLON COLONreal_triple : LPAR FLOAT COLON FLOAT COLON FLOAT RPAR\n                   | LPAR COLON FLOAT COLON FLOAT RPAR\n                   | LPAR FLOAT COLON COLON FLOAT RPAR\n                   | LPAR FLOAT COLON FLOAT COLON RPAR\n                   | LPAR COLON COLON FLOAT RPAR\n                   | LPAR COLON FLOAT COLON RPAR\n                   | LPAR FLOAT COLON COLON RPAR\n                   | LPAR RPARequation : operator\n                | STRING\n                | FLOAT\n                | SCALARCONSTANT\n                | equation operator\n                | equation FLOAT\n                | equation SCALARCONSTANT\n                | equation STRINGoperator : ARITHMETIC\n                | SLASH\n                | MODULO\n                | LOGIC_NOT\n                | BIT_NOT\n                | LOGIC_AND\n                | BIT_AND\n                | NAND\n                | LOGIC_OR\n                | BIT_OR\n                | NOR\n                | XOR\n                | XNOR\n                | EQUAL\n                | NEQUAL\n                | CASEEQUAL\n                | CASENEQUAL\n                | LEFTSHIFT\n                | RIGHTSHIFT\n                | GT\n                | LT\n                | GTE\n                | LTE'
+    
+_lr_action_items = {'LPAR':([0,1,2,4,5,7,10,14,15,16,17,18,19,20,22,24,25,26,27,28,29,30,32,33,34,35,36,37,38,39,41,42,43,44,46,47,48,49,50,51,52,53,54,55,56,57,59,60,62,63,64,65,66,68,69,70,71,72,73,74,75,76,77,78,80,81,82,83,84,85,86,87,88,90,95,96,97,98,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,148,149,153,154,155,156,157,159,160,161,163,164,165,166,167,168,169,170,171,176,177,178,180,181,183,186,187,188,190,195,196,197,198,201,202,203,204,205,206,209,210,212,213,214,215,218,219,220,221,],[3,3,-28,-29,6,9,13,13,-31,-32,-34,-35,-36,-37,-40,31,40,45,-30,-33,-38,-39,31,-46,-48,-49,-50,-51,-52,-53,58,61,-66,-70,45,-61,67,67,67,67,67,67,-41,-47,79,79,-64,-67,-65,-71,89,-60,-62,67,-42,-43,-44,-88,-90,67,67,67,99,67,-68,79,-76,-78,-79,-80,-81,-82,79,89,99,99,99,99,99,89,89,89,89,158,-69,-77,-72,99,89,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-109,-58,99,89,89,99,99,79,-75,99,-114,-115,-116,-117,-89,-54,-55,-56,-57,-101,-99,-100,99,99,99,79,-115,-117,-45,-98,-97,-96,-59,-92,99,-86,-74,-73,-63,-108,-106,-107,-95,-91,-87,-105,-104,-103,-102,]),'$end':([1,2,4,15,27,],[0,-28,-29,-31,-30,]),'CELL':([3,],[5,]),'CELLTYPE':([6,],[8,]),'QSTRING':([8,],[11,]),'INSTANCE':([9,],[12,]),'RPAR':([10,11,12,14,16,17,18,19,21,22,23,28,29,30,32,33,34,35,36,37,38,39,41,42,43,44,46,47,54,55,56,59,60,62,63,65,66,80,81,82,83,84,85,86,87,88,99,100,109,110,111,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,148,149,162,163,164,165,166,167,168,169,170,171,176,177,178,179,182,183,184,185,186,187,188,189,192,193,194,195,196,197,198,199,200,201,202,203,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,],[15,20,22,27,-32,-34,-35,-36,29,-40,30,-33,-38,-39,54,-46,-48,-49,-50,-51,-52,-53,59,62,-66,-70,65,-61,-41,-47,80,-64,-67,-65,-71,-60,-62,-68,109,-76,-78,-79,-80,-81,-82,111,148,149,-69,-77,-72,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,167,168,169,170,171,-109,-58,190,-114,-90,-116,-88,-89,-54,-55,-56,-57,-101,-99,-100,198,201,-83,203,204,205,-115,-117,206,209,210,212,-98,-97,-96,-59,214,215,-92,-84,-86,-73,-63,218,219,-108,-106,220,-107,-95,-91,-87,-85,221,-105,-104,-103,-102,]),'STRING':([12,48,49,50,51,52,53,64,68,69,70,71,72,73,74,75,76,78,90,91,92,93,94,104,105,106,107,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,154,155,158,160,163,164,165,166,167,185,187,188,190,],[21,72,72,72,72,72,72,72,72,-42,-43,-44,-88,-90,72,72,72,72,72,115,141,-93,-94,72,72,72,72,115,166,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,72,72,115,188,-114,-115,-116,-117,-89,188,-115,-117,-45,]),'ASTERISK':([12,],[23,]),'TIMINGCHECK':([13,],[24,]),'DELAY':([13,],[25,]),'TIMINGENV':([13,],[26,]),'REMOVAL':([31,],[48,]),'RECOVERY':([31,],[49,]),'HOLD':([31,],[50,]),'SETUP':([31,],[51,]),'WIDTH':([31,],[52,]),'SETUPHOLD':([31,],[53,]),'ABSOLUTE':([40,58,],[56,56,]),'INCREMENT':([40,61,],[57,57,]),'PATHCONSTRAINT':([45,],[64,]),'FLOAT':([48,49,50,51,52,53,64,68,69,70,71,72,73,74,75,76,77,78,90,91,95,96,97,98,99,102,103,104,105,106,107,108,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,147,148,150,151,153,154,155,156,157,158,160,161,163,164,165,166,167,172,173,176,177,178,180,181,183,185,187,188,190,192,194,195,196,197,202,207,209,210,212,213,218,219,220,221,],[73,73,73,73,73,73,73,73,-42,-43,-44,-88,-90,73,73,73,101,73,73,116,101,101,101,101,146,152,101,73,73,73,73,116,101,164,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,174,-109,175,177,101,73,73,101,101,116,187,101,-114,-115,-116,-117,-89,191,193,196,-99,197,101,101,101,187,-115,-117,-45,208,211,213,-97,-96,101,217,-108,-106,-107,-95,-105,-104,-103,-102,]),'COND':([67,79,],[91,108,]),'POSEDGE':([67,89,],[93,93,]),'NEGEDGE':([67,89,],[94,94,]),'COLON':([69,70,71,72,73,77,95,96,97,98,99,101,102,103,112,146,147,148,150,152,153,156,157,161,167,172,174,175,176,177,178,180,181,183,190,191,195,196,197,202,209,210,212,213,218,219,220,221,],[-42,-43,-44,-88,-90,102,102,102,102,102,147,150,151,102,102,172,173,-109,176,178,102,102,102,102,-89,192,194,195,-101,-99,-100,102,102,102,-45,207,-98,-97,-96,102,-108,-106,-107,-95,-105,-104,-103,-102,]),'INTERCONNECT':([79,],[104,]),'IOPATH':([79,],[105,]),'PORT':([79,],[106,]),'DEVICE':([79,],[107,]),'SCALARCONSTANT':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[117,117,165,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,117,165,-114,-115,-116,-117,165,-115,-117,]),'ARITHMETIC':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[118,118,118,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,118,118,-114,-115,-116,-117,118,-115,-117,]),'SLASH':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[119,119,119,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,119,119,-114,-115,-116,-117,119,-115,-117,]),'MODULO':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[120,120,120,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,120,120,-114,-115,-116,-117,120,-115,-117,]),'LOGIC_NOT':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[121,121,121,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,121,121,-114,-115,-116,-117,121,-115,-117,]),'BIT_NOT':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[122,122,122,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,122,122,-114,-115,-116,-117,122,-115,-117,]),'LOGIC_AND':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[123,123,123,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,123,123,-114,-115,-116,-117,123,-115,-117,]),'BIT_AND':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[124,124,124,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,124,124,-114,-115,-116,-117,124,-115,-117,]),'NAND':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[125,125,125,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,125,125,-114,-115,-116,-117,125,-115,-117,]),'LOGIC_OR':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[126,126,126,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,126,126,-114,-115,-116,-117,126,-115,-117,]),'BIT_OR':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[127,127,127,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,127,127,-114,-115,-116,-117,127,-115,-117,]),'NOR':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[128,128,128,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,128,128,-114,-115,-116,-117,128,-115,-117,]),'XOR':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[129,129,129,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,129,129,-114,-115,-116,-117,129,-115,-117,]),'XNOR':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[130,130,130,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,130,130,-114,-115,-116,-117,130,-115,-117,]),'EQUAL':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[131,131,131,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,131,131,-114,-115,-116,-117,131,-115,-117,]),'NEQUAL':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[132,132,132,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,132,132,-114,-115,-116,-117,132,-115,-117,]),'CASEEQUAL':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[133,133,133,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,133,133,-114,-115,-116,-117,133,-115,-117,]),'CASENEQUAL':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[134,134,134,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,134,134,-114,-115,-116,-117,134,-115,-117,]),'LEFTSHIFT':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[135,135,135,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,135,135,-114,-115,-116,-117,135,-115,-117,]),'RIGHTSHIFT':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[136,136,136,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,136,136,-114,-115,-116,-117,136,-115,-117,]),'GT':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[137,137,137,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,137,137,-114,-115,-116,-117,137,-115,-117,]),'LT':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[138,138,138,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,138,138,-114,-115,-116,-117,138,-115,-117,]),'GTE':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[139,139,139,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,139,139,-114,-115,-116,-117,139,-115,-117,]),'LTE':([91,108,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,158,160,163,164,165,166,185,187,188,],[140,140,140,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,140,140,-114,-115,-116,-117,140,-115,-117,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'cell_list':([0,],[1,]),'cell':([0,1,],[2,4,]),'celltype':([5,],[7,]),'instance':([7,],[10,]),'timing_cell_lst':([10,],[14,]),'timing_cell_entry':([10,14,],[16,28,]),'timing_check':([10,14,],[17,17,]),'delay':([10,14,],[18,18,]),'timingenv':([10,14,],[19,19,]),'timing_check_list':([24,],[32,]),'t_check':([24,32,],[33,55,]),'removal_check':([24,32,],[34,34,]),'recovery_check':([24,32,],[35,35,]),'hold_check':([24,32,],[36,36,]),'setup_check':([24,32,],[37,37,]),'width_check':([24,32,],[38,38,]),'setuphold_check':([24,32,],[39,39,]),'absolute_list':([25,],[41,]),'increment_list':([25,],[42,]),'absolute':([25,41,],[43,60,]),'increment':([25,42,],[44,63,]),'constraints_list':([26,],[46,]),'path_constraint':([26,46,],[47,66,]),'timing_port':([48,49,50,51,52,53,68,74,75,76,78,],[68,74,75,76,77,78,95,96,97,98,103,]),'port_check':([48,49,50,51,52,53,68,74,75,76,78,],[69,69,69,69,69,69,69,69,69,69,69,]),'cond_check':([48,49,50,51,52,53,68,74,75,76,78,],[70,70,70,70,70,70,70,70,70,70,70,]),'port_spec':([48,49,50,51,52,53,64,68,74,75,76,78,90,104,105,106,107,113,154,155,],[71,71,71,71,71,71,90,71,71,71,71,71,112,154,155,156,157,162,180,181,]),'delay_list':([56,57,159,],[81,88,186,]),'del':([56,57,81,88,159,186,],[82,82,110,110,82,110,]),'interconnect':([56,57,81,88,159,186,],[83,83,83,83,83,83,]),'iopath':([56,57,81,88,159,186,],[84,84,84,84,84,84,]),'port':([56,57,81,88,159,186,],[85,85,85,85,85,85,]),'device':([56,57,81,88,159,186,],[86,86,86,86,86,86,]),'cond_delay':([56,57,81,88,159,186,],[87,87,87,87,87,87,]),'port_condition':([67,89,],[92,92,]),'real_triple':([77,95,96,97,98,103,112,153,156,157,161,180,181,183,202,],[100,142,143,144,145,153,161,179,183,183,189,183,183,202,216,]),'equation':([91,108,158,],[113,160,185,]),'operator':([91,108,113,158,160,185,],[114,114,163,114,163,163,]),'delay_condition':([108,],[159,]),'delval_list':([156,157,180,181,],[182,184,199,200,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> cell_list","S'",1,None,None,None),
+  ('sdf_file -> LPAR DELAYFILE sdf_header RPAR','sdf_file',4,'p_sdf_file','sdfyacc.py',33),
+  ('sdf_file -> LPAR DELAYFILE sdf_header cell_list RPAR','sdf_file',5,'p_sdf_file','sdfyacc.py',34),
+  ('sdf_header -> sdf_header_qstring','sdf_header',1,'p_sdf_header','sdfyacc.py',45),
+  ('sdf_header -> sdf_header_qfloat','sdf_header',1,'p_sdf_header','sdfyacc.py',46),
+  ('sdf_header -> sdf_header sdf_header_qstring','sdf_header',2,'p_sdf_header','sdfyacc.py',47),
+  ('sdf_header -> sdf_header sdf_header_qfloat','sdf_header',2,'p_sdf_header','sdfyacc.py',48),
+  ('sdf_header -> sdf_header voltage','sdf_header',2,'p_sdf_header','sdfyacc.py',49),
+  ('sdf_header -> sdf_header temperature','sdf_header',2,'p_sdf_header','sdfyacc.py',50),
+  ('sdf_header -> sdf_header hierarchy_divider','sdf_header',2,'p_sdf_header','sdfyacc.py',51),
+  ('sdf_header -> sdf_header timescale','sdf_header',2,'p_sdf_header','sdfyacc.py',52),
+  ('sdf_header_qstring -> LPAR qstring_header_entry QSTRING RPAR','sdf_header_qstring',4,'p_sdf_header_qstring','sdfyacc.py',58),
+  ('sdf_header_qstring -> LPAR qstring_header_entry RPAR','sdf_header_qstring',3,'p_sdf_header_qstring','sdfyacc.py',59),
+  ('qstring_header_entry -> SDFVERSION','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',67),
+  ('qstring_header_entry -> DATE','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',68),
+  ('qstring_header_entry -> PROCESS','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',69),
+  ('qstring_header_entry -> DESIGN','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',70),
+  ('qstring_header_entry -> VENDOR','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',71),
+  ('qstring_header_entry -> PROGRAM','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',72),
+  ('qstring_header_entry -> VERSION','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',73),
+  ('sdf_header_qfloat -> LPAR qfloat_header_entry QFLOAT RPAR','sdf_header_qfloat',4,'p_sdf_header_qfloat','sdfyacc.py',78),
+  ('qfloat_header_entry -> SDFVERSION','qfloat_header_entry',1,'p_qfloat_header_entry','sdfyacc.py',86),
+  ('qfloat_header_entry -> VERSION','qfloat_header_entry',1,'p_qfloat_header_entry','sdfyacc.py',87),
+  ('voltage -> LPAR VOLTAGE real_triple RPAR','voltage',4,'p_sdf_voltage','sdfyacc.py',92),
+  ('temperature -> LPAR TEMPERATURE real_triple RPAR','temperature',4,'p_sdf_temperature','sdfyacc.py',99),
+  ('hierarchy_divider -> LPAR DIVIDER DOT RPAR','hierarchy_divider',4,'p_sdf_divider','sdfyacc.py',106),
+  ('hierarchy_divider -> LPAR DIVIDER SLASH RPAR','hierarchy_divider',4,'p_sdf_divider','sdfyacc.py',107),
+  ('timescale -> LPAR TIMESCALE FLOAT STRING RPAR','timescale',5,'p_sdf_timescale','sdfyacc.py',114),
+  ('cell_list -> cell','cell_list',1,'p_cell_list','sdfyacc.py',121),
+  ('cell_list -> cell_list cell','cell_list',2,'p_cell_list','sdfyacc.py',122),
+  ('cell -> LPAR CELL celltype instance timing_cell_lst RPAR','cell',6,'p_timing_cell','sdfyacc.py',145),
+  ('cell -> LPAR CELL celltype instance RPAR','cell',5,'p_timing_cell','sdfyacc.py',146),
+  ('timing_cell_lst -> timing_cell_entry','timing_cell_lst',1,'p_timing_cell_lst','sdfyacc.py',159),
+  ('timing_cell_lst -> timing_cell_lst timing_cell_entry','timing_cell_lst',2,'p_timing_cell_lst','sdfyacc.py',160),
+  ('timing_cell_entry -> timing_check','timing_cell_entry',1,'p_timing_cell_entry','sdfyacc.py',164),
+  ('timing_cell_entry -> delay','timing_cell_entry',1,'p_timing_cell_entry','sdfyacc.py',165),
+  ('timing_cell_entry -> timingenv','timing_cell_entry',1,'p_timing_cell_entry','sdfyacc.py',166),
+  ('celltype -> LPAR CELLTYPE QSTRING RPAR','celltype',4,'p_celltype','sdfyacc.py',170),
+  ('instance -> LPAR INSTANCE STRING RPAR','instance',4,'p_instance','sdfyacc.py',175),
+  ('instance -> LPAR INSTANCE ASTERISK RPAR','instance',4,'p_instance','sdfyacc.py',176),
+  ('instance -> LPAR INSTANCE RPAR','instance',3,'p_instance','sdfyacc.py',177),
+  ('timing_check -> LPAR TIMINGCHECK timing_check_list RPAR','timing_check',4,'p_timing_check','sdfyacc.py',185),
+  ('timing_port -> port_check','timing_port',1,'p_timing_port','sdfyacc.py',189),
+  ('timing_port -> cond_check','timing_port',1,'p_timing_port','sdfyacc.py',190),
+  ('port_check -> port_spec','port_check',1,'p_port_check','sdfyacc.py',195),
+  ('cond_check -> LPAR COND equation port_spec RPAR','cond_check',5,'p_timing_cond','sdfyacc.py',205),
+  ('timing_check_list -> t_check','timing_check_list',1,'p_timing_check_list','sdfyacc.py',217),
+  ('timing_check_list -> timing_check_list t_check','timing_check_list',2,'p_timing_check_list','sdfyacc.py',218),
+  ('t_check -> removal_check','t_check',1,'p_t_check','sdfyacc.py',228),
+  ('t_check -> recovery_check','t_check',1,'p_t_check','sdfyacc.py',229),
+  ('t_check -> hold_check','t_check',1,'p_t_check','sdfyacc.py',230),
+  ('t_check -> setup_check','t_check',1,'p_t_check','sdfyacc.py',231),
+  ('t_check -> width_check','t_check',1,'p_t_check','sdfyacc.py',232),
+  ('t_check -> setuphold_check','t_check',1,'p_t_check','sdfyacc.py',233),
+  ('removal_check -> LPAR REMOVAL timing_port timing_port real_triple RPAR','removal_check',6,'p_removal_check','sdfyacc.py',238),
+  ('recovery_check -> LPAR RECOVERY timing_port timing_port real_triple RPAR','recovery_check',6,'p_recovery_check','sdfyacc.py',249),
+  ('hold_check -> LPAR HOLD timing_port timing_port real_triple RPAR','hold_check',6,'p_hold_check','sdfyacc.py',261),
+  ('setup_check -> LPAR SETUP timing_port timing_port real_triple RPAR','setup_check',6,'p_setup_check','sdfyacc.py',272),
+  ('width_check -> LPAR WIDTH timing_port real_triple RPAR','width_check',5,'p_width_check','sdfyacc.py',283),
+  ('setuphold_check -> LPAR SETUPHOLD timing_port timing_port real_triple real_triple RPAR','setuphold_check',7,'p_setuphold_check','sdfyacc.py',294),
+  ('timingenv -> LPAR TIMINGENV constraints_list RPAR','timingenv',4,'p_timingenv','sdfyacc.py',307),
+  ('constraints_list -> path_constraint','constraints_list',1,'p_constraints_list','sdfyacc.py',311),
+  ('constraints_list -> constraints_list path_constraint','constraints_list',2,'p_constraints_list','sdfyacc.py',312),
+  ('path_constraint -> LPAR PATHCONSTRAINT port_spec port_spec real_triple real_triple RPAR','path_constraint',7,'p_path_constraint','sdfyacc.py',322),
+  ('delay -> LPAR DELAY absolute_list RPAR','delay',4,'p_delay','sdfyacc.py',335),
+  ('delay -> LPAR DELAY increment_list RPAR','delay',4,'p_delay','sdfyacc.py',336),
+  ('absolute_list -> absolute','absolute_list',1,'p_absolute_list','sdfyacc.py',340),
+  ('absolute_list -> absolute_list absolute','absolute_list',2,'p_absolute_list','sdfyacc.py',341),
+  ('absolute -> LPAR ABSOLUTE RPAR','absolute',3,'p_absolute_empty','sdfyacc.py',345),
+  ('absolute -> LPAR ABSOLUTE delay_list RPAR','absolute',4,'p_absolute_delay_list','sdfyacc.py',349),
+  ('increment_list -> increment','increment_list',1,'p_increment_list','sdfyacc.py',358),
+  ('increment_list -> increment_list increment','increment_list',2,'p_increment_list','sdfyacc.py',359),
+  ('increment -> LPAR INCREMENT delay_list RPAR','increment',4,'p_increment_delay_list','sdfyacc.py',363),
+  ('cond_delay -> LPAR COND delay_condition delay_list RPAR','cond_delay',5,'p_cond_delay','sdfyacc.py',373),
+  ('delay_condition -> LPAR equation RPAR','delay_condition',3,'p_delay_condition','sdfyacc.py',382),
+  ('delay_condition -> equation','delay_condition',1,'p_delay_condition_nopar','sdfyacc.py',389),
+  ('delay_list -> del','delay_list',1,'p_delay_list_interconnect','sdfyacc.py',396),
+  ('delay_list -> delay_list del','delay_list',2,'p_delay_list_interconnect','sdfyacc.py',397),
+  ('del -> interconnect','del',1,'p_del','sdfyacc.py',413),
+  ('del -> iopath','del',1,'p_del','sdfyacc.py',414),
+  ('del -> port','del',1,'p_del','sdfyacc.py',415),
+  ('del -> device','del',1,'p_del','sdfyacc.py',416),
+  ('del -> cond_delay','del',1,'p_del','sdfyacc.py',417),
+  ('delval_list -> real_triple','delval_list',1,'p_delval_list','sdfyacc.py',422),
+  ('delval_list -> real_triple real_triple','delval_list',2,'p_delval_list','sdfyacc.py',423),
+  ('delval_list -> real_triple real_triple real_triple','delval_list',3,'p_delval_list','sdfyacc.py',424),
+  ('device -> LPAR DEVICE port_spec delval_list RPAR','device',5,'p_device','sdfyacc.py',445),
+  ('iopath -> LPAR IOPATH port_spec port_spec delval_list RPAR','iopath',6,'p_iopath','sdfyacc.py',451),
+  ('port_spec -> STRING','port_spec',1,'p_port_spec','sdfyacc.py',457),
+  ('port_spec -> LPAR port_condition STRING RPAR','port_spec',4,'p_port_spec','sdfyacc.py',458),
+  ('port_spec -> FLOAT','port_spec',1,'p_port_spec','sdfyacc.py',459),
+  ('interconnect -> LPAR INTERCONNECT port_spec port_spec delval_list RPAR','interconnect',6,'p_interconnect','sdfyacc.py',473),
+  ('port -> LPAR PORT port_spec delval_list RPAR','port',5,'p_port','sdfyacc.py',479),
+  ('port_condition -> POSEDGE','port_condition',1,'p_port_condition','sdfyacc.py',485),
+  ('port_condition -> NEGEDGE','port_condition',1,'p_port_condition','sdfyacc.py',486),
+  ('real_triple -> FLOAT COLON FLOAT COLON FLOAT','real_triple',5,'p_real_triple_no_par','sdfyacc.py',491),
+  ('real_triple -> COLON FLOAT COLON FLOAT','real_triple',4,'p_real_triple_no_par','sdfyacc.py',492),
+  ('real_triple -> FLOAT COLON COLON FLOAT','real_triple',4,'p_real_triple_no_par','sdfyacc.py',493),
+  ('real_triple -> FLOAT COLON FLOAT COLON','real_triple',4,'p_real_triple_no_par','sdfyacc.py',494),
+  ('real_triple -> COLON COLON FLOAT','real_triple',3,'p_real_triple_no_par','sdfyacc.py',495),
+  ('real_triple -> COLON FLOAT COLON','real_triple',3,'p_real_triple_no_par','sdfyacc.py',496),
+  ('real_triple -> FLOAT COLON COLON','real_triple',3,'p_real_triple_no_par','sdfyacc.py',497),
+  ('real_triple -> LPAR FLOAT COLON FLOAT COLON FLOAT RPAR','real_triple',7,'p_real_triple','sdfyacc.py',536),
+  ('real_triple -> LPAR COLON FLOAT COLON FLOAT RPAR','real_triple',6,'p_real_triple','sdfyacc.py',537),
+  ('real_triple -> LPAR FLOAT COLON COLON FLOAT RPAR','real_triple',6,'p_real_triple','sdfyacc.py',538),
+  ('real_triple -> LPAR FLOAT COLON FLOAT COLON RPAR','real_triple',6,'p_real_triple','sdfyacc.py',539),
+  ('real_triple -> LPAR COLON COLON FLOAT RPAR','real_triple',5,'p_real_triple','sdfyacc.py',540),
+  ('real_triple -> LPAR COLON FLOAT COLON RPAR','real_triple',5,'p_real_triple','sdfyacc.py',541),
+  ('real_triple -> LPAR FLOAT COLON COLON RPAR','real_triple',5,'p_real_triple','sdfyacc.py',542),
+  ('real_triple -> LPAR RPAR','real_triple',2,'p_real_triple','sdfyacc.py',543),
+  ('equation -> operator','equation',1,'p_equation','sdfyacc.py',582),
+  ('equation -> STRING','equation',1,'p_equation','sdfyacc.py',583),
+  ('equation -> FLOAT','equation',1,'p_equation','sdfyacc.py',584),
+  ('equation -> SCALARCONSTANT','equation',1,'p_equation','sdfyacc.py',585),
+  ('equation -> equation operator','equation',2,'p_equation','sdfyacc.py',586),
+  ('equation -> equation FLOAT','equation',2,'p_equation','sdfyacc.py',587),
+  ('equation -> equation SCALARCONSTANT','equation',2,'p_equation','sdfyacc.py',588),
+  ('equation -> equation STRING','equation',2,'p_equation','sdfyacc.py',589),
+  ('operator -> ARITHMETIC','operator',1,'p_operator','sdfyacc.py',600),
+  ('operator -> SLASH','operator',1,'p_operator','sdfyacc.py',601),
+  ('operator -> MODULO','operator',1,'p_operator','sdfyacc.py',602),
+  ('operator -> LOGIC_NOT','operator',1,'p_operator','sdfyacc.py',603),
+  ('operator -> BIT_NOT','operator',1,'p_operator','sdfyacc.py',604),
+  ('operator -> LOGIC_AND','operator',1,'p_operator','sdfyacc.py',605),
+  ('operator -> BIT_AND','operator',1,'p_operator','sdfyacc.py',606),
+  ('operator -> NAND','operator',1,'p_operator','sdfyacc.py',607),
+  ('operator -> LOGIC_OR','operator',1,'p_operator','sdfyacc.py',608),
+  ('operator -> BIT_OR','operator',1,'p_operator','sdfyacc.py',609),
+  ('operator -> NOR','operator',1,'p_operator','sdfyacc.py',610),
+  ('operator -> XOR','operator',1,'p_operator','sdfyacc.py',611),
+  ('operator -> XNOR','operator',1,'p_operator','sdfyacc.py',612),
+  ('operator -> EQUAL','operator',1,'p_operator','sdfyacc.py',613),
+  ('operator -> NEQUAL','operator',1,'p_operator','sdfyacc.py',614),
+  ('operator -> CASEEQUAL','operator',1,'p_operator','sdfyacc.py',615),
+  ('operator -> CASENEQUAL','operator',1,'p_operator','sdfyacc.py',616),
+  ('operator -> LEFTSHIFT','operator',1,'p_operator','sdfyacc.py',617),
+  ('operator -> RIGHTSHIFT','operator',1,'p_operator','sdfyacc.py',618),
+  ('operator -> GT','operator',1,'p_operator','sdfyacc.py',619),
+  ('operator -> LT','operator',1,'p_operator','sdfyacc.py',620),
+  ('operator -> GTE','operator',1,'p_operator','sdfyacc.py',621),
+  ('operator -> LTE','operator',1,'p_operator','sdfyacc.py',622),
+]
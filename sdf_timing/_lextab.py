@@ -0,0 +1,10 @@
+# _lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ABSOLUTE', 'ARITHMETIC', 'ASTERISK', 'BIT_AND', 'BIT_NOT', 'BIT_OR', 'CASEEQUAL', 'CASENEQUAL', 'CELL', 'CELLTYPE', 'COLON', 'COND', 'DATE', 'DELAY', 'DELAYFILE', 'DESIGN', 'DEVICE', 'DIVIDER', 'DOT', 'EQUAL', 'FLOAT', 'GT', 'GTE', 'HOLD', 'INCREMENT', 'INSTANCE', 'INTERCONNECT', 'IOPATH', 'LEFTSHIFT', 'LOGIC_AND', 'LOGIC_NOT', 'LOGIC_OR', 'LPAR', 'LT', 'LTE', 'MODULO', 'NAND', 'NEGEDGE', 'NEQUAL', 'NOR', 'PATHCONSTRAINT', 'PORT', 'POSEDGE', 'PROCESS', 'PROGRAM', 'QFLOAT', 'QSTRING', 'RECOVERY', 'REMOVAL', 'RIGHTSHIFT', 'RPAR', 'SCALARCONSTANT', 'SDFVERSION', 'SETUP', 'SETUPHOLD', 'SLASH', 'STRING', 'TEMPERATURE', 'TIMESCALE', 'TIMINGCHECK', 'TIMINGENV', 'VENDOR', 'VERSION', 'VOLTAGE', 'WIDTH', 'XNOR', 'XOR'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_SCALARCONSTANT>[01]?\'[Bb][01])|(?P<t_FLOAT>[-]?\\.?[0-9]+(\\.[0-9]+)?)|(?P<t_DOT>\\.)|(?P<t_ASTERISK>\\*)|(?P<t_SLASH>\\/)|(?P<t_STRING>[a-zA-Z0-9_\\/.\\[\\]\\\\]+)|(?P<t_newline>\\n+)|(?P<t_QSTRING>\\"[a-zA-Z0-9_!#$%&\\\'()*+,\\-./:;<=>?@\\[\\\\\\]^`{|}~ \\t\\n]+\\")|(?P<t_QFLOAT>\\"[-+]?(?: [0-9]+)(?: \\.[0-9]+)\\")|(?P<t_ARITHMETIC>[\\+\\-\\*])|(?P<t_XNOR>~\\^|\\^~)|(?P<t_LOGIC_OR>\\|\\|)|(?P<t_NOR>~\\|)|(?P<t_CASEEQUAL>===)|(?P<t_CASENEQUAL>!==)|(?P<t_RIGHTSHIFT>r>>)|(?P<t_LOGIC_AND>&&)|(?P<t_NAND>~&)|(?P<t_BIT_OR>\\|)|(?P<t_XOR>\\^)|(?P<t_EQUAL>==)|(?P<t_NEQUAL>!=)|(?P<t_LEFTSHIFT><<)|(?P<t_GTE>>=)|(?P<t_LTE><=)|(?P<t_LPAR>\\()|(?P<t_RPAR>\\))|(?P<t_MODULO>%)|(?P<t_LOGIC_NOT>!)|(?P<t_BIT_NOT>~)|(?P<t_BIT_AND>&)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_COLON>:)', [None, ('t_SCALARCONSTANT', 'SCALARCONSTANT'), ('t_FLOAT', 'FLOAT'), None, ('t_DOT', 'DOT'), ('t_ASTERISK', 'ASTERISK'), ('t_SLASH', 'SLASH'), ('t_STRING', 'STRING'), ('t_newline', 'newline'), (None, 'QSTRING'), (None, 'QFLOAT'), (None, 'ARITHMETIC'), (None, 'XNOR'), (None, 'LOGIC_OR'), (None, 'NOR'), (None, 'CASEEQUAL'), (None, 'CASENEQUAL'), (None, 'RIGHTSHIFT'), (None, 'LOGIC_AND'), (None, 'NAND'), (None, 'BIT_OR'), (None, 'XOR'), (None, 'EQUAL'), (None, 'NEQUAL'), (None, 'LEFTSHIFT'), (None, 'GTE'), (None, 'LTE'), (None, 'LPAR'), (None, 'RPAR'), (None, 'MODULO'), (None, 'LOGIC_NOT'), (None, 'BIT_NOT'), (None, 'BIT_AND'), (None, 'GT'), (None, 'LT'), (None, 'COLON')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
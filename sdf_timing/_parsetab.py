@@ -0,0 +1,170 @@
+
+# _parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ABSOLUTE ARITHMETIC ASTERISK BIT_AND BIT_NOT BIT_OR CASEEQUAL CASENEQUAL CELL CELLTYPE COLON COND DATE DELAY DELAYFILE DESIGN DEVICE DIVIDER DOT EQUAL FLOAT GT GTE HOLD INCREMENT INSTANCE INTERCONNECT IOPATH LEFTSHIFT LOGIC_AND LOGIC_NOT LOGIC_OR LPAR LT LTE MODULO NAND NEGEDGE NEQUAL NOR PATHCONSTRAINT PORT POSEDGE PROCESS PROGRAM QFLOAT QSTRING RECOVERY REMOVAL RIGHTSHIFT RPAR SCALARCONSTANT SDFVERSION SETUP SETUPHOLD SLASH STRING TEMPERATURE TIMESCALE TIMINGCHECK TIMINGENV VENDOR VERSION VOLTAGE WIDTH XNOR XORsdf_file : LPAR DELAYFILE sdf_header RPAR\n                | LPAR DELAYFILE sdf_header cell_list RPARsdf_header : sdf_header_qstring\n                  | sdf_header_qfloat\n                  | sdf_header sdf_header_qstring\n                  | sdf_header sdf_header_qfloat\n                  | sdf_header voltage\n                  | sdf_header temperature\n                  | sdf_header hierarchy_divider\n                  | sdf_header timescalesdf_header_qstring : LPAR qstring_header_entry QSTRING RPAR\n                          | LPAR qstring_header_entry RPARqstring_header_entry : SDFVERSION\n                            | DATE\n                            | PROCESS\n                            | DESIGN\n                            | VENDOR\n                            | PROGRAM\n                            | VERSIONsdf_header_qfloat : LPAR qfloat_header_entry QFLOAT RPARqfloat_header_entry : SDFVERSION\n                           | VERSIONvoltage : LPAR VOLTAGE real_triple RPARtemperature : LPAR TEMPERATURE real_triple RPARhierarchy_divider : LPAR DIVIDER DOT RPAR\n               | LPAR DIVIDER SLASH RPARtimescale : LPAR TIMESCALE FLOAT STRING RPARcell_list : cell\n                 | cell_list cellcell : LPAR CELL celltype instance timing_cell_lst RPAR\n            | LPAR CELL celltype instance RPARtiming_cell_lst : timing_cell_entry\n                       | timing_cell_lst timing_cell_entrytiming_cell_entry : timing_check\n                         | delay\n                         | timingenvcelltype : LPAR CELLTYPE QSTRING RPARinstance : LPAR INSTANCE STRING RPAR\n                | LPAR INSTANCE ASTERISK RPAR\n                | LPAR INSTANCE RPARtiming_check : LPAR TIMINGCHECK timing_check_list RPARtiming_port : port_check\n                   | cond_checkport_check : port_speccond_check : LPAR COND equation port_spec RPARtiming_check_list : t_check\n                         | timing_check_list t_checkt_check : removal_check\n               | recovery_check\n               | hold_check\n               | setup_check\n               | width_check\n               | setuphold_checkremoval_check : LPAR REMOVAL timing_port timing_port real_triple RPARrecovery_check : LPAR RECOVERY timing_port timing_port real_triple     RPARhold_check : LPAR HOLD timing_port timing_port real_triple RPARsetup_check : LPAR SETUP timing_port timing_port real_triple RPARwidth_check : LPAR WIDTH timing_port real_triple RPARsetuphold_check : LPAR SETUPHOLD timing_port timing_port real_triple     real_triple RPARtimingenv : LPAR TIMINGENV constraints_list RPARconstraints_list : path_constraint\n                        | constraints_list path_constraintpath_constraint : LPAR PATHCONSTRAINT port_spec port_spec real_triple     real_triple RPARdelay : LPAR DELAY absolute_list RPAR\n             | LPAR DELAY increment_list RPARabsolute_list : absolute\n                     | absolute_list absoluteabsolute : LPAR ABSOLUTE RPARabsolute : LPAR ABSOLUTE delay_list RPARincrement_list : increment\n                      | increment_list incrementincrement : LPAR INCREMENT delay_list RPARcond_delay : LPAR COND delay_condition delay_list RPARdelay_condition : LPAR equation RPARdelay_condition : equationdelay_list : del\n                  | delay_list deldel : interconnect\n           | iopath\n           | port\n           | device\n           | cond_delaydelval_list : real_triple\n                   | real_triple real_triple\n                   | real_triple real_triple real_tripledevice : LPAR DEVICE port_spec delval_list RPARiopath : LPAR IOPATH port_spec port_spec delval_list RPARport_spec : STRING\n                 | LPAR port_condition STRING RPAR\n                 | FLOATinterconnect : LPAR INTERCONNECT port_spec port_spec delval_list RPARport : LPAR PORT port_spec delval_list RPARport_condition : POSEDGE\n                      | NEGEDGEreal_triple : FLOAT COLON FLOAT COLON FLOAT\n                   | COLON FLOAT COLON FLOAT\n                   | FLOAT COLON COLON FLOAT\n                   | FLOAT COLON FLOAT COLON\n                   | COLON COLON FLOAT\n                   | COLON FLOAT COLON\n                   | FLOAT COLON COLONreal_triple : LPAR FLOAT COLON FLOAT COLON FLOAT RPAR\n                   | LPAR COLON FLOAT COLON FLOAT RPAR\n                   | LPAR FLOAT COLON COLON FLOAT RPAR\n                   | LPAR FLOAT COLON FLOAT COLON RPAR\n                   | LPAR COLON COLON FLOAT RPAR\n                   | LPAR COLON FLOAT COLON RPAR\n                   | LPAR FLOAT COLON COLON RPAR\n                   | LPAR RPARequation : operator\n                | STRING\n                | FLOAT\n                | SCALARCONSTANT\n                | equation operator\n                | equation FLOAT\n                | equation SCALARCONSTANT\n                | equation STRINGoperator : ARITHMETIC\n                | SLASH\n                | MODULO\n                | LOGIC_NOT\n                | BIT_NOT\n                | LOGIC_AND\n                | BIT_AND\n                | NAND\n                | LOGIC_OR\n                | BIT_OR\n                | NOR\n                | XOR\n                | XNOR\n                | EQUAL\n                | NEQUAL\n                | CASEEQUAL\n                | CASENEQUAL\n                | LEFTSHIFT\n                | RIGHTSHIFT\n                | GT\n                | LT\n                | GTE\n                | LTE'
+    
+_lr_action_items = {'LPAR':([0,3,5,6,7,19,20,21,22,23,24,25,26,28,30,31,34,37,38,39,49,52,53,57,58,59,63,68,69,70,71,75,76,77,78,79,80,85,86,87,88,90,92,93,94,95,96,99,100,102,103,104,105,107,108,109,110,111,112,113,114,116,117,118,119,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,138,139,141,142,143,144,145,146,148,149,150,151,152,153,154,155,156,157,158,160,161,162,163,164,165,166,167,168,170,175,176,177,178,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,223,224,225,226,227,228,230,231,232,234,235,236,237,238,239,240,241,242,244,245,247,250,251,252,254,255,258,259,260,261,262,263,264,265,],[2,4,17,-3,-4,35,-5,-6,-7,-8,-9,-10,-28,-12,40,40,48,-29,-11,-20,62,-109,-23,-24,-25,-26,74,-101,-99,-100,-27,74,-31,-32,-34,-35,-36,-98,-97,-96,-37,-40,106,115,120,-30,-33,-108,-106,-107,-95,-38,-39,106,-46,-48,-49,-50,-51,-52,-53,137,140,-66,-70,120,-61,-105,-104,-103,147,147,147,147,147,147,-41,-47,159,159,-64,-67,-65,-71,169,-60,-62,-102,147,-42,-43,-44,-88,-90,147,147,147,40,147,-68,159,-76,-78,-79,-80,-81,-82,159,169,40,40,40,40,40,169,169,169,169,229,-69,-77,-72,40,169,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,-58,40,169,169,40,40,159,-75,40,-114,-115,-116,-117,-89,-54,-55,-56,-57,40,40,40,159,-115,-117,-45,-59,-92,40,-86,-74,-73,-63,-91,-87,]),'$end':([1,18,36,],[0,-1,-2,]),'DELAYFILE':([2,],[3,]),'SDFVERSION':([4,17,],[10,10,]),'DATE':([4,17,],[11,11,]),'PROCESS':([4,17,],[12,12,]),'DESIGN':([4,17,],[13,13,]),'VENDOR':([4,17,],[14,14,]),'PROGRAM':([4,17,],[15,15,]),'VERSION':([4,17,],[16,16,]),'RPAR':([5,6,7,8,10,11,12,13,14,15,16,19,20,21,22,23,24,25,26,27,28,29,37,38,39,40,41,44,45,46,52,53,57,58,59,60,63,68,69,70,71,72,73,75,76,77,78,79,80,82,83,84,85,86,87,89,90,91,95,96,97,98,99,100,101,102,103,104,105,107,108,109,110,111,112,113,114,116,117,118,119,121,122,123,124,125,126,133,134,135,138,139,141,142,144,145,146,160,161,162,163,164,165,166,167,168,179,186,187,188,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,233,234,235,236,237,238,239,240,241,242,243,246,247,248,249,250,251,252,253,255,256,257,258,259,260,262,263,264,265,266,],[18,-3,-4,28,-13,-14,-15,-16,-17,-18,-19,36,-5,-6,-7,-8,-9,-10,-28,38,-12,39,-29,-11,-20,52,53,57,58,59,-109,-23,-24,-25,-26,71,76,-101,-99,-100,-27,88,90,95,-31,-32,-34,-35,-36,99,100,102,-98,-97,-96,104,-40,105,-30,-33,124,125,-108,-106,126,-107,-95,-38,-39,133,-46,-48,-49,-50,-51,-52,-53,138,141,-66,-70,144,-61,146,-105,-104,-103,-41,-47,160,-64,-67,-65,-71,-60,-62,-102,-68,186,-76,-78,-79,-80,-81,-82,188,223,-69,-77,-72,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,238,239,240,241,242,-58,254,-114,-90,-116,-88,-89,-54,-55,-56,-57,255,258,-83,260,261,262,-115,-117,263,-59,264,265,-92,-84,-86,-73,-63,-91,-87,-85,]),'QSTRING':([8,10,11,12,13,14,15,16,61,],[27,-13,-14,-15,-16,-17,-18,-19,72,]),'QFLOAT':([9,10,16,],[29,-21,-22,]),'VOLTAGE':([17,],[30,]),'TEMPERATURE':([17,],[31,]),'DIVIDER':([17,],[32,]),'TIMESCALE':([17,],[33,]),'CELL':([17,35,],[34,34,]),'FLOAT':([30,31,33,40,43,51,52,54,55,64,65,68,69,70,82,84,85,86,87,97,99,100,102,103,124,125,126,127,128,129,130,131,132,143,146,148,149,150,151,152,153,154,155,156,157,158,170,171,175,176,177,178,180,181,182,183,184,185,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,224,225,226,227,228,229,231,232,234,235,236,237,238,244,245,247,249,251,252,254,259,],[42,42,47,50,56,66,-109,67,69,81,83,86,-99,87,98,101,103,-97,-96,123,-108,-106,-107,-95,-105,-104,-103,153,153,153,153,153,153,153,-102,153,-42,-43,-44,-88,-90,153,153,153,42,153,153,193,42,42,42,42,42,153,153,153,153,193,42,235,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,42,153,153,42,42,193,251,42,-114,-115,-116,-117,-89,42,42,42,251,-115,-117,-45,42,]),'COLON':([30,31,40,42,43,50,51,52,54,56,64,66,67,68,69,70,81,85,86,87,99,100,102,103,124,125,126,146,149,150,151,152,153,157,175,176,177,178,180,189,224,227,228,232,238,244,245,247,254,259,],[43,43,51,54,55,64,65,-109,68,70,82,84,85,-101,-99,-100,97,-98,-97,-96,-108,-106,-107,-95,-105,-104,-103,-102,-42,-43,-44,-88,-90,43,43,43,43,43,43,43,43,43,43,43,-89,43,43,43,-45,43,]),'DOT':([32,],[45,]),'SLASH':([32,171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[46,196,196,196,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,196,196,-114,-115,-116,-117,196,-115,-117,]),'STRING':([47,73,127,128,129,130,131,132,143,148,149,150,151,152,153,154,155,156,158,170,171,172,173,174,181,182,183,184,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,225,226,229,231,234,235,236,237,238,249,251,252,254,],[60,89,152,152,152,152,152,152,152,152,-42,-43,-44,-88,-90,152,152,152,152,152,192,218,-93,-94,152,152,152,152,192,237,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,152,152,192,252,-114,-115,-116,-117,-89,252,-115,-117,-45,]),'CELLTYPE':([48,],[61,]),'INSTANCE':([62,],[73,]),'ASTERISK':([73,],[91,]),'TIMINGCHECK':([74,],[92,]),'DELAY':([74,],[93,]),'TIMINGENV':([74,],[94,]),'REMOVAL':([106,],[127,]),'RECOVERY':([106,],[128,]),'HOLD':([106,],[129,]),'SETUP':([106,],[130,]),'WIDTH':([106,],[131,]),'SETUPHOLD':([106,],[132,]),'ABSOLUTE':([115,137,],[135,135,]),'INCREMENT':([115,140,],[136,136,]),'PATHCONSTRAINT':([120,],[143,]),'COND':([147,159,],[171,185,]),'POSEDGE':([147,169,],[173,173,]),'NEGEDGE':([147,169,],[174,174,]),'INTERCONNECT':([159,],[181,]),'IOPATH':([159,],[182,]),'PORT':([159,],[183,]),'DEVICE':([159,],[184,]),'SCALARCONSTANT':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[194,194,236,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,194,236,-114,-115,-116,-117,236,-115,-117,]),'ARITHMETIC':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[195,195,195,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,195,195,-114,-115,-116,-117,195,-115,-117,]),'MODULO':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[197,197,197,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,197,197,-114,-115,-116,-117,197,-115,-117,]),'LOGIC_NOT':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[198,198,198,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,198,198,-114,-115,-116,-117,198,-115,-117,]),'BIT_NOT':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[199,199,199,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,199,199,-114,-115,-116,-117,199,-115,-117,]),'LOGIC_AND':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[200,200,200,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,200,200,-114,-115,-116,-117,200,-115,-117,]),'BIT_AND':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[201,201,201,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,201,201,-114,-115,-116,-117,201,-115,-117,]),'NAND':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[202,202,202,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,202,202,-114,-115,-116,-117,202,-115,-117,]),'LOGIC_OR':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[203,203,203,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,203,203,-114,-115,-116,-117,203,-115,-117,]),'BIT_OR':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[204,204,204,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,204,204,-114,-115,-116,-117,204,-115,-117,]),'NOR':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[205,205,205,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,205,205,-114,-115,-116,-117,205,-115,-117,]),'XOR':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[206,206,206,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,206,206,-114,-115,-116,-117,206,-115,-117,]),'XNOR':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[207,207,207,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,207,207,-114,-115,-116,-117,207,-115,-117,]),'EQUAL':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[208,208,208,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,208,208,-114,-115,-116,-117,208,-115,-117,]),'NEQUAL':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[209,209,209,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,209,209,-114,-115,-116,-117,209,-115,-117,]),'CASEEQUAL':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[210,210,210,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,210,210,-114,-115,-116,-117,210,-115,-117,]),'CASENEQUAL':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[211,211,211,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,211,211,-114,-115,-116,-117,211,-115,-117,]),'LEFTSHIFT':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[212,212,212,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,212,212,-114,-115,-116,-117,212,-115,-117,]),'RIGHTSHIFT':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[213,213,213,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,213,213,-114,-115,-116,-117,213,-115,-117,]),'GT':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[214,214,214,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,214,214,-114,-115,-116,-117,214,-115,-117,]),'LT':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[215,215,215,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,215,215,-114,-115,-116,-117,215,-115,-117,]),'GTE':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[216,216,216,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,216,216,-114,-115,-116,-117,216,-115,-117,]),'LTE':([171,185,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,229,231,234,235,236,237,249,251,252,],[217,217,217,-110,-111,-112,-113,-118,-119,-120,-121,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-137,-138,-139,-140,217,217,-114,-115,-116,-117,217,-115,-117,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'sdf_file':([0,],[1,]),'sdf_header':([3,],[5,]),'sdf_header_qstring':([3,5,],[6,20,]),'sdf_header_qfloat':([3,5,],[7,21,]),'qstring_header_entry':([4,17,],[8,8,]),'qfloat_header_entry':([4,17,],[9,9,]),'cell_list':([5,],[19,]),'voltage':([5,],[22,]),'temperature':([5,],[23,]),'hierarchy_divider':([5,],[24,]),'timescale':([5,],[25,]),'cell':([5,19,],[26,37,]),'real_triple':([30,31,157,175,176,177,178,180,189,224,227,228,232,244,245,247,259,],[41,44,179,219,220,221,222,224,232,243,247,247,253,247,247,259,266,]),'celltype':([34,],[49,]),'instance':([49,],[63,]),'timing_cell_lst':([63,],[75,]),'timing_cell_entry':([63,75,],[77,96,]),'timing_check':([63,75,],[78,78,]),'delay':([63,75,],[79,79,]),'timingenv':([63,75,],[80,80,]),'timing_check_list':([92,],[107,]),'t_check':([92,107,],[108,134,]),'removal_check':([92,107,],[109,109,]),'recovery_check':([92,107,],[110,110,]),'hold_check':([92,107,],[111,111,]),'setup_check':([92,107,],[112,112,]),'width_check':([92,107,],[113,113,]),'setuphold_check':([92,107,],[114,114,]),'absolute_list':([93,],[116,]),'increment_list':([93,],[117,]),'absolute':([93,116,],[118,139,]),'increment':([93,117,],[119,142,]),'constraints_list':([94,],[121,]),'path_constraint':([94,121,],[122,145,]),'timing_port':([127,128,129,130,131,132,148,154,155,156,158,],[148,154,155,156,157,158,175,176,177,178,180,]),'port_check':([127,128,129,130,131,132,148,154,155,156,158,],[149,149,149,149,149,149,149,149,149,149,149,]),'cond_check':([127,128,129,130,131,132,148,154,155,156,158,],[150,150,150,150,150,150,150,150,150,150,150,]),'port_spec':([127,128,129,130,131,132,143,148,154,155,156,158,170,181,182,183,184,190,225,226,],[151,151,151,151,151,151,170,151,151,151,151,151,189,225,226,227,228,233,244,245,]),'delay_list':([135,136,230,],[161,168,250,]),'del':([135,136,161,168,230,250,],[162,162,187,187,162,187,]),'interconnect':([135,136,161,168,230,250,],[163,163,163,163,163,163,]),'iopath':([135,136,161,168,230,250,],[164,164,164,164,164,164,]),'port':([135,136,161,168,230,250,],[165,165,165,165,165,165,]),'device':([135,136,161,168,230,250,],[166,166,166,166,166,166,]),'cond_delay':([135,136,161,168,230,250,],[167,167,167,167,167,167,]),'port_condition':([147,169,],[172,172,]),'equation':([171,185,229,],[190,231,249,]),'operator':([171,185,190,229,231,249,],[191,191,234,191,234,234,]),'delay_condition':([185,],[230,]),'delval_list':([227,228,244,245,],[246,248,256,257,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> sdf_file","S'",1,None,None,None),
+  ('sdf_file -> LPAR DELAYFILE sdf_header RPAR','sdf_file',4,'p_sdf_file','sdfyacc.py',33),
+  ('sdf_file -> LPAR DELAYFILE sdf_header cell_list RPAR','sdf_file',5,'p_sdf_file','sdfyacc.py',34),
+  ('sdf_header -> sdf_header_qstring','sdf_header',1,'p_sdf_header','sdfyacc.py',45),
+  ('sdf_header -> sdf_header_qfloat','sdf_header',1,'p_sdf_header','sdfyacc.py',46),
+  ('sdf_header -> sdf_header sdf_header_qstring','sdf_header',2,'p_sdf_header','sdfyacc.py',47),
+  ('sdf_header -> sdf_header sdf_header_qfloat','sdf_header',2,'p_sdf_header','sdfyacc.py',48),
+  ('sdf_header -> sdf_header voltage','sdf_header',2,'p_sdf_header','sdfyacc.py',49),
+  ('sdf_header -> sdf_header temperature','sdf_header',2,'p_sdf_header','sdfyacc.py',50),
+  ('sdf_header -> sdf_header hierarchy_divider','sdf_header',2,'p_sdf_header','sdfyacc.py',51),
+  ('sdf_header -> sdf_header timescale','sdf_header',2,'p_sdf_header','sdfyacc.py',52),
+  ('sdf_header_qstring -> LPAR qstring_header_entry QSTRING RPAR','sdf_header_qstring',4,'p_sdf_header_qstring','sdfyacc.py',58),
+  ('sdf_header_qstring -> LPAR qstring_header_entry RPAR','sdf_header_qstring',3,'p_sdf_header_qstring','sdfyacc.py',59),
+  ('qstring_header_entry -> SDFVERSION','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',67),
+  ('qstring_header_entry -> DATE','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',68),
+  ('qstring_header_entry -> PROCESS','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',69),
+  ('qstring_header_entry -> DESIGN','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',70),
+  ('qstring_header_entry -> VENDOR','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',71),
+  ('qstring_header_entry -> PROGRAM','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',72),
+  ('qstring_header_entry -> VERSION','qstring_header_entry',1,'p_qstring_header_entry','sdfyacc.py',73),
+  ('sdf_header_qfloat -> LPAR qfloat_header_entry QFLOAT RPAR','sdf_header_qfloat',4,'p_sdf_header_qfloat','sdfyacc.py',78),
+  ('qfloat_header_entry -> SDFVERSION','qfloat_header_entry',1,'p_qfloat_header_entry','sdfyacc.py',86),
+  ('qfloat_header_entry -> VERSION','qfloat_header_entry',1,'p_qfloat_header_entry','sdfyacc.py',87),
+  ('voltage -> LPAR VOLTAGE real_triple RPAR','voltage',4,'p_sdf_voltage','sdfyacc.py',92),
+  ('temperature -> LPAR TEMPERATURE real_triple RPAR','temperature',4,'p_sdf_temperature','sdfyacc.py',99),
+  ('hierarchy_divider -> LPAR DIVIDER DOT RPAR','hierarchy_divider',4,'p_sdf_divider','sdfyacc.py',106),
+  ('hierarchy_divider -> LPAR DIVIDER SLASH RPAR','hierarchy_divider',4,'p_sdf_divider','sdfyacc.py',107),
+  ('timescale -> LPAR TIMESCALE FLOAT STRING RPAR','timescale',5,'p_sdf_timescale','sdfyacc.py',114),
+  ('cell_list -> cell','cell_list',1,'p_cell_list','sdfyacc.py',121),
+  ('cell_list -> cell_list cell','cell_list',2,'p_cell_list','sdfyacc.py',122),
+  ('cell -> LPAR CELL celltype instance timing_cell_lst RPAR','cell',6,'p_timing_cell','sdfyacc.py',145),
+  ('cell -> LPAR CELL celltype instance RPAR','cell',5,'p_timing_cell','sdfyacc.py',146),
+  ('timing_cell_lst -> timing_cell_entry','timing_cell_lst',1,'p_timing_cell_lst','sdfyacc.py',159),
+  ('timing_cell_lst -> timing_cell_lst timing_cell_entry','timing_cell_lst',2,'p_timing_cell_lst','sdfyacc.py',160),
+  ('timing_cell_entry -> timing_check','timing_cell_entry',1,'p_timing_cell_entry','sdfyacc.py',164),
+  ('timing_cell_entry -> delay','timing_cell_entry',1,'p_timing_cell_entry','sdfyacc.py',165),
+  ('timing_cell_entry -> timingenv','timing_cell_entry',1,'p_timing_cell_entry','sdfyacc.py',166),
+  ('celltype -> LPAR CELLTYPE QSTRING RPAR','celltype',4,'p_celltype','sdfyacc.py',170),
+  ('instance -> LPAR INSTANCE STRING RPAR','instance',4,'p_instance','sdfyacc.py',175),
+  ('instance -> LPAR INSTANCE ASTERISK RPAR','instance',4,'p_instance','sdfyacc.py',176),
+  ('instance -> LPAR INSTANCE RPAR','instance',3,'p_instance','sdfyacc.py',177),
+  ('timing_check -> LPAR TIMINGCHECK timing_check_list RPAR','timing_check',4,'p_timing_check','sdfyacc.py',185),
+  ('timing_port -> port_check','timing_port',1,'p_timing_port','sdfyacc.py',189),
+  ('timing_port -> cond_check','timing_port',1,'p_timing_port','sdfyacc.py',190),
+  ('port_check -> port_spec','port_check',1,'p_port_check','sdfyacc.py',195),
+  ('cond_check -> LPAR COND equation port_spec RPAR','cond_check',5,'p_timing_cond','sdfyacc.py',205),
+  ('timing_check_list -> t_check','timing_check_list',1,'p_timing_check_list','sdfyacc.py',217),
+  ('timing_check_list -> timing_check_list t_check','timing_check_list',2,'p_timing_check_list','sdfyacc.py',218),
+  ('t_check -> removal_check','t_check',1,'p_t_check','sdfyacc.py',228),
+  ('t_check -> recovery_check','t_check',1,'p_t_check','sdfyacc.py',229),
+  ('t_check -> hold_check','t_check',1,'p_t_check','sdfyacc.py',230),
+  ('t_check -> setup_check','t_check',1,'p_t_check','sdfyacc.py',231),
+  ('t_check -> width_check','t_check',1,'p_t_check','sdfyacc.py',232),
+  ('t_check -> setuphold_check','t_check',1,'p_t_check','sdfyacc.py',233),
+  ('removal_check -> LPAR REMOVAL timing_port timing_port real_triple RPAR','removal_check',6,'p_removal_check','sdfyacc.py',238),
+  ('recovery_check -> LPAR RECOVERY timing_port timing_port real_triple RPAR','recovery_check',6,'p_recovery_check','sdfyacc.py',249),
+  ('hold_check -> LPAR HOLD timing_port timing_port real_triple RPAR','hold_check',6,'p_hold_check','sdfyacc.py',261),
+  ('setup_check -> LPAR SETUP timing_port timing_port real_triple RPAR','setup_check',6,'p_setup_check','sdfyacc.py',272),
+  ('width_check -> LPAR WIDTH timing_port real_triple RPAR','width_check',5,'p_width_check','sdfyacc.py',283),
+  ('setuphold_check -> LPAR SETUPHOLD timing_port timing_port real_triple real_triple RPAR','setuphold_check',7,'p_setuphold_check','sdfyacc.py',294),
+  ('timingenv -> LPAR TIMINGENV constraints_list RPAR','timingenv',4,'p_timingenv','sdfyacc.py',307),
+  ('constraints_list -> path_constraint','constraints_list',1,'p_constraints_list','sdfyacc.py',311),
+  ('constraints_list -> constraints_list path_constraint','constraints_list',2,'p_constraints_list','sdfyacc.py',312),
+  ('path_constraint -> LPAR PATHCONSTRAINT port_spec port_spec real_triple real_triple RPAR','path_constraint',7,'p_path_constraint','sdfyacc.py',322),
+  ('delay -> LPAR DELAY absolute_list RPAR','delay',4,'p_delay','sdfyacc.py',335),
+  ('delay -> LPAR DELAY increment_list RPAR','delay',4,'p_delay','sdfyacc.py',336),
+  ('absolute_list -> absolute','absolute_list',1,'p_absolute_list','sdfyacc.py',340),
+  ('absolute_list -> absolute_list absolute','absolute_list',2,'p_absolute_list','sdfyacc.py',341),
+  ('absolute -> LPAR ABSOLUTE RPAR','absolute',3,'p_absolute_empty','sdfyacc.py',345),
+  ('absolute -> LPAR ABSOLUTE delay_list RPAR','absolute',4,'p_absolute_delay_list','sdfyacc.py',349),
+  ('increment_list -> increment','increment_list',1,'p_increment_list','sdfyacc.py',358),
+  ('increment_list -> increment_list increment','increment_list',2,'p_increment_list','sdfyacc.py',359),
+  ('increment -> LPAR INCREMENT delay_list RPAR','increment',4,'p_increment_delay_list','sdfyacc.py',363),
+  ('cond_delay -> LPAR COND delay_condition delay_list RPAR','cond_delay',5,'p_cond_delay','sdfyacc.py',373),
+  ('delay_condition -> LPAR equation RPAR','delay_condition',3,'p_delay_condition','sdfyacc.py',382),
+  ('delay_condition -> equation','delay_condition',1,'p_delay_condition_nopar','sdfyacc.py',389),
+  ('delay_list -> del','delay_list',1,'p_delay_list_interconnect','sdfyacc.py',396),
+  ('delay_list -> delay_list del','delay_list',2,'p_delay_list_interconnect','sdfyacc.py',397),
+  ('del -> interconnect','del',1,'p_del','sdfyacc.py',413),
+  ('del -> iopath','del',1,'p_del','sdfyacc.py',414),
+  ('del -> port','del',1,'p_del','sdfyacc.py',415),
+  ('del -> device','del',1,'p_del','sdfyacc.py',416),
+  ('del -> cond_delay','del',1,'p_del','sdfyacc.py',417),
+  ('delval_list -> real_triple','delval_list',1,'p_delval_list','sdfyacc.py',422),
+  ('delval_list -> real_triple real_triple','delval_list',2,'p_delval_list','sdfyacc.py',423),
+  ('delval_list -> real_triple real_triple real_triple','delval_list',3,'p_delval_list','sdfyacc.py',424),
+  ('device -> LPAR DEVICE port_spec delval_list RPAR','device',5,'p_device','sdfyacc.py',445),
+  ('iopath -> LPAR IOPATH port_spec port_spec delval_list RPAR','iopath',6,'p_iopath','sdfyacc.py',451),
+  ('port_spec -> STRING','port_spec',1,'p_port_spec','sdfyacc.py',457),
+  ('port_spec -> LPAR port_condition STRING RPAR','port_spec',4,'p_port_spec','sdfyacc.py',458),
+  ('port_spec -> FLOAT','port_spec',1,'p_port_spec','sdfyacc.py',459),
+  ('interconnect -> LPAR INTERCONNECT port_spec port_spec delval_list RPAR','interconnect',6,'p_interconnect','sdfyacc.py',473),
+  ('port -> LPAR PORT port_spec delval_list RPAR','port',5,'p_port','sdfyacc.py',479),
+  ('port_condition -> POSEDGE','port_condition',1,'p_port_condition','sdfyacc.py',485),
+  ('port_condition -> NEGEDGE','port_condition',1,'p_port_condition','sdfyacc.py',486),
+  ('real_triple -> FLOAT COLON FLOAT COLON FLOAT','real_triple',5,'p_real_triple_no_par','sdfyacc.py',491),
+  ('real_triple -> COLON FLOAT COLON FLOAT','real_triple',4,'p_real_triple_no_par','sdfyacc.py',492),
+  ('real_triple -> FLOAT COLON COLON FLOAT','real_triple',4,'p_real_triple_no_par','sdfyacc.py',493),
+  ('real_triple -> FLOAT COLON FLOAT COLON','real_triple',4,'p_real_triple_no_par','sdfyacc.py',494),
+  ('real_triple -> COLON COLON FLOAT','real_triple',3,'p_real_triple_no_par','sdfyacc.py',495),
+  ('real_triple -> COLON FLOAT COLON','real_triple',3,'p_real_triple_no_par','sdfyacc.py',496),
+  ('real_triple -> FLOAT COLON COLON','real_triple',3,'p_real_triple_no_par','sdfyacc.py',497),
+  ('real_triple -> LPAR FLOAT COLON FLOAT COLON FLOAT RPAR','real_triple',7,'p_real_triple','sdfyacc.py',536),
+  ('real_triple -> LPAR COLON FLOAT COLON FLOAT RPAR','real_triple',6,'p_real_triple','sdfyacc.py',537),
+  ('real_triple -> LPAR FLOAT COLON COLON FLOAT RPAR','real_triple',6,'p_real_triple','sdfyacc.py',538),
+  ('real_triple -> LPAR FLOAT COLON FLOAT COLON RPAR','real_triple',6,'p_real_triple','sdfyacc.py',539),
+  ('real_triple -> LPAR COLON COLON FLOAT RPAR','real_triple',5,'p_real_triple','sdfyacc.py',540),
+  ('real_triple -> LPAR COLON FLOAT COLON RPAR','real_triple',5,'p_real_triple','sdfyacc.py',541),
+  ('real_triple -> LPAR FLOAT COLON COLON RPAR','real_triple',5,'p_real_triple','sdfyacc.py',542),
+  ('real_triple -> LPAR RPAR','real_triple',2,'p_real_triple','sdfyacc.py',543),
+  ('equation -> operator','equation',1,'p_equation','sdfyacc.py',582),
+  ('equation -> STRING','equation',1,'p_equation','sdfyacc.py',583),
+  ('equation -> FLOAT','equation',1,'p_equation','sdfyacc.py',584),
+  ('equation -> SCALARCONSTANT','equation',1,'p_equation','sdfyacc.py',585),
+  ('equation -> equation operator','equation',2,'p_equation','sdfyacc.py',586),
+  ('equation -> equation FLOAT','equation',2,'p_equation','sdfyacc.py',587),
+  ('equation -> equation SCALARCONSTANT','equation',2,'p_equation','sdfyacc.py',588),
+  ('equation -> equation STRING','equation',2,'p_equation','sdfyacc.py',589),
+  ('operator -> ARITHMETIC','operator',1,'p_operator','sdfyacc.py',600),
+  ('operator -> SLASH','operator',1,'p_operator','sdfyacc.py',601),
+  ('operator -> MODULO','operator',1,'p_operator','sdfyacc.py',602),
+  ('operator -> LOGIC_NOT','operator',1,'p_operator','sdfyacc.py',603),
+  ('operator -> BIT_NOT','operator',1,'p_operator','sdfyacc.py',604),
+  ('operator -> LOGIC_AND','operator',1,'p_operator','sdfyacc.py',605),
+  ('operator -> BIT_AND','operator',1,'p_operator','sdfyacc.py',606),
+  ('operator -> NAND','operator',1,'p_operator','sdfyacc.py',607),
+  ('operator -> LOGIC_OR','operator',1,'p_operator','sdfyacc.py',608),
+  ('operator -> BIT_OR','operator',1,'p_operator','sdfyacc.py',609),
+  ('operator -> NOR','operator',1,'p_operator','sdfyacc.py',610),
+  ('operator -> XOR','operator',1,'p_operator','sdfyacc.py',611),
+  ('operator -> XNOR','operator',1,'p_operator','sdfyacc.py',612),
+  ('operator -> EQUAL','operator',1,'p_operator','sdfyacc.py',613),
+  ('operator -> NEQUAL','operator',1,'p_operator','sdfyacc.py',614),
+  ('operator -> CASEEQUAL','operator',1,'p_operator','sdfyacc.py',615),
+  ('operator -> CASENEQUAL','operator',1,'p_operator','sdfyacc.py',616),
+  ('operator -> LEFTSHIFT','operator',1,'p_operator','sdfyacc.py',617),
+  ('operator -> RIGHTSHIFT','operator',1,'p_operator','sdfyacc.py',618),
+  ('operator -> GT','operator',1,'p_operator','sdfyacc.py',619),
+  ('operator -> LT','operator',1,'p_operator','sdfyacc.py',620),
+  ('operator -> GTE','operator',1,'p_operator','sdfyacc.py',621),
+  ('operator -> LTE','operator',1,'p_operator','sdfyacc.py',622),
+]
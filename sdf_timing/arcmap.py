@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Storage of the entries of a cell instance which keeps every arc.
+
+The names made by utils.add_*() only hold the kind of entry and the pins,
+for example 'iopath_CLK_Q', so arcs on the same pins which differ by the
+edges or the COND condition get the same name. An ArcMap stores the first
+of them under the name, as before, and every other one under a key which
+also holds its qualifiers, for example 'iopath_CLK_Q[negedge CLK]'.
+"""
+
+
+def arc_qualifiers(entry):
+    """Return the edges and condition of an entry as text
+
+    >>> from sdf_timing import utils
+    >>> arc_qualifiers(utils.prepare_entry(
+    ...     from_pin='CLK', from_pin_edge='posedge', to_pin='Q',
+    ...     is_cond=True, cond_equation='EN == 1'))
+    'posedge CLK, COND EN == 1'
+    """
+    parts = list()
+    if entry['from_pin_edge'] is not None:
+        parts.append(entry['from_pin_edge'] + ' ' + entry['from_pin'])
+    if entry['to_pin_edge'] is not None:
+        parts.append(entry['to_pin_edge'] + ' ' + entry['to_pin'])
+    if entry['is_cond']:
+        parts.append('COND ' + str(entry['cond_equation']))
+    return ', '.join(parts)
+
+
+def arc_key(entry):
+    """Return the key of an entry which includes its edges and condition
+
+    Two entries of a cell with the same key are the same arc, the later
+    one replaces the earlier one.
+
+    >>> from sdf_timing import utils
+    >>> arc_key(utils.prepare_entry(
+    ...     name='iopath_CLK_Q', from_pin='CLK', from_pin_edge='negedge'))
+    'iopath_CLK_Q[negedge CLK]'
+    >>> arc_key(utils.prepare_entry(name='iopath_A_Z'))
+    'iopath_A_Z'
+    """
+    qualifiers = arc_qualifiers(entry)
+    if not qualifiers:
+        return entry['name']
+    return '{}[{}]'.format(entry['name'], qualifiers)
+
+
+def _qualifiers(entry):
+    return (entry['from_pin_edge'], entry['to_pin_edge'],
+            entry['cond_equation'] if entry['is_cond'] else None)
+
+
+def same_arc(entry, other):
+    """Check if two entries with the same name are the same arc"""
+    return _qualifiers(entry) == _qualifiers(other)
+
+
+class ArcMap(dict):
+    """Dict of the entries of a cell instance, as in
+    ``parse(...)['cells'][celltype][instance]``
+
+    Entries are added with add(). An entry replaces the one stored under
+    its name if both are the same arc, otherwise it is stored under its
+    arc_key(). An arc without edges and condition always gets the name.
+    All the arcs with a name are found in O(1) with arcs(), the index
+    of the names with more than one arc is rebuilt from the keys, so any
+    dict of entries can be turned into an ArcMap. Item assignment keeps
+    the index as well, dict.update() and setdefault() do not.
+
+    >>> from sdf_timing import sdfparse
+    >>> entries = sdfparse.parse('''(DELAYFILE (SDFVERSION "3.0")
+    ...     (CELL (CELLTYPE "ff") (INSTANCE f) (DELAY (ABSOLUTE
+    ...         (IOPATH (posedge CLK) Q (1:2:3))
+    ...         (IOPATH (negedge CLK) Q (2:3:4))))))''')['cells']['ff']['f']
+    >>> list(entries)
+    ['iopath_CLK_Q', 'iopath_CLK_Q[negedge CLK]']
+    >>> [arc['from_pin_edge'] for arc in entries.arcs('iopath_CLK_Q')]
+    ['posedge', 'negedge']
+    >>> entries.arc('iopath_CLK_Q', from_pin_edge='negedge')['delay_paths']
+    {'nominal': {'min': 2.0, 'avg': 3.0, 'max': 4.0}}
+    """
+
+    __slots__ = ('_alternates', )
+
+    def __init__(self, entries=()):
+        dict.__init__(self, entries)
+        # name -> keys of the other arcs with that name
+        self._alternates = None
+        for key, entry in self.items():
+            if key != entry['name']:
+                self._add_alternate(entry['name'], key)
+
+    def _add_alternate(self, name, key):
+        if self._alternates is None:
+            self._alternates = dict()
+        keys = self._alternates.setdefault(name, list())
+        if key not in keys:
+            keys.append(key)
+
+    def __reduce__(self):
+        # pickle and copy rebuild the index from the keys
+        return (self.__class__, (dict(self), ))
+
+    def __setitem__(self, key, entry):
+        dict.__setitem__(self, key, entry)
+        if key != entry['name']:
+            self._add_alternate(entry['name'], key)
+
+    def add(self, entry):
+        """Add an entry and return the key it is stored under"""
+        name = entry['name']
+        current = self.get(name)
+        if current is None or current is entry or same_arc(current, entry):
+            dict.__setitem__(self, name, entry)
+            return name
+        key = arc_key(entry)
+        if key == name:
+            # the arc without qualifiers takes the name
+            current_key = arc_key(current)
+            dict.__setitem__(self, current_key, current)
+            dict.__setitem__(self, name, entry)
+            self._add_alternate(name, current_key)
+            return name
+        dict.__setitem__(self, key, entry)
+        self._add_alternate(name, key)
+        return key
+
+    def add_all(self, entries):
+        """Add all the entries of a dict, see add()"""
+        for entry in entries.values():
+            self.add(entry)
+
+    def clear(self):
+        dict.clear(self)
+        self._alternates = None
+
+    def arcs(self, name):
+        """Return all the entries called ``name``, the first one is the one
+        stored under the name"""
+        keys = [name]
+        if self._alternates is not None:
+            keys += self._alternates.get(name, ())
+        return [self[key] for key in keys if key in self]
+
+    def arc(self, name, from_pin_edge=None, to_pin_edge=None,
+            cond_equation=None):
+        """Return the entry called ``name`` with the given edges and
+        condition, None if there is none"""
+        qualifiers = (from_pin_edge, to_pin_edge, cond_equation)
+        for entry in self.arcs(name):
+            if _qualifiers(entry) == qualifiers:
+                return entry
+        return None
+
+    def find(self, entry):
+        """Return the entry stored for the same arc as ``entry``"""
+        current = self.get(entry['name'])
+        if current is not None and same_arc(current, entry):
+            return current
+        key = arc_key(entry)
+        if key == entry['name']:
+            return None
+        return self.get(key)
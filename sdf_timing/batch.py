@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Conversion of many SDF or JSON files in a pool of processes.
+
+Used by ``python -m sdf_timing --batch``. Outputs are written atomically,
+so an interrupted run never leaves an output which looks up to date.
+With the 'hash' check the SHA-256 of the input, the parser fingerprint and
+the output format are stored next to every output in a HASH_SUFFIX file.
+"""
+
+import concurrent.futures
+import glob
+import os
+import tempfile
+import time
+
+from . import cache
+from . import sdfjson
+from . import sdfparse
+
+HASH_SUFFIX = '.sdfhash'
+
+CHECKS = ('mtime', 'hash', 'none')
+
+
+class Task(object):
+    """Conversion of ``input`` to ``output``, SDF to JSON in ``format`` (see
+    sdfjson.FORMATS) or with ``emit`` JSON to SDF"""
+
+    def __init__(self, input, output, emit=False, format='pretty'):
+        self.input = input
+        self.output = output
+        self.emit = emit
+        self.format = format
+
+    def __repr__(self):
+        return "Task({!r}, {!r}, emit={!r}, format={!r})".format(
+            self.input, self.output, self.emit, self.format)
+
+
+def output_path(input, output_dir=None, emit=False):
+    """Return the output of ``input``, with the extension of the output
+    format, in ``output_dir`` or next to the input
+
+    >>> output_path('tiles/a.sdf')
+    'tiles/a.json'
+    >>> output_path('tiles/a.json', 'out', emit=True)
+    'out/a.sdf'
+    """
+    base = os.path.splitext(input)[0] + ('.sdf' if emit else '.json')
+    if output_dir is not None:
+        base = os.path.join(output_dir, os.path.basename(base))
+    return base
+
+
+def read_manifest(path):
+    """Return the (input, output) pairs listed in a manifest file
+
+    Every line holds an input path and optionally an output path, empty
+    lines and lines starting with # are skipped. Relative paths are
+    relative to the manifest. The output is None when it is not given.
+    """
+    directory = os.path.dirname(path)
+    pairs = list()
+    with open(path) as fp:
+        for line in fp:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            fields = line.split()
+            if len(fields) > 2:
+                raise Exception("Invalid manifest line in {}: {}".format(
+                    path, line))
+            paths = [os.path.join(directory, field) for field in fields]
+            pairs.append((paths[0], paths[1] if len(paths) > 1 else None))
+    return pairs
+
+
+def make_tasks(patterns=(), manifest=None, output_dir=None, emit=False,
+               format='pretty'):
+    """Return the tasks for the files matching the glob ``patterns`` and
+    listed in the ``manifest``, in that order
+
+    Raises an Exception when two inputs would be written to the same
+    output.
+    """
+    pairs = list()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches:
+            raise Exception("No files match '{}'".format(pattern))
+        pairs.extend((path, None) for path in matches)
+    if manifest is not None:
+        pairs.extend(read_manifest(manifest))
+
+    tasks = list()
+    outputs = dict()
+    for input, output in pairs:
+        if output is None:
+            output = output_path(input, output_dir, emit)
+        if output in outputs:
+            if outputs[output] == input:
+                continue
+            raise Exception("Both {} and {} would be written to {}".format(
+                outputs[output], input, output))
+        outputs[output] = input
+        tasks.append(Task(input, output, emit, format))
+    return tasks
+
+
+def _input_key(task):
+    # an output written in another format is not up to date
+    output = 'sdf' if task.emit else task.format
+    with open(task.input, 'rb') as fp:
+        return '-'.join((cache.parser_fingerprint(), output,
+                         cache.digest(fp.read())))
+
+
+def up_to_date(task, check='mtime'):
+    """Return True if the output of ``task`` does not need to be written
+    again
+
+    The 'mtime' check compares the modification times of the input and
+    output, so an output written in another format is up to date when it
+    is newer than the input. The 'hash' check compares the hash and the
+    format stored with the output to the ones of the task, 'none' always
+    converts the files again.
+    """
+    if check == 'none' or not os.path.exists(task.output):
+        return False
+    if check == 'mtime':
+        return os.path.getmtime(task.output) >= os.path.getmtime(task.input)
+    if check == 'hash':
+        try:
+            with open(task.output + HASH_SUFFIX) as fp:
+                stored = fp.read().strip()
+        except FileNotFoundError:
+            return False
+        return stored == _input_key(task)
+    raise Exception("Unknown check '{}', expected one of {}".format(
+        check, ", ".join(CHECKS)))
+
+
+def _umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def write_atomic(path, write):
+    """Call ``write`` with a file object and replace ``path`` by what it
+    wrote once it returns, ``path`` is left as it was when it raises"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as fp:
+            write(fp)
+        # mkstemp() creates the file readable by its owner only, give it
+        # the permissions of a file created with open()
+        os.chmod(tmp, 0o666 & ~_umask())
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def convert(task, check='mtime'):
+    """Convert the input of ``task`` to its output
+
+    Returns the size of the input in bytes.
+    """
+    if task.emit:
+        with open(task.input) as fp:
+            write_atomic(task.output, lambda out: sdfparse.write(
+                sdfjson.load_events(fp, sort=True), out))
+    else:
+        with open(task.input, 'rb') as fp:
+            timings = sdfparse.parse(fp.read().decode())
+        write_atomic(task.output,
+                     lambda out: sdfjson.dump(timings, out, task.format))
+    if check == 'hash':
+        key = _input_key(task)
+        write_atomic(task.output + HASH_SUFFIX, lambda fp: fp.write(key))
+    return os.path.getsize(task.input)
+
+
+def _run_task(task, check):
+    try:
+        return convert(task, check), None
+    except Exception as e:
+        return 0, "{}: {}".format(task.input, e)
+
+
+class Summary(object):
+    """Result of run()"""
+
+    def __init__(self):
+        self.converted = 0
+        self.skipped = 0
+        self.errors = list()
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def __str__(self):
+        seconds = max(self.seconds, 1e-9)
+        return ("{} converted, {} up to date, {} failed: {:.1f} MB in "
+                "{:.2f} s, {:.1f} files/s, {:.2f} MB/s".format(
+                    self.converted, self.skipped, len(self.errors),
+                    self.bytes / 1e6, self.seconds,
+                    self.converted / seconds, self.bytes / 1e6 / seconds))
+
+
+def run(tasks, jobs=None, check='mtime'):
+    """Convert the tasks which are not up to date with ``jobs`` processes
+
+    By default the number of processes is the number of CPUs. Errors do
+    not stop the other conversions, they are collected in the returned
+    Summary.
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    summary = Summary()
+    start = time.perf_counter()
+    pending = list()
+    for task in tasks:
+        if up_to_date(task, check):
+            summary.skipped += 1
+        else:
+            pending.append(task)
+
+    if jobs == 1 or len(pending) <= 1:
+        results = [_run_task(task, check) for task in pending]
+    else:
+        # a few tasks per message, most of the files are small
+        chunksize = max(1, len(pending) // (jobs * 8))
+        with concurrent.futures.ProcessPoolExecutor(jobs) as pool:
+            results = list(pool.map(_run_task, pending,
+                                    [check] * len(pending),
+                                    chunksize=chunksize))
+
+    for size, error in results:
+        if error is None:
+            summary.converted += 1
+            summary.bytes += size
+        else:
+            summary.errors.append(error)
+    summary.seconds = time.perf_counter() - start
+    return summary
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Synthetic SDF generator and parser benchmark.
+
+Run ``python -m sdf_timing.bench --help`` for the options. Every phase
+(parse, emit and the parse -> emit -> parse round trip) runs in its own
+process so that the peak RSS of each of them can be reported.
+"""
+
+import argparse
+import multiprocessing
+import random
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from . import sdfparse
+
+KINDS = ('iopath', 'cond', 'interconnect', 'timingcheck', 'timingenv')
+
+DEFAULT_MIX = {
+    'iopath': 4,
+    'cond': 1,
+    'interconnect': 2,
+    'timingcheck': 2,
+    'timingenv': 1,
+}
+
+CELLTYPES = ('LUT4', 'DFF', 'CARRY', 'IO_BUF', 'RAM_BLOCK')
+CHECKS = ('SETUP', 'HOLD', 'SETUPHOLD', 'WIDTH', 'RECOVERY', 'REMOVAL')
+EDGES = ('posedge', 'negedge')
+
+
+class _Generator(object):
+
+    def __init__(self, seed, escaped):
+        self.random = random.Random(seed)
+        self.escaped = escaped
+
+    def value(self):
+        low = self.random.randint(1, 500) / 10
+        return "({:.1f}:{:.1f}:{:.1f})".format(low, low * 1.5, low * 2)
+
+    def name(self, base, i):
+        if self.random.random() < self.escaped:
+            return "{}\\[{}\\]".format(base, i)
+        return "{}{}".format(base, i)
+
+    def port(self, base, i):
+        name = self.name(base, i)
+        if self.random.random() < 0.25:
+            return "({} {})".format(self.random.choice(EDGES), name)
+        return name
+
+    def arc(self, kind, i):
+        if kind == 'iopath':
+            return "(IOPATH {} {} {} {})".format(
+                self.port('A', i), self.name('Z', i), self.value(),
+                self.value())
+        if kind == 'cond':
+            return "(COND A{0}==1'b1&&B{0} (IOPATH {1} {2} {3}))".format(
+                i, self.name('I', i), self.name('O', i), self.value())
+        if kind == 'interconnect':
+            return "(INTERCONNECT u{0}/{1} u{2}/{3} {4})".format(
+                self.random.randint(0, 999), self.name('out', i),
+                self.random.randint(0, 999), self.name('in', i),
+                self.value())
+        if kind == 'timingenv':
+            return "(PATHCONSTRAINT {} {} {} {})".format(
+                self.name('P', i), self.name('Q', i), self.value(),
+                self.value())
+        check = self.random.choice(CHECKS)
+        clock = "({} {})".format(self.random.choice(EDGES),
+                                 self.name('CLK', i))
+        if check == 'WIDTH':
+            return "(WIDTH {} {})".format(clock, self.value())
+        if check == 'SETUPHOLD':
+            return "(SETUPHOLD {} {} {} {})".format(
+                self.name('D', i), clock, self.value(), self.value())
+        return "({} {} {} {})".format(check, self.name('D', i), clock,
+                                      self.value())
+
+
+def generate(cells=1000, arcs_per_cell=8, mix=None, escaped=0.1, seed=0):
+    """Generate a synthetic SDF file
+
+    Every one of the ``cells`` cells gets ``arcs_per_cell`` timing arcs
+    whose kinds (see KINDS) are drawn with the relative weights of ``mix``.
+    A fraction ``escaped`` of the names are escaped identifiers. The output
+    only depends on the arguments.
+
+    >>> sdf = generate(cells=2, arcs_per_cell=3, seed=1)
+    >>> sdf == generate(cells=2, arcs_per_cell=3, seed=1)
+    True
+    >>> count_arcs(sdfparse.parse(sdf))
+    6
+    """
+
+    if mix is None:
+        mix = DEFAULT_MIX
+    kinds = [kind for kind in KINDS if mix.get(kind)]
+    weights = [mix[kind] for kind in kinds]
+    generator = _Generator(seed, escaped)
+
+    out = ['(DELAYFILE\n  (SDFVERSION "3.0")\n  (TIMESCALE 1ps)\n']
+    for cell in range(cells):
+        arcs = dict((kind, list()) for kind in KINDS)
+        for i in range(arcs_per_cell):
+            kind = generator.random.choices(kinds, weights)[0]
+            arcs[kind].append(generator.arc(kind, i))
+
+        out.append('  (CELL (CELLTYPE "{}") (INSTANCE {})\n'.format(
+            generator.random.choice(CELLTYPES),
+            generator.name('top/u', cell)))
+        delays = arcs['iopath'] + arcs['cond'] + arcs['interconnect']
+        for keyword, entries in (('DELAY (ABSOLUTE', delays),
+                                 ('TIMINGCHECK', arcs['timingcheck']),
+                                 ('TIMINGENV', arcs['timingenv'])):
+            if not entries:
+                continue
+            out.append('    ({}\n      {}'.format(
+                keyword, '\n      '.join(entries)))
+            out.append('))\n' if keyword.startswith('DELAY') else ')\n')
+        out.append('  )\n')
+    out.append(')\n')
+    return ''.join(out)
+
+
+def count_arcs(timings):
+    """Return the number of timing entries in parsed timings"""
+    return sum(len(entries)
+               for instances in timings.get('cells', dict()).values()
+               for entries in instances.values())
+
+
+def _peak_rss():
+    """Return the peak RSS of the process in bytes or None"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes on Linux and the BSDs
+    if sys.platform == 'darwin':
+        return rss
+    return rss * 1024
+
+
+def _roundtrip(data, lexer):
+    return sdfparse.parse(sdfparse.emit(sdfparse.parse(data, lexer)), lexer)
+
+
+def run_phase(phase, data, lexer='ply', repeat=3):
+    """Run a phase ``repeat`` times, return the best time and peak RSS"""
+    if phase == 'emit':
+        timings = sdfparse.parse(data, lexer)
+        function = lambda: sdfparse.emit(timings)  # noqa: E731
+    elif phase == 'parse':
+        function = lambda: sdfparse.parse(data, lexer)  # noqa: E731
+    elif phase == 'roundtrip':
+        function = lambda: _roundtrip(data, lexer)  # noqa: E731
+    else:
+        raise Exception("Unknown phase '{}'".format(phase))
+
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, _peak_rss()
+
+
+def run(data, phases=('parse', 'emit', 'roundtrip'), lexer='ply', repeat=3,
+        isolate=True):
+    """Benchmark the phases on the SDF ``data``
+
+    Returns a list of dicts with the phase, seconds, MB/s, arcs/s and
+    peak RSS (bytes, None where it is not available). With ``isolate``
+    every phase runs in a new process, otherwise the peak RSS is the one
+    of the current process.
+    """
+
+    timings = sdfparse.parse(data, lexer)
+    arcs = count_arcs(timings)
+    sizes = {
+        'parse': len(data.encode()),
+        'emit': len(sdfparse.emit(timings).encode()),
+    }
+    sizes['roundtrip'] = sizes['parse']
+    del timings
+
+    results = list()
+    for phase in phases:
+        if isolate:
+            context = multiprocessing.get_context('spawn')
+            with context.Pool(1) as pool:
+                seconds, rss = pool.apply(run_phase,
+                                          (phase, data, lexer, repeat))
+        else:
+            seconds, rss = run_phase(phase, data, lexer, repeat)
+        results.append({
+            'phase': phase,
+            'seconds': seconds,
+            'MB/s': sizes[phase] / seconds / 1e6,
+            'arcs/s': arcs / seconds,
+            'peak_rss': rss,
+        })
+    return results
+
+
+def parse_mix(text):
+    """Parse a mix given as kind=weight pairs
+
+    >>> parse_mix('iopath=3,cond=1') == {'iopath': 3, 'cond': 1}
+    True
+    """
+    mix = dict()
+    for item in text.split(','):
+        kind, _, weight = item.partition('=')
+        if kind not in KINDS:
+            raise argparse.ArgumentTypeError(
+                "unknown arc kind '{}', expected one of {}".format(
+                    kind, ", ".join(KINDS)))
+        mix[kind] = float(weight)
+    return mix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m sdf_timing.bench',
+        description='Benchmark the SDF parser on a synthetic file.')
+    parser.add_argument('--cells', type=int, default=2000,
+                        help='number of cells')
+    parser.add_argument('--arcs', type=int, default=8,
+                        help='number of timing arcs per cell')
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help='relative weights of the arc kinds, for '
+                        'example iopath=4,cond=1,interconnect=2,'
+                        'timingcheck=2,timingenv=1')
+    parser.add_argument('--escaped', type=float, default=0.1,
+                        help='fraction of escaped names')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--lexer', choices=['ply', 'fast'], default='ply')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--phases', default='parse,emit,roundtrip',
+                        help='comma separated phases to run')
+    parser.add_argument('--output', type=str,
+                        help='only write the generated SDF to this file')
+    args = parser.parse_args(argv)
+
+    data = generate(args.cells, args.arcs, args.mix, args.escaped, args.seed)
+    if args.output:
+        with open(args.output, 'w') as fp:
+            fp.write(data)
+        return
+
+    print("{} cells, {} arcs per cell, {:.2f} MB".format(
+        args.cells, args.arcs, len(data) / 1e6))
+    print("{:<10} {:>10} {:>10} {:>12} {:>14}".format(
+        'phase', 'time [s]', 'MB/s', 'arcs/s', 'peak RSS [MB]'))
+    for result in run(data, args.phases.split(','), args.lexer, args.repeat):
+        rss = result['peak_rss']
+        print("{:<10} {:>10.3f} {:>10.2f} {:>12.0f} {:>14}".format(
+            result['phase'], result['seconds'], result['MB/s'],
+            result['arcs/s'],
+            '-' if rss is None else '{:.1f}'.format(rss / 1e6)))
+
+
+if __name__ == '__main__':
+    main()
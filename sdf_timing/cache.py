@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""On-disk cache of parsed SDF files.
+
+Entries are pickled timings dicts stored in a cache directory under a name
+made of a fingerprint of the parser sources and the SHA-256 of the SDF
+file. A change of the parser gives a new fingerprint, so entries written by
+another version are never loaded, they are removed when the cache is
+trimmed. The total size of the entries is kept below a limit by removing
+the least recently used ones, loading an entry updates its mtime.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+from . import arcmap
+from . import sdflex
+from . import sdfyacc
+from . import utils
+
+# default size limit of a cache directory
+MAX_SIZE = 1 << 30
+
+SUFFIX = '.sdfcache'
+
+_fingerprint = None
+
+
+def parser_fingerprint():
+    """Return a hash of the sources the parsed timings depend on"""
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256()
+        for module in (arcmap, sdflex, sdfyacc, utils):
+            with open(module.__file__, 'rb') as fp:
+                digest.update(fp.read())
+        _fingerprint = digest.hexdigest()[:16]
+    return _fingerprint
+
+
+def digest(data):
+    """Return the key of the SDF file contents ``data`` (bytes)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def entry_path(cache_dir, key):
+    return os.path.join(cache_dir, parser_fingerprint() + '-' + key + SUFFIX)
+
+
+def load(cache_dir, key):
+    """Return the cached timings of ``key`` or None"""
+    path = entry_path(cache_dir, key)
+    try:
+        with open(path, 'rb') as fp:
+            timings = pickle.load(fp)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # a broken entry, it is written again
+        _remove(path)
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return timings
+
+
+def store(cache_dir, key, timings, max_size=MAX_SIZE):
+    """Add timings to the cache and trim it to ``max_size`` bytes"""
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            pickle.dump(timings, fp, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, entry_path(cache_dir, key))
+    except BaseException:
+        _remove(tmp)
+        raise
+    trim(cache_dir, max_size)
+
+
+def trim(cache_dir, max_size=MAX_SIZE):
+    """Remove stale entries and the least recently used ones over max_size
+    """
+    prefix = parser_fingerprint() + '-'
+    entries = list()
+    for name in os.listdir(cache_dir):
+        if not name.endswith(SUFFIX):
+            continue
+        path = os.path.join(cache_dir, name)
+        if not name.startswith(prefix):
+            # written by another version of the parser
+            _remove(path)
+            continue
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    size = sum(entry[1] for entry in entries)
+    for mtime, entry_size, path in sorted(entries):
+        if size <= max_size:
+            break
+        _remove(path)
+        size -= entry_size
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Read-only timing database with random access by cell and instance.
+
+The file is written once from parsed timings and opened with mmap, a
+lookup only reads the pages of the records it needs. All integers are
+little endian, the file is made of:
+
+- the file header (HEADER), with the sizes and offsets of the sections
+- the string table: NSTRINGS + 1 u64 offsets followed by the UTF-8 data
+- the instance index: an open addressing hash table of NSLOTS slots
+  (SLOT), the 64-bit blake2b hash of the celltype and instance and the
+  cell number + 1 (0 for an empty slot)
+- the cell records (CELL): celltype, instance, first entry, entry count
+- the entry records (ENTRY): the strings of the entry, the flags of
+  table.FLAGS and the first path and path count
+- the path records (PATH): the path type and the min/avg/max values,
+  NaN for a missing value
+- the SDF header as JSON
+
+Strings are stored as numbers in the string table, NONE for None.
+"""
+
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+
+from . import table as timing_table
+from . import utils
+from .arcmap import ArcMap
+
+MAGIC = b'SDFTIMDB'
+VERSION = 1
+
+HEADER = struct.Struct('<8s6I8Q')
+SLOT = struct.Struct('<QI4x')
+CELL = struct.Struct('<4I')
+ENTRY = struct.Struct('<11I4x')
+PATH = struct.Struct('<I4x3d')
+OFFSET = struct.Struct('<Q')
+
+NONE = 0xffffffff
+
+
+def _hash(celltype, instance):
+    key = celltype.encode() + b'\0'
+    key += b'\0' if instance is None else instance.encode()
+    return struct.unpack('<Q', hashlib.blake2b(key, digest_size=8).digest())[0]
+
+
+def _sid(sid):
+    return NONE if sid < 0 else sid
+
+
+def _pad(fp):
+    fp.write(b'\0' * (-fp.tell() % 8))
+    return fp.tell()
+
+
+def write_db(timings, path):
+    """Write timings to a database file
+
+    ``timings`` is either the dict returned by sdfparse.parse() or a
+    table.TimingTable.
+    """
+
+    if isinstance(timings, dict):
+        timings = timing_table.TimingTable.from_timings(timings)
+    table = timings
+
+    # entries of each cell, the same key may have been added more than once
+    cell_rows = [dict() for i in range(len(table.cell_celltype))]
+    for row, cell in enumerate(table.entry_cell):
+        cell_rows[cell][table.entry_key[row]] = row
+
+    # the type names go into a copy of the string pool, the table is not
+    # changed
+    pool = list(table.strings)
+
+    def pool_id(string):
+        sid = table.string_id(string)
+        if sid is None:
+            sid = len(pool)
+            pool.append(string)
+        return sid
+
+    entry_types = [pool_id(t) for t in table.entry_types]
+    path_types = [pool_id(t) for t in table.path_types]
+    strings = [s.encode() for s in pool]
+
+    ncells = len(cell_rows)
+    nslots = 1
+    while nslots < 2 * ncells:
+        nslots *= 2
+    slots = [(0, 0)] * nslots
+    for cell in range(ncells):
+        h = _hash(table.strings[table.cell_celltype[cell]],
+                  table.string(table.cell_instance[cell]))
+        slot = h & (nslots - 1)
+        while slots[slot][1]:
+            slot = (slot + 1) & (nslots - 1)
+        slots[slot] = (h, cell + 1)
+
+    nentries = sum(len(rows) for rows in cell_rows)
+    npaths = sum(table.entry_path[row + 1] - table.entry_path[row]
+                 for rows in cell_rows for row in rows.values())
+
+    with open(path, 'wb') as fp:
+        fp.write(b'\0' * HEADER.size)
+
+        offsets = _pad(fp)
+        position = 0
+        for s in strings:
+            fp.write(OFFSET.pack(position))
+            position += len(s)
+        fp.write(OFFSET.pack(position))
+        data = fp.tell()
+        for s in strings:
+            fp.write(s)
+
+        slots_offset = _pad(fp)
+        for h, cell in slots:
+            fp.write(SLOT.pack(h, cell))
+
+        cells_offset = fp.tell()
+        entry = 0
+        for cell, rows in enumerate(cell_rows):
+            fp.write(CELL.pack(table.cell_celltype[cell],
+                               _sid(table.cell_instance[cell]),
+                               entry, len(rows)))
+            entry += len(rows)
+
+        entries_offset = fp.tell()
+        first_path = 0
+        for rows in cell_rows:
+            for row in rows.values():
+                start, end = table.entry_path[row], table.entry_path[row + 1]
+                fp.write(ENTRY.pack(
+                    table.entry_key[row],
+                    _sid(table.entry_name[row]),
+                    entry_types[table.entry_type[row]],
+                    _sid(table.entry_from_pin[row]),
+                    _sid(table.entry_to_pin[row]),
+                    _sid(table.entry_from_pin_edge[row]),
+                    _sid(table.entry_to_pin_edge[row]),
+                    _sid(table.entry_cond_equation[row]),
+                    table.entry_flags[row],
+                    first_path,
+                    end - start))
+                first_path += end - start
+
+        paths_offset = fp.tell()
+        for rows in cell_rows:
+            for row in rows.values():
+                for i in range(table.entry_path[row],
+                               table.entry_path[row + 1]):
+                    fp.write(PATH.pack(path_types[table.path_type[i]],
+                                       table.min[i], table.avg[i],
+                                       table.max[i]))
+
+        header_offset = fp.tell()
+        header = json.dumps(table.header).encode()
+        fp.write(header)
+
+        fp.seek(0)
+        fp.write(HEADER.pack(MAGIC, VERSION, len(strings), ncells, nentries,
+                             npaths, nslots, offsets, data, slots_offset,
+                             cells_offset, entries_offset, paths_offset,
+                             header_offset, len(header)))
+
+
+class TimingDB(object):
+    """A database file written by write_db(), opened with mmap
+
+    Only the file header is read when opening, ``get()`` reads the
+    records of one cell.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as fp:
+            if os.fstat(fp.fileno()).st_size < HEADER.size:
+                raise Exception("Not an SDF timing database: {}".format(path))
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self._nstrings, self._ncells, self._nentries,
+         self._npaths, self._nslots, self._offsets, self._data, self._slots,
+         self._cells, self._entries, self._paths, self._header,
+         self._header_size) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self.close()
+            raise Exception("Not an SDF timing database: {}".format(path))
+        if version != VERSION:
+            self.close()
+            raise Exception("Unsupported SDF timing database version {}"
+                            .format(version))
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._ncells
+
+    @property
+    def header(self):
+        data = self._mmap[self._header:self._header + self._header_size]
+        return json.loads(data.decode())
+
+    def string(self, sid):
+        if sid == NONE:
+            return None
+        start, = OFFSET.unpack_from(self._mmap, self._offsets + 8 * sid)
+        end, = OFFSET.unpack_from(self._mmap, self._offsets + 8 * sid + 8)
+        return self._mmap[self._data + start:self._data + end].decode()
+
+    def _find(self, celltype, instance):
+        h = _hash(celltype, instance)
+        mask = self._nslots - 1
+        slot = h & mask
+        while True:
+            slot_hash, cell = SLOT.unpack_from(self._mmap,
+                                               self._slots + SLOT.size * slot)
+            if not cell:
+                return None
+            if slot_hash == h:
+                record = CELL.unpack_from(self._mmap,
+                                          self._cells + CELL.size * (cell - 1))
+                if self.string(record[0]) == celltype \
+                        and self.string(record[1]) == instance:
+                    return record
+            slot = (slot + 1) & mask
+
+    def __contains__(self, key):
+        return self._find(*key) is not None
+
+    def __iter__(self):
+        """Iterate over the (celltype, instance) of all the cells"""
+        for cell in range(self._ncells):
+            record = CELL.unpack_from(self._mmap,
+                                      self._cells + CELL.size * cell)
+            yield self.string(record[0]), self.string(record[1])
+
+    def get(self, celltype, instance):
+        """Return the entries of a cell as an ArcMap, as in
+        timings['cells']
+
+        Raises KeyError if there is no such cell.
+        """
+        record = self._find(celltype, instance)
+        if record is None:
+            raise KeyError((celltype, instance))
+        entries = dict()
+        for i in range(record[2], record[2] + record[3]):
+            (key, name, entry_type, from_pin, to_pin, from_pin_edge,
+             to_pin_edge, cond_equation, flags, first_path, npaths) = \
+                ENTRY.unpack_from(self._mmap, self._entries + ENTRY.size * i)
+            entry = utils.prepare_entry(
+                name=self.string(name),
+                type=self.string(entry_type),
+                from_pin=self.string(from_pin),
+                to_pin=self.string(to_pin),
+                from_pin_edge=self.string(from_pin_edge),
+                to_pin_edge=self.string(to_pin_edge),
+                delay_paths=self._read_paths(flags, first_path, npaths),
+                cond_equation=self.string(cond_equation))
+            for bit, flag in enumerate(timing_table.FLAGS):
+                entry[flag] = bool(flags & (1 << bit))
+            entries[self.string(key)] = entry
+        return ArcMap(entries)
+
+    def _read_paths(self, flags, first_path, npaths):
+        if flags & timing_table.NO_PATHS:
+            return None
+        paths = dict()
+        for i in range(first_path, first_path + npaths):
+            path_type, *values = PATH.unpack_from(
+                self._mmap, self._paths + PATH.size * i)
+            paths[self.string(path_type)] = {
+                corner: None if math.isnan(value) else value
+                for corner, value in zip(('min', 'avg', 'max'), values)
+            }
+        return paths
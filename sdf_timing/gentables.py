@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Generate the ply lexer and parser tables shipped in the package.
+
+Run ``python -m sdf_timing.gentables`` after changing the tokens in sdflex
+or the grammar in sdfyacc. ``--check`` only verifies that the shipped
+tables match the current lexer and grammar.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import os
+import sys
+import tempfile
+
+import ply.yacc as yacc
+
+from . import sdflex
+from . import sdfyacc
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# attributes of the tables which depend on the lexer rules and the grammar
+LEXTAB_ATTRIBUTES = ('_tabversion', '_lextokens', '_lexreflags',
+                     '_lexliterals', '_lexstateinfo', '_lexstatere',
+                     '_lexstateignore', '_lexstateerrorf', '_lexstateeoff')
+PARSETAB_ATTRIBUTES = ('_tabversion', '_lr_signature')
+
+
+@contextlib.contextmanager
+def _not_importable(name):
+    """Make ply fail to import existing tables, so that it writes new ones
+
+    ply looks the tables up in the package of the lexer or grammar module.
+    """
+    name = __package__ + '.' + name
+    saved = sys.modules.get(name)
+    sys.modules[name] = None
+    try:
+        yield
+    finally:
+        sys.modules.pop(name, None)
+        if saved is not None:
+            sys.modules[name] = saved
+
+
+def write_tables(outputdir=PACKAGE_DIR):
+    """Write the lexer and parser table modules to ``outputdir``"""
+    with _not_importable(sdflex.LEXTAB):
+        sdflex.build_lexer(optimize=True, lextab=sdflex.LEXTAB,
+                           outputdir=outputdir)
+    for start, tabmodule in sdfyacc.TABMODULES.items():
+        with _not_importable(tabmodule):
+            yacc.yacc(module=sdfyacc, debug=False, write_tables=True,
+                      start=start, tabmodule=tabmodule, outputdir=outputdir,
+                      errorlog=yacc.NullLogger())
+
+
+def _load(directory, name):
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(directory, name + '.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def check_tables():
+    """Return the names of the shipped table modules which are outdated"""
+    outdated = list()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_tables(tmpdir)
+        tables = [(sdflex.LEXTAB, LEXTAB_ATTRIBUTES)]
+        tables += [(tabmodule, PARSETAB_ATTRIBUTES)
+                   for tabmodule in sdfyacc.TABMODULES.values()]
+        for name, attributes in tables:
+            expected = _load(tmpdir, name)
+            try:
+                shipped = _load(PACKAGE_DIR, name)
+            except FileNotFoundError:
+                outdated.append(name)
+                continue
+            for attribute in attributes:
+                if getattr(expected, attribute) != getattr(shipped, attribute,
+                                                           None):
+                    outdated.append(name)
+                    break
+    return outdated
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m sdf_timing.gentables',
+        description='Generate the ply tables of the SDF lexer and parser.')
+    parser.add_argument('--check', action='store_true',
+                        help='only check that the shipped tables are up to '
+                        'date')
+    args = parser.parse_args(argv)
+
+    if args.check:
+        outdated = check_tables()
+        for name in outdated:
+            print("{} is out of date".format(name))
+        return 1 if outdated else 0
+    write_tables()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
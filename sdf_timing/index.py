@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Queries over parsed timings by pin, entry type and celltype."""
+
+# entry fields which can be queried, celltype is the one of the cell
+FIELDS = ('celltype', 'to_pin', 'from_pin', 'type', 'is_cond')
+
+
+class TimingIndex(object):
+    """Hash indexes over the entries of a timings dict
+
+    The timings are indexed once, a query only looks at the entries of the
+    smallest index bucket among the given fields, so it takes about
+    O(result) time instead of a scan of all the entries.
+
+    >>> from sdf_timing import sdfparse
+    >>> index = TimingIndex(sdfparse.parse('''(DELAYFILE (SDFVERSION "3.0")
+    ...     (CELL (CELLTYPE "ff") (INSTANCE f)
+    ...         (DELAY (ABSOLUTE (IOPATH CLK Q (1:2:3))))
+    ...         (TIMINGCHECK (SETUP D (posedge CLK) (1:1:1))))
+    ...     (CELL (CELLTYPE "buf") (INSTANCE b)
+    ...         (DELAY (ABSOLUTE (IOPATH A Q (1:2:3))))))'''))
+    >>> [(c, i, e['name']) for c, i, e in index.query(to_pin='Q')]
+    [('ff', 'f', 'iopath_CLK_Q'), ('buf', 'b', 'iopath_A_Q')]
+    >>> [e['name'] for c, i, e in index.query(type='setup', from_pin='CLK')]
+    ['setup_CLK_D']
+    >>> index.query(celltype='buf', type='setup')
+    []
+    """
+
+    def __init__(self, timings):
+        # (celltype, instance, entry) of all entries
+        self.entries = list()
+        self.indexes = {field: dict() for field in FIELDS}
+        for celltype, instances in timings.get('cells', dict()).items():
+            for instance, entries in instances.items():
+                for entry in entries.values():
+                    self.add(celltype, instance, entry)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, celltype, instance, entry):
+        row = len(self.entries)
+        self.entries.append((celltype, instance, entry))
+        for field in FIELDS:
+            value = celltype if field == 'celltype' else entry[field]
+            self.indexes[field].setdefault(value, list()).append(row)
+
+    def rows(self, **query):
+        """Return the numbers of the entries matching all the fields given
+        """
+        for field in query:
+            if field not in self.indexes:
+                raise Exception("Unknown field '{}', expected one of {}"
+                                .format(field, ", ".join(FIELDS)))
+        if not query:
+            return list(range(len(self.entries)))
+
+        fields = sorted(query, key=lambda field: len(
+            self.indexes[field].get(query[field], ())))
+        rows = self.indexes[fields[0]].get(query[fields[0]], [])
+        for field in fields[1:]:
+            value = query[field]
+            rows = [row for row in rows if self._value(row, field) == value]
+        return list(rows)
+
+    def query(self, **query):
+        """Return the (celltype, instance, entry) of the matching entries
+
+        The keyword arguments are fields of FIELDS, entries are returned in
+        the order of the timings.
+        """
+        return [self.entries[row] for row in self.rows(**query)]
+
+    def _value(self, row, field):
+        celltype, instance, entry = self.entries[row]
+        return celltype if field == 'celltype' else entry[field]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Deferred parsing of the cells of an SDF file."""
+
+import collections
+import collections.abc
+import re
+
+from . import sdflex
+from .arcmap import ArcMap
+from . import sdfparse
+from . import sdfsplit
+
+# (CELL (CELLTYPE "...") (INSTANCE ...) at the start of a block. Only
+# instance names which the lexer turns into a single STRING token are
+# matched, the keys of other cells are taken from parsing them.
+_cell_key_re = re.compile(
+    rb'\([ \t\n]*CELL[ \t\n]*\([ \t\n]*CELLTYPE[ \t\n]*'
+    rb'"([a-zA-Z0-9_!#$%&\'()*+,\-./:;<=>?@\[\\\]^`{|}~ \t\n]+)"'
+    rb'[ \t\n]*\)[ \t\n]*\([ \t\n]*INSTANCE[ \t\n]*'
+    rb'(?:([a-zA-Z_\[\]\\][a-zA-Z0-9_/.\[\]\\]*)|(\*))?[ \t\n]*\)')
+_reserved = set(word.encode() for word in sdflex.reserved)
+
+
+class LazySDF(collections.abc.Mapping):
+    """SDF file whose cells are parsed when they are accessed
+
+    Opening the file only splits it into blocks with sdfsplit and records
+    the position of every (CELL ...) block by (celltype, instance). Looking
+    up a cell parses its blocks and returns the same entries dict as
+    ``parse(...)['cells'][celltype][instance]``. The last ``cache_size``
+    parsed cells are kept.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'lazy.sdf')
+    >>> with open(path, 'w') as fp:
+    ...     _ = fp.write('''(DELAYFILE (SDFVERSION "3.0")
+    ...     (CELL (CELLTYPE "buf") (INSTANCE b1)
+    ...         (DELAY (ABSOLUTE (IOPATH A Z (1:2:3)))))
+    ...     (CELL (CELLTYPE "buf") (INSTANCE b2)
+    ...         (DELAY (ABSOLUTE (IOPATH A Z (4:5:6))))))''')
+    >>> sdf = LazySDF(path)
+    >>> sdf.header, list(sdf)
+    ({'sdfversion': '3.0'}, [('buf', 'b1'), ('buf', 'b2')])
+    >>> sdf['buf', 'b2']['iopath_A_Z']['delay_paths']['nominal']['max']
+    6.0
+    """
+
+    def __init__(self, path, cache_size=128, lexer='ply'):
+        self.path = path
+        self.cache_size = cache_size
+        self.parser = sdfparse.SDFParser(lexer)
+        # (celltype, instance) -> [(offset, size, lineno)] of its blocks
+        self.blocks = dict()
+        self.cache = collections.OrderedDict()
+
+        header_blocks = list()
+        with open(path, 'rb') as fp:
+            for offset, lineno, block in sdfsplit.iter_blocks(fp):
+                if not self.blocks and not sdfsplit.is_cell(block):
+                    header_blocks.append((lineno, block.decode()))
+                    continue
+                key = self._cell_key(block, lineno)
+                self.blocks.setdefault(key, list()).append(
+                    (offset, len(block), lineno))
+        self.header = self.parser.parse_header(header_blocks)
+
+    def _cell_key(self, block, lineno):
+        match = _cell_key_re.match(block)
+        if match is None or match.group(2) in _reserved:
+            celltype, instance, _ = self.parser.parse_cell(block.decode(),
+                                                           lineno)
+            return celltype, instance
+        celltype, instance, asterisk = match.groups()
+        if asterisk:
+            instance = asterisk
+        return (celltype.decode(),
+                instance.decode() if instance is not None else None)
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    def __contains__(self, key):
+        return key in self.blocks
+
+    def __getitem__(self, key):
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        entries = ArcMap()
+        with open(self.path, 'rb') as fp:
+            for offset, size, lineno in self.blocks[key]:
+                fp.seek(offset)
+                block = fp.read(size).decode()
+                entries.add_all(self.parser.parse_cell(block, lineno)[2])
+
+        self.cache[key] = entries
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return entries
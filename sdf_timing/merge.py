@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Merging of SDF files with ABSOLUTE and INCREMENT semantics.
+
+The files are applied in order, the same way a simulator back-annotates
+several SDF files: an INCREMENT entry adds its values to the arc of the
+same cell instance, any other entry sets the values of the arc. Arcs are
+looked up by (celltype, instance) and arc key in dicts and the files
+after the first one are read with iterparse(), so merging takes time
+linear in the total number of arcs.
+
+Run ``python -m sdf_timing.merge --help`` for the command line tool.
+"""
+
+import argparse
+import sys
+
+from . import sdfparse
+from . import utils
+from .arcmap import ArcMap
+from .arcmap import arc_key
+
+# what to do when an arc gets values from two non-incremental entries
+POLICIES = ('last', 'first', 'min', 'max', 'error')
+
+
+def _copy_entry(entry, scale=1, target=1):
+    """Return a copy of ``entry`` with its values converted from the
+    timescale ``scale`` to ``target``, both in fs
+
+    >>> entry = {'delay_paths': {'nominal': {'min': 3.0, 'max': None}}}
+    >>> _copy_entry(entry, 100000, 1000000)['delay_paths']
+    {'nominal': {'min': 0.3, 'max': None}}
+    """
+    entry = dict(entry)
+    paths = dict()
+    for path, triple in entry['delay_paths'].items():
+        if scale == target:
+            paths[path] = dict(triple)
+        else:
+            paths[path] = {corner: None if value is None
+                           else value * scale / target
+                           for corner, value in triple.items()}
+    entry['delay_paths'] = paths
+    return entry
+
+
+def _add_paths(paths, delta):
+    """Add the values of the ``delta`` paths to ``paths`` in place
+
+    A single triple applies to every transition, so a 'nominal' delta is
+    added to the 'fast' and 'slow' paths and the other way around.
+
+    >>> paths = {'nominal': {'min': 1.0, 'avg': None, 'max': 3.0}}
+    >>> _add_paths(paths, {'fast': {'min': 1.0, 'avg': 1.0, 'max': None},
+    ...                    'slow': {'min': 2.0, 'avg': 2.0, 'max': 2.0}})
+    >>> paths['fast'], paths['slow']
+    ({'min': 2.0, 'avg': None, 'max': 3.0}, {'min': 3.0, 'avg': None, \
+'max': 5.0})
+    """
+    if 'nominal' in paths and 'nominal' not in delta:
+        nominal = paths.pop('nominal')
+        for path in delta:
+            paths[path] = dict(nominal)
+    for path, triple in paths.items():
+        added = delta.get(path, delta.get('nominal'))
+        if added is None:
+            continue
+        for corner in utils.CORNERS:
+            if triple[corner] is not None and added[corner] is not None:
+                triple[corner] += added[corner]
+
+
+def _pick_paths(paths, other, pick):
+    """Set the values of ``paths`` to the ``pick`` (min or max) of them
+    and the ones of ``other``, values which are None are ignored"""
+    for path, triple in other.items():
+        if path not in paths:
+            paths[path] = dict(triple)
+            continue
+        for corner in utils.CORNERS:
+            values = [value for value in (paths[path][corner], triple[corner])
+                      if value is not None]
+            paths[path][corner] = pick(values) if values else None
+
+
+class Merger(object):
+    """Merged timings of several SDF files
+
+    ``policy`` selects what happens when an arc gets values from entries
+    which are not INCREMENT entries in two files:
+
+    - 'last': the values of the later file are used, as in back-annotation
+    - 'first': the values of the earlier file are kept
+    - 'min' or 'max': the minimum or maximum of each value is used
+    - 'error': an Exception is raised unless the values are the same
+
+    An INCREMENT entry for an arc which has no values yet is kept as an
+    INCREMENT entry, later increments are added to it. All values are
+    converted to ``timescale``, by default the one of the first file.
+
+    >>> merger = Merger()
+    >>> sdf = '''(DELAYFILE (SDFVERSION "3.0") (TIMESCALE {})
+    ...     (CELL (CELLTYPE "buf") (INSTANCE b)
+    ...         (DELAY ({} (IOPATH A Z (1:2:3))))))'''
+    >>> merger.add(sdfparse.parse(sdf.format('1ns', 'ABSOLUTE')))
+    >>> merger.add(sdfparse.parse(sdf.format('100ps', 'INCREMENT')))
+    >>> entry = merger.cells['buf']['b']['iopath_A_Z']
+    >>> entry['is_absolute'], entry['delay_paths']['nominal']
+    (True, {'min': 1.1, 'avg': 2.2, 'max': 3.3})
+    """
+
+    def __init__(self, policy='last', timescale=None):
+        if policy not in POLICIES:
+            raise Exception("Unknown policy '{}', expected one of {}".format(
+                policy, ", ".join(POLICIES)))
+        self.policy = policy
+        self.timescale = timescale
+        self.header = None
+        self.cells = dict()
+        self.sources = 0
+
+    def _scales(self, header):
+        """Return the timescales of a file and of the output in fs"""
+        timescale = header.get('timescale', utils.DEFAULT_TIMESCALE)
+        if self.header is None:
+            self.header = dict(header)
+            if self.timescale is None:
+                self.timescale = timescale
+            self.header['timescale'] = self.timescale
+        return (utils.get_scale_fs(timescale),
+                utils.get_scale_fs(self.timescale))
+
+    def add_events(self, events):
+        """Merge a stream of (celltype, instance, entries) tuples starting
+        with the (None, None, header) tuple, as yielded by iterparse()"""
+        scales = None
+        for celltype, instance, entries in events:
+            if celltype is None and instance is None:
+                scales = self._scales(entries)
+                continue
+            if scales is None:
+                raise Exception("The header must come before the cells")
+            cell = self.cells.setdefault(celltype, dict()).setdefault(
+                instance, ArcMap())
+            for entry in entries.values():
+                self._merge_entry(celltype, instance, cell,
+                                  _copy_entry(entry, *scales))
+        self.sources += 1
+
+    def add(self, timings):
+        """Merge the timings returned by parse()"""
+        self.add_events(utils.iter_cells(timings))
+
+    def add_file(self, path, lexer='ply'):
+        """Merge an SDF file, the file is read one cell at a time"""
+        with open(path) as fp:
+            self.add_events(sdfparse.iterparse(fp, lexer=lexer))
+
+    def _merge_entry(self, celltype, instance, cell, entry):
+        current = cell.find(entry)
+        if current is None:
+            cell.add(entry)
+        elif entry['is_incremental']:
+            _add_paths(current['delay_paths'], entry['delay_paths'])
+        elif current['is_incremental'] or self.policy == 'last':
+            cell.add(entry)
+        elif self.policy in ('min', 'max'):
+            _pick_paths(current['delay_paths'], entry['delay_paths'],
+                        min if self.policy == 'min' else max)
+        elif self.policy == 'error':
+            if current['delay_paths'] != entry['delay_paths']:
+                raise Exception(
+                    "Conflicting values of {} in cell {} {}: {} and {}"
+                    .format(arc_key(entry), celltype, instance,
+                            current['delay_paths'], entry['delay_paths']))
+
+    def events(self):
+        """Yield the merged timings as (celltype, instance, entries) tuples
+        starting with (None, None, header)"""
+        yield None, None, dict() if self.header is None else self.header
+        for celltype, instances in self.cells.items():
+            for instance, entries in instances.items():
+                yield celltype, instance, entries
+
+    def timings(self):
+        """Return the merged timings in the format of parse()"""
+        timings = {'header': next(self.events())[2]}
+        if self.cells:
+            timings['cells'] = self.cells
+        return timings
+
+    def write(self, fileobj):
+        """Write the merged timings as SDF to ``fileobj`` one cell at a
+        time"""
+        sdfparse.write(self.events(), fileobj,
+                       self.timescale or utils.DEFAULT_TIMESCALE)
+
+
+def merge_files(paths, fileobj, policy='last', timescale=None, lexer='ply'):
+    """Merge the SDF files ``paths`` in order and write the result to
+    ``fileobj``, see Merger"""
+    merger = Merger(policy, timescale)
+    for path in paths:
+        merger.add_file(path, lexer)
+    merger.write(fileobj)
+    return merger
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m sdf_timing.merge',
+        description='Merge SDF files, applying INCREMENT entries to the '
+        'values of the files before them.')
+    parser.add_argument('sdf', nargs='+', help='SDF files, in order')
+    parser.add_argument('--output', '-o', type=str,
+                        help='merged SDF file, by default standard output')
+    parser.add_argument('--policy', choices=POLICIES, default='last',
+                        help='values of an arc set by several files '
+                        '(default: %(default)s)')
+    parser.add_argument('--timescale', type=str,
+                        help='timescale of the output, by default the one '
+                        'of the first file')
+    parser.add_argument('--lexer', choices=['ply', 'fast'], default='ply')
+    args = parser.parse_args(argv)
+
+    if args.output is None:
+        merge_files(args.sdf, sys.stdout, args.policy, args.timescale,
+                    args.lexer)
+    else:
+        with open(args.output, 'w') as fp:
+            merge_files(args.sdf, fp, args.policy, args.timescale,
+                        args.lexer)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -17,9 +17,14 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-import ply.lex as lex
+import functools
+import itertools
+import operator
+import re
+import string
+import sys
 
-input_data = ""
+import ply.lex as lex
 
 reserved = {
     'DELAYFILE': 'DELAYFILE',
@@ -160,6 +165,8 @@ def t_SLASH(t):
 def t_STRING(t):
     r'[a-zA-Z0-9_\/.\[\]\\]+'
     t.type = reserved.get(t.value, 'STRING')
+    # the same pin names come up in every instance, they share one object
+    t.value = sys.intern(t.value)
     return t
 
 
@@ -170,7 +177,7 @@ def t_newline(t):
 
 def t_error(t):
     raise Exception("Illegal character '%s' in line %d, column %d"
-                    % (t.value[0], t.lineno, find_column(input_data, t)))
+                    % (t.value[0], t.lineno, find_column(t.lexer.lexdata, t)))
 
 # Compute column.
 # input is the input text string
@@ -182,4 +189,225 @@ def find_column(input, token):
     return (token.lexpos - line_start) + 1
 
 
-lexer = lex.lex()
+# module of the pregenerated lexer tables, see gentables. ply reads the
+# master regular expression from it instead of building and validating it
+# from the rules above on every import.
+LEXTAB = '_lextab'
+
+
+def build_lexer(**kwargs):
+    """Build a ply lexer from the rules of this module
+
+    ply takes the rules from the globals of its caller, in the order of
+    their definition, the same order as get_rules().
+    """
+    return lex.lex(**kwargs)
+
+
+lexer = build_lexer(optimize=True, lextab=LEXTAB)
+
+
+class FastToken(tuple):
+    """Token produced by the FastLexer, (type, value, lineno)"""
+
+    __slots__ = ()
+
+    type = property(operator.itemgetter(0))
+    value = property(operator.itemgetter(1))
+    lineno = property(operator.itemgetter(2))
+    # ply sets the lexer on the token of a syntax error unless it has one
+    lexer = None
+
+    def __repr__(self):
+        return "LexToken(%s,%r,%d)" % self
+
+
+def _noncapturing(pattern):
+    r"""Turn all capturing groups of a regular expression into non-capturing
+
+    >>> print(_noncapturing(r'[-]?\.?[0-9]+(\.[0-9]+)?'))
+    [-]?\.?[0-9]+(?:\.[0-9]+)?
+
+    >>> print(_noncapturing(r'\"[()]+(?P<x>\(a\))'))
+    \"[()]+(?P<x>\(a\))
+    """
+    out = ""
+    escaped = False
+    in_class = False
+    for i, c in enumerate(pattern):
+        if escaped:
+            escaped = False
+        elif c == '\\':
+            escaped = True
+        elif in_class:
+            in_class = c != ']'
+        elif c == '[':
+            in_class = True
+        elif c == '(' and pattern[i + 1:i + 2] != '?':
+            c = '(?:'
+        out += c
+    return out
+
+
+def get_rules():
+    """Return the (name, regex) lexer rules in the order ply.lex tries them
+
+    Rules defined as functions come first in order of definition,
+    followed by rules defined as strings sorted by decreasing regular
+    expression length.
+    """
+
+    module = globals()
+    rules = [(name[2:], rule) for name, rule in module.items()
+             if name.startswith('t_') and name not in ('t_error', 't_ignore')]
+    funcs = [(name, rule.__doc__) for name, rule in rules if callable(rule)]
+    funcs.sort(key=lambda r: module['t_' + r[0]].__code__.co_firstlineno)
+    strs = [(name, rule) for name, rule in rules if isinstance(rule, str)]
+    strs.sort(key=lambda r: len(r[1]), reverse=True)
+    return funcs + strs
+
+
+class FastLexer(object):
+    """Drop-in replacement for the ply lexer
+
+    The whole input is split into token strings with a single findall()
+    of one compiled regular expression. The type, interned value and
+    number of newlines of every distinct token string are worked out
+    once, by its first character for the common tokens (parentheses,
+    numbers, names and keywords), and the tokens are then built
+    CHUNK_SIZE at a time with map(), zip() and accumulate(), so no Python
+    code runs per token. The regular expression is built from the rules
+    in this module in the order ply.lex tries them, which keeps the token
+    boundaries identical, and all other tokens (operators, quoted
+    strings, ...) are classified by matching them against the rules in
+    that order. The produced (type, value, lineno) stream is the same as
+    the one of the ply lexer, the tokens do not carry lexpos.
+    """
+
+    rules = get_rules()
+    # whitespace, newlines and parentheses cannot start any other token,
+    # so they can be tried first without changing the result
+    split_re = re.compile(r'[%s]*(\n[\n%s]*|\(|\)|:|%s|(?s:.))' % (
+        re.escape(t_ignore), re.escape(t_ignore),
+        '|'.join(_noncapturing(rule) for name, rule in rules)))
+    classify_re = re.compile('|'.join(
+        '(?P<%s>%s)' % rule for rule in rules))
+
+    first_char = {
+        '\n': 'newline',
+        '(': 'LPAR',
+        ')': 'RPAR',
+        ':': 'COLON',
+        '-': 'number',
+        '.': 'number',
+    }
+    first_char.update((c, 'STRING')
+                      for c in string.ascii_letters + '_[]\\')
+    first_char.update((c, 'FLOAT') for c in '23456789')
+    first_char.update((c, 'number') for c in '01')
+
+    # tokens built at a time, bounds the memory used by the token objects
+    CHUNK_SIZE = 4096
+
+    def __init__(self):
+        self.lineno = 1
+        self.lexdata = ""
+        self.start_lineno = 1
+        self.kinds = dict()
+        # token string -> (type, value, number of newlines)
+        self.infos = dict()
+        self.token = iter(()).__next__
+
+    def input(self, data):
+        self.lexdata = data
+        self.start_lineno = self.lineno
+        self.token = itertools.chain(
+            itertools.chain.from_iterable(self.tokenize(data)),
+            itertools.repeat(None)).__next__
+
+    def classify(self, value):
+        kind = self.kinds.get(value)
+        if kind is None:
+            m = self.classify_re.match(value)
+            if m is None or m.end() != len(value):
+                # let ply report the illegal character
+                ply_lexer = lexer.clone()
+                ply_lexer.lineno = self.start_lineno
+                ply_lexer.input(self.lexdata)
+                for t in ply_lexer:
+                    pass
+            kind = m.lastgroup
+            if kind == 'STRING':
+                kind = reserved.get(value, 'STRING')
+            self.kinds[value] = kind
+        return kind
+
+    def describe(self, value):
+        """Return the (type, value, number of newlines) of a token string"""
+        kind = self.first_char.get(value[0])
+        newlines = 0
+        if kind == 'STRING':
+            kind = reserved.get(value, 'STRING')
+            # the same pin names come up in every instance, they share one
+            # object
+            value = sys.intern(value)
+        elif kind == 'newline':
+            newlines = value.count('\n')
+        elif kind == 'number':
+            if value == '-' or value == '.' or "'" in value:
+                kind = self.classify(value)
+            else:
+                kind = 'FLOAT'
+        elif kind is None:
+            kind = self.classify(value)
+        return kind, value, newlines
+
+    def tokenize(self, data):
+        """Yield iterators over the tokens of ``data``, one per chunk"""
+        values = self.split_re.findall(data)
+        infos = self.infos
+        make = functools.partial(tuple.__new__, FastToken)
+        kind_of = operator.itemgetter(0)
+        value_of = operator.itemgetter(1)
+        newlines_of = operator.itemgetter(2)
+        is_token = functools.partial(operator.ne, 'newline')
+        lineno = self.lineno
+        for start in range(0, len(values), self.CHUNK_SIZE):
+            chunk = values[start:start + self.CHUNK_SIZE]
+            for value in set(chunk).difference(infos):
+                infos[value] = self.describe(value)
+            chunk = list(map(infos.__getitem__, chunk))
+            kinds = list(map(kind_of, chunk))
+            newlines = list(map(newlines_of, chunk))
+            # the line of a token is the one after the newlines before it
+            linenos = itertools.accumulate(
+                itertools.chain([lineno], newlines))
+            yield itertools.compress(
+                map(make, zip(kinds, map(value_of, chunk), linenos)),
+                map(is_token, kinds))
+            lineno += sum(newlines)
+            self.lineno = lineno
+
+    def __iter__(self):
+        # iterates without calling a Python method per token
+        return iter(self.token, None)
+
+    def __next__(self):
+        t = self.token()
+        if t is None:
+            raise StopIteration
+        return t
+
+
+lexers = {
+    'ply': lexer.clone,
+    'fast': FastLexer,
+}
+
+
+def get_lexer(name):
+    """Return a new lexer, either 'ply' or 'fast'"""
+    if name not in lexers:
+        raise Exception("Unknown lexer '%s', expected one of: %s"
+                        % (name, ", ".join(sorted(lexers))))
+    return lexers[name]()
@@ -17,31 +17,294 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import concurrent.futures
+import copy
+import itertools
+import os
+
+from . import cache
 from . import sdflex
+from . import sdfsplit
 from . import sdfyacc
 from . import sdfwrite
+from . import stats as parse_stats
+
+
+class SDFParser(object):
+    """SDF parser which keeps all of its state in the instance
+
+    Every instance has its own lexer and parser stacks, so separate
+    instances can be used from different threads at the same time.
+    ``lexer`` selects the tokenizer: 'ply' for the ply.lex based one or
+    'fast' for the bulk FastLexer, both produce the same tokens.
+    When ``stats`` is a stats.Stats object, the parses are instrumented
+    and their statistics added to it.
+    """
+
+    def __init__(self, lexer='ply', stats=None):
+        self.lexer = sdflex.get_lexer(lexer)
+        self.stats = stats
+        # the LR tables are shared, the copies only get their own stacks
+        self.parser = copy.copy(sdfyacc.get_parser())
+        self.parser.owner = self
+        self.cell_parser = copy.copy(sdfyacc.get_parser('cell_list'))
+        self.cell_parser.owner = self
+        if stats is not None:
+            for parser in (self.parser, self.cell_parser):
+                parser.productions = stats.wrap_productions(
+                    parser.productions)
+        self.reset()
+
+    def reset(self):
+        self.timings = dict()
+
+        self.header = dict()
+        self.delays_list = list()
+        self.cells = dict()
+
+        self.tmp_delay_list = list()
+        self.tmp_equation = list()
+        self.tmp_constr_list = list()
+        # length of tmp_delay_list at the start of each open COND
+        self.tmp_cond_starts = list()
+
+        self.lexer.lineno = 1
+
+    def _run(self, parser, text):
+        if self.stats is None:
+            return parser.parse(text, lexer=self.lexer)
+        with self.stats.timer('parse'):
+            return parser.parse(text, lexer=self.lexer,
+                                tokenfunc=self.stats.tokenfunc(self.lexer))
+
+    def parse(self, input):
+        """Parse a whole SDF file given as a string"""
+        self.reset()
+        self._run(self.parser, input)
+        return self.timings
+
+    def parse_header(self, blocks):
+        """Parse the header from a list of (lineno, text) blocks"""
+        self.reset()
+        text = "(DELAYFILE"
+        lineno = 1
+        for block_lineno, block in blocks:
+            text += "\n" * (block_lineno - lineno) + " " + block
+            lineno = block_lineno + block.count("\n")
+        text += ")"
+        self._run(self.parser, text)
+        return self.timings['header']
+
+    def parse_cells(self, text, lineno=1):
+        """Parse a sequence of (CELL ...) blocks
+
+        Returns the cells dict, the same as timings['cells'].
+        """
+        self.reset()
+        self.lexer.lineno = lineno
+        self._run(self.cell_parser, text)
+        return self.cells
+
+    def parse_cell(self, block, lineno=1):
+        """Parse a single (CELL ...) block
+
+        Returns a (celltype, instance, entries) tuple.
+        """
+        for celltype, instances in self.parse_cells(block, lineno).items():
+            for instance, entries in instances.items():
+                return celltype, instance, entries
 
 
 def init():
-    sdfyacc.timings = dict()
+    """Kept for compatibility, every parse starts from a fresh state"""
+
+
+def emit(input, timescale='1ps', stats=None):
+    """Return timings as SDF text
+
+    The time taken is added to the 'emit' phase of ``stats``.
+    """
+    env_stats = parse_stats.from_env() if stats is None else None
+    if env_stats is not None:
+        stats = env_stats
+    if stats is None:
+        return sdfwrite.emit_sdf(input, timescale)
+    with stats.timer('emit'):
+        output = sdfwrite.emit_sdf(input, timescale)
+    if env_stats is not None:
+        parse_stats.save_env(stats)
+    return output
+
+
+def write(input, fileobj, timescale='1ps', stats=None):
+    """Write timings to a file object, see sdfwrite.write_sdf()
+
+    The time taken is added to the 'emit' phase of ``stats``.
+    """
+    env_stats = parse_stats.from_env() if stats is None else None
+    if env_stats is not None:
+        stats = env_stats
+    if stats is None:
+        return sdfwrite.write_sdf(input, fileobj, timescale)
+    with stats.timer('emit'):
+        sdfwrite.write_sdf(input, fileobj, timescale)
+    if env_stats is not None:
+        parse_stats.save_env(stats)
+
+
+def parse(input, lexer='ply', stats=None):
+    """Parse an SDF file given as a string, see SDFParser
+
+    When ``stats`` is None and the SDF_TIMING_STATS environment variable
+    is set, the stats of the parse are appended to the file it names, see
+    the stats module.
+    """
+    env_stats = parse_stats.from_env() if stats is None else None
+    if env_stats is not None:
+        stats = env_stats
+    timings = SDFParser(lexer, stats).parse(input)
+    if env_stats is not None:
+        parse_stats.save_env(stats)
+    return timings
+
+
+def parse_file(path, cache_dir=None, lexer='ply',
+               max_cache_size=cache.MAX_SIZE, stats=None):
+    """Parse an SDF file given by its path
+
+    When ``cache_dir`` is set, the parsed timings are stored there keyed
+    by the hash of the file contents and loaded from there when the same
+    file is parsed again, see the cache module. The cache directory is
+    kept below ``max_cache_size`` bytes. ``stats`` is the same as for
+    parse(), nothing is recorded when the timings come from the cache.
+    """
+
+    with open(path, 'rb') as fp:
+        data = fp.read()
+    if cache_dir is None:
+        return parse(data.decode(), lexer, stats)
+
+    key = cache.digest(data)
+    timings = cache.load(cache_dir, key)
+    if timings is None:
+        timings = parse(data.decode(), lexer, stats)
+        cache.store(cache_dir, key, timings, max_cache_size)
+    return timings
+
+
+def iterparse(fileobj, chunk_size=sdfsplit.CHUNK_SIZE, lexer='ply'):
+    """Parse an SDF file incrementally
+
+    The file is read in chunks of ``chunk_size``. First a
+    ``(None, None, header)`` tuple is yielded and then a
+    ``(celltype, instance, entries)`` tuple for each (CELL ...) block as
+    soon as it has been read. Only the block being parsed is kept in
+    memory. A cell which is split over several (CELL ...) blocks is
+    yielded once per block. ``lexer`` is the same as for parse().
+    """
+
+    parser = SDFParser(lexer)
+    header_blocks = list()
+    header = None
+
+    for offset, lineno, block in sdfsplit.iter_blocks(fileobj, chunk_size):
+        if isinstance(block, bytes):
+            block = block.decode()
+        if header is None:
+            if not sdfsplit.is_cell(block):
+                header_blocks.append((lineno, block))
+                continue
+            header = parser.parse_header(header_blocks)
+            yield None, None, header
+        yield parser.parse_cell(block, lineno)
+
+    if header is None:
+        yield None, None, parser.parse_header(header_blocks)
+
+
+def merge_cells(cells, other):
+    """Merge the cells dict ``other`` into ``cells``
+
+    Entries of instances present in both are updated the same way the
+    parser does it when a cell is split over several (CELL ...) blocks.
+    """
+    for celltype, instances in other.items():
+        if celltype not in cells:
+            cells[celltype] = instances
+            continue
+        for instance, entries in instances.items():
+            if instance in cells[celltype]:
+                cells[celltype][instance].add_all(entries)
+            else:
+                cells[celltype][instance] = entries
+    return cells
+
+
+def _parse_span(path, offset, size, lineno, lexer):
+    with open(path, 'rb') as fp:
+        fp.seek(offset)
+        text = fp.read(size).decode()
+    return SDFParser(lexer).parse_cells(text, lineno)
+
+
+def _iter_chunks(blocks, chunk_size):
+    """Merge consecutive blocks into (offset, size, lineno) chunks"""
+    chunk = None
+    for offset, lineno, block in blocks:
+        if chunk is None:
+            chunk = [offset, len(block), lineno]
+        elif offset - chunk[0] < chunk_size:
+            chunk[1] = offset + len(block) - chunk[0]
+        else:
+            yield tuple(chunk)
+            chunk = [offset, len(block), lineno]
+    if chunk is not None:
+        yield tuple(chunk)
 
-    sdfyacc.header = dict()
-    sdfyacc.delays_list = list()
-    sdfyacc.cells = dict()
 
-    sdfyacc.tmp_delay_list = list()
-    sdfyacc.tmp_equation = list()
-    sdfyacc.tmp_constr_list = list()
+def parse_parallel(path, workers=None, chunk_size=None, lexer='ply'):
+    """Parse an SDF file using a pool of ``workers`` processes
 
-    sdflex.lexer.lineno = 1
+    The file is split at (CELL ...) boundaries with sdfsplit, the chunks
+    of about ``chunk_size`` bytes are parsed in the workers and the
+    resulting cells are merged in file order, so the result is the same
+    as the one of parse(). The chunks are handed over to the workers while
+    the file is still being split. By default the number of workers is the
+    number of CPUs and the file is split into 8 chunks per worker.
+    """
 
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = os.path.getsize(path) // (workers * 8) + 1
 
-def emit(input, timescale='1ps'):
-    return sdfwrite.emit_sdf(input, timescale)
+    timings = dict()
+    cells = dict()
+    with open(path, 'rb') as fp:
+        blocks = sdfsplit.iter_blocks(fp)
+        header_blocks = list()
+        for offset, lineno, block in blocks:
+            if sdfsplit.is_cell(block):
+                blocks = itertools.chain([(offset, lineno, block)], blocks)
+                break
+            header_blocks.append((lineno, block.decode()))
+        else:
+            blocks = ()
+        timings['header'] = SDFParser(lexer).parse_header(header_blocks)
 
+        chunks = _iter_chunks(blocks, chunk_size)
+        if workers == 1:
+            for offset, size, lineno in chunks:
+                merge_cells(cells, _parse_span(path, offset, size, lineno,
+                                               lexer))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+                futures = [pool.submit(_parse_span, path, offset, size,
+                                       lineno, lexer)
+                           for offset, size, lineno in chunks]
+                for future in futures:
+                    merge_cells(cells, future.result())
 
-def parse(input):
-    init()
-    sdflex.input_data = input
-    sdfyacc.parser.parse(sdflex.input_data)
-    return sdfyacc.timings
+    if cells:
+        timings['cells'] = cells
+    return timings
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Splitting of SDF streams into top-level blocks.
+
+The splitter only tracks parenthesis depth and quoted strings, so it is
+much cheaper than tokenizing. Every ``(...)`` block directly inside
+``(DELAYFILE ...)`` (header entries and ``(CELL ...)`` blocks) is
+returned as a separate piece of text which can then be handed over to
+the parser on its own.
+"""
+
+import re
+
+CHUNK_SIZE = 1 << 20
+
+_special_re = {
+    str: re.compile(r'(?P<open>\()|(?P<close>\))|(?P<quote>")'),
+    bytes: re.compile(rb'(?P<open>\()|(?P<close>\))|(?P<quote>")'),
+}
+
+_delayfile_re = {
+    str: re.compile(r'\s*DELAYFILE\s*$'),
+    bytes: re.compile(rb'\s*DELAYFILE\s*$'),
+}
+
+_cell_re = {
+    str: re.compile(r'\(\s*CELL[\s(]'),
+    bytes: re.compile(rb'\(\s*CELL[\s(]'),
+}
+
+# end of a (CELL ...) block which is followed by another one
+_cell_end_re = {
+    str: re.compile(r'\)\s*\(\s*CELL[\s(]'),
+    bytes: re.compile(rb'\)\s*\(\s*CELL[\s(]'),
+}
+
+# text in which no quoted string contains parentheses
+_quoted_ok_re = {
+    str: re.compile(r'(?:[^"]|"[^"()]*")*'),
+    bytes: re.compile(rb'(?:[^"]|"[^"()]*")*'),
+}
+
+
+def is_cell(block):
+    """Check if a top-level block is a (CELL ...) block
+
+    >>> is_cell('(CELL (CELLTYPE "x") (INSTANCE y))')
+    True
+
+    >>> is_cell(b'(\\n  CELL\\n(CELLTYPE "x"))')
+    True
+
+    >>> is_cell('(TIMESCALE 1ps)')
+    False
+    """
+    return _cell_re[type(block)].match(block) is not None
+
+
+def _syntax_error(text, lineno):
+    raise Exception("Syntax error at '%s' line: %d"
+                    % (text.strip()[:20], lineno))
+
+
+def iter_blocks(stream, chunk_size=CHUNK_SIZE):
+    """Yield (offset, lineno, text) of every top-level block of an SDF file
+
+    ``stream`` is a file object opened either in text or in binary mode,
+    the returned blocks have the same type as the data read from it.
+    ``offset`` is the position of the block in the stream (in characters
+    or bytes respectively) and ``lineno`` the line it starts on.
+
+    >>> import io
+    >>> sdf = '(DELAYFILE\\n (SDFVERSION "3.0")\\n (CELL (CELLTYPE "(")))\\n'
+    >>> for block in iter_blocks(io.StringIO(sdf), chunk_size=4):
+    ...     print(block)
+    (12, 2, '(SDFVERSION "3.0")')
+    (32, 3, '(CELL (CELLTYPE "("))')
+    """
+
+    buf = stream.read(chunk_size)
+    eof = not buf
+    kind = type(buf)
+    special_re = _special_re[kind]
+    cell_end_re = _cell_end_re[kind]
+    quoted_ok_re = _quoted_ok_re[kind]
+    newline, lpar, rpar = (b'\n', b'(', b')') if kind is bytes \
+        else ('\n', '(', ')')
+    # position of buf[0] in the stream
+    base = 0
+    # number of the line at buf[line_pos]
+    lineno = 1
+    line_pos = 0
+    # scanning state, positions are relative to buf
+    pos = 0
+    depth = 0
+    in_quote = False
+    file_start = None
+    block_start = None
+    gap_start = 0
+    # the current block is a (CELL ...) block, try to find its end without
+    # looking at every parenthesis
+    fast = False
+
+    def line_at(i):
+        return lineno + buf.count(newline, line_pos, i)
+
+    while True:
+        while True:
+            if fast:
+                m = cell_end_re.search(buf, pos)
+                if m is None:
+                    # the match may start at the last ')' of the buffer
+                    pos = max(pos, buf.rfind(rpar))
+                    break
+                i = m.start()
+                block = buf[block_start:i + 1]
+                fast = False
+                if block.count(lpar) != block.count(rpar) \
+                        or not quoted_ok_re.fullmatch(block):
+                    # scan the block parenthesis by parenthesis
+                    pos = block_start + 1
+                    continue
+                lineno = line_at(block_start)
+                line_pos = block_start
+                yield (base + block_start, lineno, block)
+                block_start = None
+                gap_start = pos = i + 1
+                depth = 1
+                continue
+
+            m = special_re.search(buf, pos)
+            if m is None:
+                pos = len(buf)
+                break
+            i = m.start()
+            pos = i + 1
+
+            if in_quote:
+                in_quote = m.lastgroup != 'quote'
+
+            elif m.lastgroup == 'quote':
+                in_quote = True
+
+            elif m.lastgroup == 'open':
+                depth += 1
+                if depth == 1:
+                    if buf[gap_start:i].strip():
+                        _syntax_error(buf[gap_start:i], line_at(gap_start))
+                    file_start = gap_start = i
+                elif depth == 2:
+                    if gap_start == file_start:
+                        header = buf[file_start + 1:i]
+                        if not _delayfile_re[kind].match(header):
+                            _syntax_error(header, line_at(file_start))
+                    elif buf[gap_start:i].strip():
+                        _syntax_error(buf[gap_start:i], line_at(gap_start))
+                    block_start = i
+                    fast = _cell_re[kind].match(buf, i) is not None
+
+            else:
+                depth -= 1
+                if depth == 1:
+                    lineno = line_at(block_start)
+                    line_pos = block_start
+                    yield (base + block_start, lineno,
+                           buf[block_start:i + 1])
+                    block_start = None
+                    gap_start = i + 1
+                elif depth == 0:
+                    if gap_start == file_start or buf[gap_start:i].strip():
+                        _syntax_error(buf[gap_start:i + 1], line_at(i))
+                    _check_trailing(stream, buf[i + 1:], chunk_size,
+                                    line_at(i))
+                    return
+                elif depth < 0:
+                    _syntax_error(buf[i:], line_at(i))
+
+        if eof:
+            if fast:
+                # the last cell, there is no next one to look for
+                fast = False
+                pos = block_start + 1
+                continue
+            raise Exception("Unexpected end of SDF input")
+
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        # drop everything that was already consumed
+        keep = gap_start if block_start is None else block_start
+        lineno = line_at(keep)
+        line_pos = 0
+        base += keep
+        buf = buf[keep:] + chunk
+        pos -= keep
+        gap_start -= keep
+        if file_start is not None:
+            file_start -= keep
+        if block_start is not None:
+            block_start -= keep
+
+
+def _check_trailing(stream, rest, chunk_size, lineno):
+    while True:
+        if rest.strip():
+            _syntax_error(rest, lineno)
+        rest = stream.read(chunk_size)
+        if not rest:
+            return
@@ -17,6 +17,17 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import io
+
+
+def _str(value):
+    """Format a field, None is written as an empty string
+
+    >>> _str(None), _str(1.5), _str('a')
+    ('', '1.5', 'a')
+    """
+    return "" if value is None else str(value)
+
 
 def gen_timing_entry(entry):
 
@@ -25,248 +36,270 @@ def gen_timing_entry(entry):
         # if all the values are None return empty timing
         return "()"
 
-    return "({MIN}:{AVG}:{MAX})".format(
-        MIN=entry['min'],
-        AVG=entry['avg'],
-        MAX=entry['max'])
+    return "(" + _str(entry['min']) + ":" + _str(entry['avg']) + ":" \
+        + _str(entry['max']) + ")"
 
 
-def emit_timingenv_entries(delays):
+def gen_port(pin, edge):
 
-    entries = ""
-    tenv_entries = ""
-    for delay in sorted(delays):
-        delay = delays[delay]
-        entry = ""
-        if not delay['is_timing_env']:
-            # handle only timing_env here
-            continue
+    if edge is not None:
+        return "(" + edge + " " + pin + ")"
+    return _str(pin)
 
-        input_str = ""
-        output_str = ""
-        if delay['to_pin_edge'] is not None:
-            output_str = "(" + delay['to_pin_edge'] + " "\
-                + delay['to_pin'] + ")"
-        else:
-            output_str = delay['to_pin']
 
-        if delay['from_pin_edge'] is not None:
-            input_str = "(" + delay['from_pin_edge'] + " "\
-                + delay['from_pin'] + ")"
-        else:
-            input_str = delay['from_pin']
+def _emit_timingenv_entries(delays, out):
 
-        entry += """
+    if not delays:
+        return
+
+    out.append("""
+        (TIMINGENV""")
+    for delay in delays:
+        out.append("""
                 (PATHCONSTRAINT {output} {input} {RISE} {FALL})""".format(
-            output=output_str,
-            input=input_str,
+            output=gen_port(delay['to_pin'], delay['to_pin_edge']),
+            input=gen_port(delay['from_pin'], delay['from_pin_edge']),
             RISE=gen_timing_entry(delay['delay_paths']['rise']),
-            FALL=gen_timing_entry(delay['delay_paths']['fall']))
-        entries += entry
-
-    if entries != "":
-        tenv_entries += """
-        (TIMINGENV"""
-        tenv_entries += entries
-        tenv_entries += """
-        )"""
+            FALL=gen_timing_entry(delay['delay_paths']['fall'])))
 
-    return tenv_entries
+    out.append("""
+        )""")
 
 
-def emit_timingcheck_entries(delays):
-
-    entries = ""
-    tcheck_entries = ""
-    for delay in sorted(delays):
-        delay = delays[delay]
-        entry = ""
-        if not delay['is_timing_check']:
-            # handle only timing checks here
-            continue
+def _emit_timingcheck_entries(delays, out):
 
-        input_str = ""
-        output_str = ""
-        if delay['to_pin_edge'] is not None:
-            output_str = "(" + delay['to_pin_edge'] + " "\
-                + delay['to_pin'] + ")"
-        else:
-            output_str = delay['to_pin']
+    if not delays:
+        return
 
-        if delay['from_pin_edge'] is not None:
-            input_str = "(" + delay['from_pin_edge'] + " "\
-                + delay['from_pin'] + ")"
-        else:
-            input_str = delay['from_pin']
+    out.append("""
+        (TIMINGCHECK""")
+    for delay in delays:
+        output_str = gen_port(delay['to_pin'], delay['to_pin_edge'])
+        input_str = gen_port(delay['from_pin'], delay['from_pin_edge'])
 
         if delay['is_cond']:
             input_str = "(COND {equation} {input})".format(
-                equation=delay['cond_equation'],
+                equation=_str(delay['cond_equation']),
                 input=input_str)
 
         if delay['name'].startswith("width"):
             output_str = ""
 
         if delay['name'].startswith("setuphold"):
-            entry += """
+            out.append("""
                 ({type} {output} {input} {SETUP} {HOLD})""".format(
                 type=delay['type'].upper(),
                 input=input_str,
                 output=output_str,
                 SETUP=gen_timing_entry(delay['delay_paths']['setup']),
-                HOLD=gen_timing_entry(delay['delay_paths']['hold']))
+                HOLD=gen_timing_entry(delay['delay_paths']['hold'])))
 
         else:
-            entry += """
+            out.append("""
                 ({type} {output} {input} {NOMINAL})""".format(
                 type=delay['type'].upper(),
                 input=input_str,
                 output=output_str,
-                NOMINAL=gen_timing_entry(delay['delay_paths']['nominal']))
-        entries += entry
+                NOMINAL=gen_timing_entry(delay['delay_paths']['nominal'])))
 
-    if entries != "":
-        tcheck_entries += """
-        (TIMINGCHECK"""
-        tcheck_entries += entries
-        tcheck_entries += """
-        )"""
+    out.append("""
+        )""")
 
-    return tcheck_entries
 
+def _emit_delay_entry(delay, out):
 
-def emit_delay_entries(delays):
+    output_str = gen_port(delay['to_pin'], delay['to_pin_edge'])
+    input_str = gen_port(delay['from_pin'], delay['from_pin_edge'])
 
-    entries_absolute = ""
-    entries_incremental = ""
-    entries = ""
-
-    for delay in sorted(delays):
-        entry = ""
-        delay = delays[delay]
-        if not delay['is_absolute'] and not delay['is_incremental']:
-            # if it's neiter absolute, nor incremental
-            # it must be a timingcheck entry. It will be
-            # handled later
-            continue
+    paths = delay['delay_paths']
+    tim_val_str = "".join([gen_timing_entry(paths[path])
+                           for path in ('fast', 'nominal', 'slow')
+                           if path in paths])
 
-        input_str = ""
-        output_str = ""
-        if delay['to_pin_edge'] is not None:
-            output_str = "(" + delay['to_pin_edge'] + " "\
-                + delay['to_pin'] + ")"
-        else:
-            output_str = delay['to_pin']
+    if delay['type'].startswith("port"):
+        out.append("""
+                (PORT {input} {timval})""".format(
+            input=input_str,
+            timval=tim_val_str))
+    elif delay['type'].startswith("interconnect"):
+        out.append("""
+                (INTERCONNECT {input} {output} {timval})""".format(
+            input=input_str,
+            output=output_str,
+            timval=tim_val_str))
+    elif delay['type'].startswith("device"):
+        out.append("""
+                (DEVICE {input} {timval})""".format(
+            input=input_str,
+            timval=tim_val_str))
+    elif delay['is_cond']:
+        out.append("""
+                (COND ({equation})
+                     (IOPATH {input} {output} {timval})
+                    )""".format(
+            equation=_str(delay['cond_equation']),
+            input=input_str,
+            output=output_str,
+            timval=tim_val_str))
+    else:
+        out.append("""
+                (IOPATH {input} {output} {timval})""".format(
+            input=input_str,
+            output=output_str,
+            timval=tim_val_str))
+
+
+def _emit_delay_entries(absolute, incremental, out):
+
+    if not absolute and not incremental:
+        return
+
+    out.append("""
+        (DELAY""")
+    if absolute:
+        out.append("""
+            (ABSOLUTE""")
+        for delay in absolute:
+            _emit_delay_entry(delay, out)
+        out.append("""
+            )""")
+    if incremental:
+        out.append("""
+            (INCREMENT""")
+        for delay in incremental:
+            _emit_delay_entry(delay, out)
+        out.append("""
+            )""")
+    out.append("""
+        )""")
+
+
+def _sort_entries(delays):
+    """Split the entries of a cell by the section they are written to
+
+    Returns the (absolute, incremental, timingcheck, timingenv) lists of
+    entries, each sorted by name.
+    """
+
+    absolute = list()
+    incremental = list()
+    timingcheck = list()
+    timingenv = list()
+    for name in sorted(delays):
+        delay = delays[name]
+        if delay['is_absolute']:
+            absolute.append(delay)
+        elif delay['is_incremental']:
+            incremental.append(delay)
+        # an entry which is neither absolute nor incremental is a timing
+        # check or a timing environment entry
+        if delay['is_timing_check']:
+            timingcheck.append(delay)
+        if delay['is_timing_env']:
+            timingenv.append(delay)
+    return absolute, incremental, timingcheck, timingenv
 
-        if delay['from_pin_edge'] is not None:
-            input_str = "(" + delay['from_pin_edge'] + " "\
-                + delay['from_pin'] + ")"
-        else:
-            input_str = delay['from_pin']
 
-        tim_val_str = ""
+def emit_timingenv_entries(delays):
 
-        for path in ['fast', 'nominal', 'slow']:
-            if path in delay['delay_paths']:
-                tim_val_str += gen_timing_entry(delay['delay_paths'][path])
+    out = list()
+    _emit_timingenv_entries(_sort_entries(delays)[3], out)
+    return "".join(out)
 
-        indent = ""
-        if delay['type'].startswith("port"):
-            entry += """
-                (PORT {input} {timval})""".format(
-                input=input_str,
-                timval=tim_val_str)
-        elif delay['type'].startswith("interconnect"):
-            entry += """
-                (INTERCONNECT {input} {output} {timval})""".format(
-                input=input_str,
-                output=output_str,
-                timval=tim_val_str)
-        elif delay['type'].startswith("device"):
-            entry += """
-                (DEVICE {input} {timval})""".format(
-                input=input_str,
-                timval=tim_val_str)
-        else:
-            if delay['is_cond']:
-                indent = "     "
-                entry += """
-                (COND ({equation})""".format(
-                    equation=delay['cond_equation'])
-
-            entry += """
-                {indent}(IOPATH {input} {output} {timval})""".format(
-                indent=indent,
-                input=input_str,
-                output=output_str,
-                timval=tim_val_str)
 
-            if delay['is_cond']:
-                entry += """
-                    )"""
-        if delay['is_absolute']:
-            entries_absolute += entry
-            # if it is not absolute it must be incremental
-            # all the other types are filtered above
-        else:
-            entries_incremental += entry
-
-    if entries_absolute != "" or entries_incremental != "":
-        entries += """
-        (DELAY"""
-    if entries_absolute != "":
-        entries += """
-            (ABSOLUTE"""
-        entries += entries_absolute
-        entries += """
-            )"""
-    if entries_incremental != "":
-        entries += """
-            (INCREMENT"""
-        entries += entries_incremental
-        entries += """
-            )"""
-    if entries_absolute != "" or entries_incremental != "":
-        entries += """
-        )"""
-
-    return entries
+def emit_timingcheck_entries(delays):
 
+    out = list()
+    _emit_timingcheck_entries(_sort_entries(delays)[2], out)
+    return "".join(out)
+
+
+def emit_delay_entries(delays):
+
+    out = list()
+    absolute, incremental, _, _ = _sort_entries(delays)
+    _emit_delay_entries(absolute, incremental, out)
+    return "".join(out)
 
-def emit_sdf(timings, timescale='1ps', uppercase_celltype=False):
 
-    for slice in timings:
-        sdf = \
-            """(DELAYFILE
+def _emit_header(timescale, out):
+
+    out.append("""(DELAYFILE
     (SDFVERSION \"3.0\")
     (TIMESCALE {})
-""".format(timescale)
-        if 'cells' in timings:
-            for cell in sorted(timings['cells']):
-                for location in sorted(timings['cells'][cell]):
+""".format(_str(timescale)))
+
 
-                    if uppercase_celltype:
-                        celltype = cell.upper()
-                    else:
-                        celltype = cell
+def _emit_cell(celltype, location, entries, out):
 
-                    sdf += """
+    out.append("""
     (CELL
-        (CELLTYPE \"{name}\")""".format(name=celltype)
-
-                    sdf += """
-        (INSTANCE {location})""".format(location=location)
-                    sdf += emit_delay_entries(
-                        timings['cells'][cell][location])
-                    sdf += emit_timingcheck_entries(
-                        timings['cells'][cell][location])
-                    sdf += emit_timingenv_entries(
-                        timings['cells'][cell][location])
-                    sdf += """
-    )"""
-        sdf += """
-)"""
-
-    # fix "None" entries
-    sdf = sdf.replace("None", "")
-    return sdf
+        (CELLTYPE \"{name}\")""".format(name=_str(celltype)))
+
+    out.append("""
+        (INSTANCE {location})""".format(location=_str(location)))
+    absolute, incremental, timingcheck, timingenv = _sort_entries(entries)
+    _emit_delay_entries(absolute, incremental, out)
+    _emit_timingcheck_entries(timingcheck, out)
+    _emit_timingenv_entries(timingenv, out)
+    out.append("""
+    )""")
+
+
+def _iter_cells(timings):
+
+    cells = timings.get('cells', dict())
+    for cell in sorted(cells):
+        for location in sorted(cells[cell]):
+            yield cell, location, cells[cell][location]
+
+
+def write_sdf(timings, fileobj, timescale='1ps', uppercase_celltype=False):
+    """Write an SDF file to ``fileobj`` cell by cell
+
+    ``timings`` is either a dict as returned by sdfparse.parse(), whose
+    cells are written sorted the same way as by emit_sdf(), or an iterable
+    of ``(celltype, instance, entries)`` tuples, which are written in the
+    order they come in. The ``(None, None, header)`` tuple yielded by
+    sdfparse.iterparse() is skipped, so parsing and writing can be chained
+    without holding the whole file in memory.
+
+    >>> import io
+    >>> fileobj = io.StringIO()
+    >>> write_sdf([('buf', 'b', dict())], fileobj)
+    >>> print(fileobj.getvalue())
+    (DELAYFILE
+        (SDFVERSION "3.0")
+        (TIMESCALE 1ps)
+    <BLANKLINE>
+        (CELL
+            (CELLTYPE "buf")
+            (INSTANCE b)
+        )
+    )
+    """
+
+    if isinstance(timings, dict):
+        timings = _iter_cells(timings)
+
+    out = list()
+    _emit_header(timescale, out)
+    for celltype, location, entries in timings:
+        if celltype is None and location is None:
+            # header of an iterparse() stream
+            continue
+        if uppercase_celltype:
+            celltype = celltype.upper()
+        _emit_cell(celltype, location, entries, out)
+        fileobj.write("".join(out))
+        out.clear()
+    out.append("""
+)""")
+    fileobj.write("".join(out))
+
+
+def emit_sdf(timings, timescale='1ps', uppercase_celltype=False):
+
+    fileobj = io.StringIO()
+    write_sdf(timings, fileobj, timescale, uppercase_celltype)
+    return fileobj.getvalue()
@@ -17,21 +17,14 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import sys
+
 import ply.yacc as yacc
 
 from . import utils
+from .arcmap import ArcMap
 from .sdflex import tokens
 
-timings = dict()
-
-header = dict()
-delays_list = list()
-cells = dict()
-
-tmp_delay_list = list()
-tmp_equation = list()
-tmp_constr_list = list()
-
 
 def remove_quotation(s):
     return s.replace('"', '')
@@ -41,11 +34,12 @@ def p_sdf_file(p):
     '''sdf_file : LPAR DELAYFILE sdf_header RPAR
                 | LPAR DELAYFILE sdf_header cell_list RPAR'''
 
-    timings['header'] = p[3]
+    state = p.parser.owner
+    state.timings['header'] = p[3]
     if p[4] != ')':
-        timings['cells'] = p[4]
+        state.timings['cells'] = p[4]
 
-    p[0] = timings
+    p[0] = state.timings
 
 
 def p_sdf_header(p):
@@ -64,9 +58,10 @@ def p_sdf_header(p):
 def p_sdf_header_qstring(p):
     '''sdf_header_qstring : LPAR qstring_header_entry QSTRING RPAR
                           | LPAR qstring_header_entry RPAR'''
+    state = p.parser.owner
     if len(p) == 5:
-        header[p[2].lower()] = remove_quotation(p[3])
-        p[0] = header
+        state.header[p[2].lower()] = remove_quotation(p[3])
+        p[0] = state.header
 
 
 def p_qstring_header_entry(p):
@@ -82,9 +77,10 @@ def p_qstring_header_entry(p):
 
 def p_sdf_header_qfloat(p):
     '''sdf_header_qfloat : LPAR qfloat_header_entry QFLOAT RPAR'''
+    state = p.parser.owner
     if len(p) == 5:
-        header[p[2].lower()] = remove_quotation(str(p[3]))
-        p[0] = header
+        state.header[p[2].lower()] = remove_quotation(str(p[3]))
+        p[0] = state.header
 
 
 def p_qfloat_header_entry(p):
@@ -95,27 +91,31 @@ def p_qfloat_header_entry(p):
 
 def p_sdf_voltage(p):
     '''voltage : LPAR VOLTAGE real_triple RPAR'''
-    header['voltage'] = p[3]
-    p[0] = header
+    state = p.parser.owner
+    state.header['voltage'] = p[3]
+    p[0] = state.header
 
 
 def p_sdf_temperature(p):
     '''temperature : LPAR TEMPERATURE real_triple RPAR'''
-    header['temperature'] = p[3]
-    p[0] = header
+    state = p.parser.owner
+    state.header['temperature'] = p[3]
+    p[0] = state.header
 
 
 def p_sdf_divider(p):
     '''hierarchy_divider : LPAR DIVIDER DOT RPAR
                | LPAR DIVIDER SLASH RPAR'''
-    header['divider'] = p[3]
-    p[0] = header
+    state = p.parser.owner
+    state.header['divider'] = p[3]
+    p[0] = state.header
 
 
 def p_sdf_timescale(p):
     '''timescale : LPAR TIMESCALE FLOAT STRING RPAR'''
-    header['timescale'] = str(p[3]) + p[4]
-    p[0] = header
+    state = p.parser.owner
+    state.header['timescale'] = str(p[3]) + p[4]
+    p[0] = state.header
 
 
 def p_cell_list(p):
@@ -124,32 +124,36 @@ def p_cell_list(p):
     p[0] = p[1]
 
 
-def add_delays_to_cell(celltype, instance, delays):
+def add_delays_to_cell(cells, celltype, instance, delays):
 
     if delays is None:
         return
+    entries = cells[celltype][instance]
     for delay in delays:
-        cells[celltype][instance][delay['name']] = delay
+        entries.add(delay)
 
 
-def add_cell(name, instance):
+def add_cell(cells, name, instance):
 
     # name
     if name not in cells:
         cells[name] = dict()
     # instance
     if instance not in cells[name]:
-        cells[name][instance] = dict()
+        cells[name][instance] = ArcMap()
 
 
 def p_timing_cell(p):
     '''cell : LPAR CELL celltype instance timing_cell_lst RPAR
             | LPAR CELL celltype instance RPAR'''
 
-    add_cell(p[3], p[4])
-    add_delays_to_cell(p[3], p[4], delays_list)
-    p[0] = cells
-    delays_list[:] = []
+    state = p.parser.owner
+    if state.stats is not None:
+        state.stats.add_cell(len(state.delays_list))
+    add_cell(state.cells, p[3], p[4])
+    add_delays_to_cell(state.cells, p[3], p[4], state.delays_list)
+    p[0] = state.cells
+    state.delays_list[:] = []
 
 
 def p_timing_cell_lst(p):
@@ -165,7 +169,7 @@ def p_timing_cell_entry(p):
 
 def p_celltype(p):
     '''celltype : LPAR CELLTYPE QSTRING RPAR'''
-    p[0] = remove_quotation(p[3])
+    p[0] = sys.intern(remove_quotation(p[3]))
 
 
 def p_instance(p):
@@ -200,23 +204,25 @@ def p_port_check(p):
 
 def p_timing_cond(p):
     '''cond_check : LPAR COND equation port_spec RPAR'''
+    state = p.parser.owner
     port = dict()
     port['cond'] = True
-    port['cond_equation'] = " ".join(p[3])
+    port['cond_equation'] = sys.intern(" ".join(p[3]))
     port['port'] = p[4]['port']
     port['port_edge'] = p[4]['port_edge']
-    tmp_equation[:] = []
+    state.tmp_equation[:] = []
     p[0] = port
 
 
 def p_timing_check_list(p):
     '''timing_check_list : t_check
                          | timing_check_list t_check'''
+    state = p.parser.owner
     if len(p) == 2:
-        delays_list.extend(list(p[1]))
+        state.delays_list.extend(list(p[1]))
     else:
-        delays_list.extend(list(p[2]))
-    tmp_delay_list[:] = []
+        state.delays_list.extend(list(p[2]))
+    state.tmp_delay_list[:] = []
 
 
 def p_t_check(p):
@@ -232,64 +238,70 @@ def p_t_check(p):
 def p_removal_check(p):
     '''removal_check : LPAR REMOVAL timing_port timing_port real_triple RPAR'''
 
+    state = p.parser.owner
     paths = dict()
     paths['nominal'] = p[5]
     tcheck = utils.add_tcheck('removal', p[3], p[4], paths)
-    tmp_delay_list.append(tcheck)
-    p[0] = tmp_delay_list
+    state.tmp_delay_list.append(tcheck)
+    p[0] = state.tmp_delay_list
 
 
 def p_recovery_check(p):
     '''recovery_check : LPAR RECOVERY timing_port timing_port real_triple \
     RPAR'''
 
+    state = p.parser.owner
     paths = dict()
     paths['nominal'] = p[5]
     tcheck = utils.add_tcheck('recovery', p[3], p[4], paths)
-    tmp_delay_list.append(tcheck)
-    p[0] = tmp_delay_list
+    state.tmp_delay_list.append(tcheck)
+    p[0] = state.tmp_delay_list
 
 
 def p_hold_check(p):
     '''hold_check : LPAR HOLD timing_port timing_port real_triple RPAR'''
 
+    state = p.parser.owner
     paths = dict()
     paths['nominal'] = p[5]
     tcheck = utils.add_tcheck('hold', p[3], p[4], paths)
-    tmp_delay_list.append(tcheck)
-    p[0] = tmp_delay_list
+    state.tmp_delay_list.append(tcheck)
+    p[0] = state.tmp_delay_list
 
 
 def p_setup_check(p):
     '''setup_check : LPAR SETUP timing_port timing_port real_triple RPAR'''
 
+    state = p.parser.owner
     paths = dict()
     paths['nominal'] = p[5]
     tcheck = utils.add_tcheck('setup', p[3], p[4], paths)
-    tmp_delay_list.append(tcheck)
-    p[0] = tmp_delay_list
+    state.tmp_delay_list.append(tcheck)
+    p[0] = state.tmp_delay_list
 
 
 def p_width_check(p):
     '''width_check : LPAR WIDTH timing_port real_triple RPAR'''
 
+    state = p.parser.owner
     paths = dict()
     paths['nominal'] = p[4]
     tcheck = utils.add_tcheck('width', p[3], p[3], paths)
-    tmp_delay_list.append(tcheck)
-    p[0] = tmp_delay_list
+    state.tmp_delay_list.append(tcheck)
+    p[0] = state.tmp_delay_list
 
 
 def p_setuphold_check(p):
     '''setuphold_check : LPAR SETUPHOLD timing_port timing_port real_triple \
     real_triple RPAR'''
 
+    state = p.parser.owner
     paths = dict()
     paths['setup'] = p[5]
     paths['hold'] = p[6]
     tcheck = utils.add_tcheck('setuphold', p[3], p[4], paths)
-    tmp_delay_list.append(tcheck)
-    p[0] = tmp_delay_list
+    state.tmp_delay_list.append(tcheck)
+    p[0] = state.tmp_delay_list
 
 
 def p_timingenv(p):
@@ -299,23 +311,25 @@ def p_timingenv(p):
 def p_constraints_list(p):
     '''constraints_list : path_constraint
                         | constraints_list path_constraint'''
+    state = p.parser.owner
     if len(p) == 2:
-        delays_list.extend(p[1])
+        state.delays_list.extend(p[1])
     else:
-        delays_list.extend(p[2])
-    tmp_constr_list[:] = []
+        state.delays_list.extend(p[2])
+    state.tmp_constr_list[:] = []
 
 
 def p_path_constraint(p):
     '''path_constraint : LPAR PATHCONSTRAINT port_spec port_spec real_triple \
     real_triple RPAR'''
 
+    state = p.parser.owner
     paths = dict()
     paths['rise'] = p[5]
     paths['fall'] = p[6]
     constr = utils.add_constraint('pathconstraint', p[3], p[4], paths)
-    tmp_constr_list.append(constr)
-    p[0] = tmp_constr_list
+    state.tmp_constr_list.append(constr)
+    p[0] = state.tmp_constr_list
 
 
 def p_delay(p):
@@ -334,10 +348,11 @@ def p_absolute_empty(p):
 
 def p_absolute_delay_list(p):
     '''absolute : LPAR ABSOLUTE delay_list RPAR'''
+    state = p.parser.owner
     for d in p[3]:
         d['is_absolute'] = True
-    delays_list.extend(list(p[3]))
-    tmp_delay_list[:] = []
+    state.delays_list.extend(list(p[3]))
+    state.tmp_delay_list[:] = []
 
 
 def p_increment_list(p):
@@ -348,47 +363,59 @@ def p_increment_list(p):
 def p_increment_delay_list(p):
     '''increment : LPAR INCREMENT delay_list RPAR'''
 
+    state = p.parser.owner
     for d in p[3]:
         d['is_incremental'] = True
-    delays_list.extend(list(p[3]))
-    tmp_delay_list[:] = []
+    state.delays_list.extend(list(p[3]))
+    state.tmp_delay_list[:] = []
 
 
 def p_cond_delay(p):
     '''cond_delay : LPAR COND delay_condition delay_list RPAR'''
+    # the delay list is shared with the enclosing one, only the entries
+    # added after the condition belong to it
+    state = p.parser.owner
+    start = state.tmp_cond_starts.pop()
+    entries = p[4][start:]
+    del p[4][start:]
     # add condition to every list element
-    for d in p[4]:
+    for d in entries:
         d['is_cond'] = True
-        d['cond_equation'] = " ".join(p[3])
-    p[0] = p[4]
+        d['cond_equation'] = sys.intern(" ".join(p[3]))
+    p[0] = entries
 
 
 def p_delay_condition(p):
     '''delay_condition : LPAR equation RPAR'''
+    state = p.parser.owner
     p[0] = list(p[2])
-    tmp_equation[:] = []
+    state.tmp_equation[:] = []
+    state.tmp_cond_starts.append(len(state.tmp_delay_list))
 
 
 def p_delay_condition_nopar(p):
     '''delay_condition : equation'''
+    state = p.parser.owner
     p[0] = list(p[1])
-    tmp_equation[:] = []
+    state.tmp_equation[:] = []
+    state.tmp_cond_starts.append(len(state.tmp_delay_list))
 
 
 def p_delay_list_interconnect(p):
     '''delay_list : del
                   | delay_list del'''
+    state = p.parser.owner
     if len(p) == 2:
         to_add = p[1]
     else:
         to_add = p[2]
 
     if type(to_add) is list:
-        tmp_delay_list.extend(to_add)
+        state.tmp_delay_list.extend(to_add)
     else:
-        tmp_delay_list.append(to_add)
+        state.tmp_delay_list.append(to_add)
 
-    p[0] = tmp_delay_list
+    p[0] = state.tmp_delay_list
 
 
 def p_del(p):
@@ -446,7 +473,7 @@ def p_port_spec(p):
         port['port_edge'] = None
     else:
         port['port'] = p[3]
-        port['port_edge'] = p[2].lower()
+        port['port_edge'] = sys.intern(p[2].lower())
 
     p[0] = port
 
@@ -569,12 +596,13 @@ def p_equation(p):
                 | equation FLOAT
                 | equation SCALARCONSTANT
                 | equation STRING'''
+    state = p.parser.owner
     if len(p) == 2:
-        tmp_equation.append(p[1])
+        state.tmp_equation.append(p[1])
     else:
-        tmp_equation.append(p[2])
+        state.tmp_equation.append(p[2])
 
-    p[0] = tmp_equation
+    p[0] = state.tmp_equation
 
 
 def p_operator(p):
@@ -608,4 +636,36 @@ def p_error(p):
     raise Exception("Syntax error at '%s' line: %d" % (p.value, p.lineno))
 
 
-parser = yacc.yacc(debug=False, write_tables=False)
+# start symbol -> module of the pregenerated tables, see gentables. None is
+# the first rule, sdf_file.
+TABMODULES = {
+    None: '_parsetab',
+    'cell_list': '_cellparsetab',
+}
+
+_parsers = dict()
+
+
+def get_parser(start=None):
+    """Return the parser of the grammar rooted at ``start``
+
+    The parser is built on first use from the tables in TABMODULES, ply
+    only builds the LALR tables if they do not match the grammar anymore.
+    The grammar actions keep all the data of a parse in p.parser.owner,
+    the parsers only hold the tables. SDFParser makes a copy of them for
+    every instance, see sdfparse.
+
+    With start='cell_list' the parser reads a list of (CELL ...) blocks
+    without the surrounding DELAYFILE, used when the file is parsed in
+    pieces. Rules that are only reachable from the top-level sdf_file are
+    reported as unused, so the warnings are silenced for it.
+    """
+    parser = _parsers.get(start)
+    if parser is None:
+        errorlog = None if start is None else yacc.NullLogger()
+        parser = yacc.yacc(module=sys.modules[__name__], debug=False,
+                           write_tables=False, start=start,
+                           tabmodule=__package__ + '.' + TABMODULES[start],
+                           errorlog=errorlog)
+        _parsers[start] = parser
+    return parser
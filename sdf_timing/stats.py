@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Instrumentation of parse and emit.
+
+A Stats object passed to sdfparse.parse(), SDFParser or emit() collects
+the wall time of the phases, the number of tokens per token type, the
+number of reductions per grammar rule and the number of entries per
+(CELL ...) block. When the SDF_TIMING_STATS environment variable is set
+to a path, parse() and emit() append the stats of every call to that file
+as a JSON line. Collecting stats times every token and grammar action,
+which makes parsing up to twice as slow.
+"""
+
+import collections
+import contextlib
+import copy
+import json
+import os
+import time
+
+ENV_VAR = 'SDF_TIMING_STATS'
+
+# grammar actions which build the entry dicts with utils.add_*()
+ENTRY_ACTIONS = frozenset((
+    'p_iopath',
+    'p_interconnect',
+    'p_port',
+    'p_device',
+    'p_removal_check',
+    'p_recovery_check',
+    'p_hold_check',
+    'p_setup_check',
+    'p_width_check',
+    'p_setuphold_check',
+    'p_path_constraint',
+))
+
+# grammar actions which add the entries to the cells dict
+MERGE_ACTIONS = frozenset(('p_timing_cell', ))
+
+
+class Stats(object):
+    """Counters and timers of one or more parse and emit calls
+
+    ``to_dict()`` returns the phases, where the time spent in the parser
+    is split into:
+
+    - ``lex``: the lexer producing tokens
+    - ``lr``: the LR automaton, the parse time not spent in the lexer or
+      the grammar actions
+    - ``entries``: grammar actions building the entry dicts
+    - ``merge``: adding the entries to the cells, add_delays_to_cell()
+    - ``actions``: the other grammar actions
+
+    >>> from sdf_timing import sdfparse
+    >>> stats = Stats()
+    >>> _ = sdfparse.parse('''(DELAYFILE (SDFVERSION "3.0")
+    ...     (CELL (CELLTYPE "buf") (INSTANCE b)
+    ...         (DELAY (ABSOLUTE (IOPATH A Z (1:2:3))))))''', stats=stats)
+    >>> stats.tokens['IOPATH'], stats.cell_entries
+    (1, Counter({1: 1}))
+    >>> sorted(stats.to_dict()['phases'])
+    ['actions', 'entries', 'lex', 'lr', 'merge', 'parse']
+    """
+
+    def __init__(self):
+        # phase -> seconds, parse and emit are the total times
+        self.times = collections.Counter()
+        self.tokens = collections.Counter()
+        self.reductions = collections.Counter()
+        # rule -> seconds spent in its grammar action
+        self.action_times = collections.Counter()
+        # number of entries -> number of (CELL ...) blocks
+        self.cell_entries = collections.Counter()
+        self._phases = dict()
+
+    @contextlib.contextmanager
+    def timer(self, phase):
+        """Add the time spent in the with block to ``phase``"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[phase] += time.perf_counter() - start
+
+    def add_cell(self, entries):
+        self.cell_entries[entries] += 1
+
+    def tokenfunc(self, lexer):
+        """Return a token function for ply which counts and times tokens"""
+        clock = time.perf_counter
+        times = self.times
+        tokens = self.tokens
+
+        def token():
+            start = clock()
+            t = lexer.token()
+            times['lex'] += clock() - start
+            if t is not None:
+                tokens[t.type] += 1
+            return t
+        return token
+
+    def wrap_productions(self, productions):
+        """Return copies of ply productions whose actions are instrumented
+        """
+        wrapped = list()
+        for production in productions:
+            production = copy.copy(production)
+            if production.callable is not None:
+                production.callable = self._wrap_action(production)
+            wrapped.append(production)
+        return wrapped
+
+    def _wrap_action(self, production):
+        action = production.callable
+        rule = production.str
+        clock = time.perf_counter
+        self._phases[rule] = 'actions'
+        if action.__name__ in ENTRY_ACTIONS:
+            self._phases[rule] = 'entries'
+        elif action.__name__ in MERGE_ACTIONS:
+            self._phases[rule] = 'merge'
+
+        def reduce(p):
+            self.reductions[rule] += 1
+            start = clock()
+            try:
+                action(p)
+            finally:
+                self.action_times[rule] += clock() - start
+        return reduce
+
+    def phases(self):
+        """Return the seconds spent in each phase"""
+        phases = collections.OrderedDict()
+        for phase, seconds in self.times.items():
+            phases[phase] = seconds
+        if 'parse' in self.times:
+            for name in ('entries', 'merge', 'actions'):
+                phases[name] = 0.0
+            for rule, seconds in self.action_times.items():
+                phases[self._phases[rule]] += seconds
+            phases['lr'] = self.times['parse'] - self.times['lex'] - sum(
+                self.action_times.values())
+        return phases
+
+    def to_dict(self):
+        return {
+            'phases': self.phases(),
+            'tokens': dict(self.tokens),
+            'reductions': dict(self.reductions),
+            'cell_entries': {str(n): count for n, count in
+                             sorted(self.cell_entries.items())},
+        }
+
+    def to_json(self, fileobj=None, **kwargs):
+        """Return the stats as JSON or write them to ``fileobj``"""
+        if fileobj is None:
+            return json.dumps(self.to_dict(), **kwargs)
+        json.dump(self.to_dict(), fileobj, **kwargs)
+
+
+def from_env():
+    """Return a new Stats if SDF_TIMING_STATS is set, otherwise None"""
+    if os.environ.get(ENV_VAR):
+        return Stats()
+    return None
+
+
+def save_env(stats):
+    """Append stats to the file given by SDF_TIMING_STATS as a JSON line"""
+    with open(os.environ[ENV_VAR], 'a') as fp:
+        stats.to_json(fp, sort_keys=True)
+        fp.write('\n')
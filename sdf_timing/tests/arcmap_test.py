@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+import io
+import pickle
+
+import pytest
+
+from sdf_timing import db
+from sdf_timing import sdfjson
+from sdf_timing import sdfparse
+from sdf_timing import utils
+from sdf_timing.arcmap import ArcMap
+from sdf_timing.lazy import LazySDF
+from sdf_timing.table import TimingTable
+
+SDF = """(DELAYFILE (SDFVERSION "3.0")
+    (CELL (CELLTYPE "ff") (INSTANCE f)
+        (DELAY (ABSOLUTE
+            (IOPATH (posedge CLK) Q (1:1:1))
+            (IOPATH (negedge CLK) Q (2:2:2))
+            (COND EN == 1 (IOPATH A Z (3:3:3)))
+            (COND EN == 0 (IOPATH A Z (4:4:4)))
+            (IOPATH A Z (5:5:5))
+            (IOPATH B Z (6:6:6))))
+        (TIMINGCHECK
+            (SETUP D (posedge CLK) (7:7:7))
+            (SETUP D (negedge CLK) (8:8:8))
+            (WIDTH (COND RST (posedge CLK)) (9:9:9)))))
+"""
+
+KEYS = [
+    'iopath_CLK_Q',
+    'iopath_CLK_Q[negedge CLK]',
+    'iopath_A_Z',
+    'iopath_A_Z[COND EN == 0]',
+    'iopath_A_Z[COND EN == 1]',
+    'iopath_B_Z',
+    'setup_CLK_D',
+    'setup_CLK_D[negedge CLK]',
+    'width_CLK_CLK',
+]
+
+
+def max_delay(entry):
+    return entry['delay_paths']['nominal']['max']
+
+
+@pytest.mark.parametrize('lexer', ['ply', 'fast'])
+def test_parse_keeps_all_arcs(lexer):
+    entries = sdfparse.parse(SDF, lexer)['cells']['ff']['f']
+    assert isinstance(entries, ArcMap)
+    assert list(entries) == KEYS
+
+    assert [max_delay(e) for e in entries.arcs('iopath_CLK_Q')] == [1.0, 2.0]
+    # the arc without a condition takes the name
+    assert [max_delay(e) for e in entries.arcs('iopath_A_Z')] == [
+        5.0, 4.0, 3.0]
+    assert [max_delay(e) for e in entries.arcs('iopath_B_Z')] == [6.0]
+    assert entries.arcs('iopath_X_Y') == []
+
+    assert max_delay(entries.arc('iopath_A_Z', cond_equation='EN == 0')) \
+        == 4.0
+    assert max_delay(entries.arc('setup_CLK_D', from_pin_edge='negedge')) \
+        == 8.0
+    assert entries.arc('iopath_CLK_Q') is None
+
+
+def test_same_arc_is_replaced():
+    sdf = SDF.replace('(IOPATH B Z (6:6:6))',
+                      '(IOPATH (negedge CLK) Q (10:10:10))')
+    entries = sdfparse.parse(sdf)['cells']['ff']['f']
+    assert len(entries) == len(KEYS) - 1
+    assert max_delay(entries['iopath_CLK_Q[negedge CLK]']) == 10.0
+
+
+def test_cond_entries_keep_their_condition():
+    # a COND only applies to the entries inside it
+    entries = sdfparse.parse(SDF)['cells']['ff']['f']
+    assert not entries['iopath_CLK_Q']['is_cond']
+    assert not entries['iopath_A_Z']['is_cond']
+    assert entries['iopath_A_Z[COND EN == 1]']['cond_equation'] == 'EN == 1'
+    assert entries['iopath_A_Z[COND EN == 0]']['cond_equation'] == 'EN == 0'
+
+
+def test_emit_round_trip():
+    timings = sdfparse.parse(SDF)
+    again = sdfparse.parse(sdfparse.emit(timings))
+    entries = again['cells']['ff']['f']
+    assert sorted(entries) == sorted(KEYS)
+    assert again['cells'] == timings['cells']
+
+
+def test_split_cell():
+    # the arcs of a cell split over several blocks are kept
+    head, tail = SDF.split('(TIMINGCHECK')
+    sdf = head + """)
+    (CELL (CELLTYPE "ff") (INSTANCE f)
+        (DELAY (ABSOLUTE (IOPATH (posedge B) Z (1:1:1))))
+        (TIMINGCHECK""" + tail
+    timings = sdfparse.parse(sdf)
+    entries = timings['cells']['ff']['f']
+    assert len(entries.arcs('iopath_B_Z')) == 2
+
+    events = list(sdfparse.iterparse(io.StringIO(sdf)))
+    merged = ArcMap()
+    for _, _, block_entries in events[1:]:
+        merged.add_all(block_entries)
+    assert merged == entries
+
+
+def test_lazy_split_cell(tmpdir):
+    path = str(tmpdir.join('split.sdf'))
+    with open(path, 'w') as fp:
+        fp.write("""(DELAYFILE (SDFVERSION "3.0")
+    (CELL (CELLTYPE "ff") (INSTANCE f)
+        (DELAY (ABSOLUTE (IOPATH (posedge CLK) Q (1:1:1)))))
+    (CELL (CELLTYPE "ff") (INSTANCE f)
+        (DELAY (ABSOLUTE (IOPATH (negedge CLK) Q (2:2:2))))))""")
+    assert list(LazySDF(path)['ff', 'f']) == [
+        'iopath_CLK_Q', 'iopath_CLK_Q[negedge CLK]']
+
+
+@pytest.mark.parametrize('format', sdfjson.FORMATS)
+def test_json_round_trip(format):
+    timings = sdfparse.parse(SDF)
+    fp = io.StringIO()
+    sdfjson.dump(timings, fp, format)
+    fp.seek(0)
+    loaded = sdfjson.load(fp)
+    entries = loaded['cells']['ff']['f']
+    assert isinstance(entries, ArcMap)
+    assert entries == timings['cells']['ff']['f']
+    assert len(entries.arcs('iopath_A_Z')) == 3
+
+
+def test_table_round_trip(tmpdir):
+    timings = sdfparse.parse(SDF)
+    table = TimingTable.from_timings(timings)
+    path = str(tmpdir.join('timings.db'))
+    db.write_db(table, path)
+    with db.TimingDB(path) as timing_db:
+        for entries in (table.to_timings()['cells']['ff']['f'],
+                        table.cell('ff', 'f'), timing_db.get('ff', 'f')):
+            assert isinstance(entries, ArcMap)
+            assert entries == timings['cells']['ff']['f']
+            assert len(entries.arcs('iopath_A_Z')) == 3
+
+
+def test_rebuilt_from_dict():
+    entries = sdfparse.parse(SDF)['cells']['ff']['f']
+    for other in (ArcMap(dict(entries)), pickle.loads(pickle.dumps(entries)),
+                  copy.deepcopy(entries)):
+        assert other == entries
+        assert [max_delay(e) for e in other.arcs('iopath_A_Z')] == [
+            5.0, 4.0, 3.0]
+
+    entries.clear()
+    assert entries.arcs('iopath_A_Z') == []
+
+
+def test_item_assignment():
+    entries = sdfparse.parse(SDF)['cells']['ff']['f']
+    other = ArcMap()
+    for key, entry in entries.items():
+        other[key] = entry
+    assert [max_delay(e) for e in other.arcs('iopath_A_Z')] == [
+        5.0, 4.0, 3.0]
+
+    # update() is the one of dict, add_all() adds like add()
+    other = ArcMap()
+    other.update(entries, extra=entries['iopath_CLK_Q'])
+    assert list(other) == list(entries) + ['extra']
+
+
+def test_find():
+    entries = sdfparse.parse(SDF)['cells']['ff']['f']
+    for key, entry in entries.items():
+        assert entries.find(copy.deepcopy(entry)) is entry
+
+    other = utils.prepare_entry(name='iopath_CLK_Q', from_pin='CLK',
+                                to_pin='Q')
+    assert entries.find(other) is None
+    assert entries.add(other) == 'iopath_CLK_Q'
+    assert entries['iopath_CLK_Q[posedge CLK]']['from_pin_edge'] == 'posedge'
+    assert len(entries.arcs('iopath_CLK_Q')) == 3
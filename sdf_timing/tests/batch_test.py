@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+
+import pytest
+
+from sdf_timing import batch
+from sdf_timing import bench
+from sdf_timing import sdfparse
+from sdf_timing.__main__ import main
+
+
+# COND entries are left out, the parser does not read them back
+# correctly when they are followed by other entries
+MIX = {'iopath': 2, 'interconnect': 1, 'timingcheck': 1}
+
+
+def make_inputs(tmpdir, count=4):
+    paths = list()
+    for i in range(count):
+        path = tmpdir.join('tiles', 'tile{}.sdf'.format(i))
+        path.write(bench.generate(cells=3, mix=MIX, seed=i), ensure=True)
+        paths.append(str(path))
+    return paths
+
+
+def test_batch(tmpdir):
+    inputs = make_inputs(tmpdir)
+    pattern = str(tmpdir.join('tiles', '*.sdf'))
+    tasks = batch.make_tasks([pattern])
+    assert [task.input for task in tasks] == inputs
+
+    summary = batch.run(tasks, jobs=1)
+    assert (summary.converted, summary.skipped) == (4, 0)
+    assert summary.bytes == sum(os.path.getsize(path) for path in inputs)
+    for path in inputs:
+        with open(path) as fp:
+            expected = sdfparse.parse(fp.read())
+        with open(path[:-4] + '.json') as fp:
+            assert json.load(fp) == expected
+
+    summary = batch.run(tasks, jobs=1)
+    assert (summary.converted, summary.skipped) == (0, 4)
+
+    stat = os.stat(inputs[1])
+    os.utime(inputs[1], (stat.st_atime, stat.st_mtime + 10))
+    summary = batch.run(tasks, jobs=1)
+    assert (summary.converted, summary.skipped) == (1, 3)
+
+
+def test_batch_hash(tmpdir):
+    inputs = make_inputs(tmpdir, 2)
+    tasks = batch.make_tasks(inputs, output_dir=str(tmpdir.join('out')),
+                             format='ndjson')
+    assert batch.run(tasks, jobs=1, check='hash').converted == 2
+    with open(tasks[0].output) as fp:
+        assert fp.readline().startswith('{"header":')
+
+    # a new mtime with the same contents
+    os.utime(inputs[0], None)
+    assert batch.run(tasks, jobs=1, check='hash').skipped == 2
+
+    with open(inputs[0], 'a') as fp:
+        fp.write('\n')
+    assert batch.run(tasks, jobs=1, check='hash').converted == 1
+
+    # the same inputs in another format
+    tasks = batch.make_tasks(inputs, output_dir=str(tmpdir.join('out')),
+                             format='pretty')
+    assert batch.run(tasks, jobs=1, check='hash').converted == 2
+    with open(tasks[0].output) as fp:
+        assert fp.readline() == '{\n'
+    assert batch.run(tasks, jobs=1, check='hash').skipped == 2
+
+
+def test_batch_permissions(tmpdir):
+    inputs = make_inputs(tmpdir, 1)
+    umask = os.umask(0o022)
+    try:
+        tasks = batch.make_tasks(inputs)
+        batch.run(tasks, jobs=1, check='hash')
+    finally:
+        os.umask(umask)
+    for path in (tasks[0].output, tasks[0].output + batch.HASH_SUFFIX):
+        assert os.stat(path).st_mode & 0o777 == 0o644
+
+
+def test_batch_emit_and_errors(tmpdir):
+    inputs = make_inputs(tmpdir, 2)
+    batch.run(batch.make_tasks(inputs), jobs=1)
+    tmpdir.join('tiles', 'broken.sdf').write('(DELAYFILE (')
+
+    out = str(tmpdir.join('out'))
+    summary = batch.run(batch.make_tasks(
+        [str(tmpdir.join('tiles', '*.sdf'))], output_dir=out), jobs=2)
+    assert summary.converted == 2
+    assert len(summary.errors) == 1 and 'broken.sdf' in summary.errors[0]
+    assert not os.path.exists(os.path.join(out, 'broken.json'))
+
+    tasks = batch.make_tasks([os.path.join(out, '*.json')], emit=True)
+    assert [os.path.basename(task.output) for task in tasks] == [
+        'tile0.sdf', 'tile1.sdf']
+    assert batch.run(tasks, jobs=1).converted == 2
+    with open(tasks[0].output) as fp:
+        emitted = sdfparse.parse(fp.read())
+    with open(inputs[0]) as fp:
+        assert emitted == sdfparse.parse(fp.read())
+
+
+def test_make_tasks(tmpdir):
+    inputs = make_inputs(tmpdir, 2)
+    manifest = tmpdir.join('manifest.txt')
+    manifest.write("# tiles\n"
+                   "tiles/tile0.sdf\n"
+                   "\n"
+                   "tiles/tile1.sdf out/one.json\n")
+    tasks = batch.make_tasks(manifest=str(manifest))
+    assert [(t.input, t.output) for t in tasks] == [
+        (inputs[0], inputs[0][:-4] + '.json'),
+        (inputs[1], str(tmpdir.join('out', 'one.json')))]
+
+    # the same file twice is converted once
+    assert len(batch.make_tasks(inputs + inputs)) == 2
+
+    tmpdir.join('other', 'tile0.sdf').write('', ensure=True)
+    with pytest.raises(Exception, match='would be written'):
+        batch.make_tasks([inputs[0], str(tmpdir.join('other', 'tile0.sdf'))],
+                         output_dir=str(tmpdir))
+    with pytest.raises(Exception, match='No files match'):
+        batch.make_tasks([str(tmpdir.join('*.nothing'))])
+
+
+def test_main_batch(tmpdir, capsys):
+    make_inputs(tmpdir, 3)
+    pattern = str(tmpdir.join('**', '*.sdf'))
+    assert main(['--batch', pattern, '--jobs', '2']) == 0
+    assert '3 converted, 0 up to date, 0 failed' in capsys.readouterr().out
+    assert main(['--batch', pattern]) == 0
+    assert '0 converted, 3 up to date' in capsys.readouterr().out
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import collections
+
+import pytest
+
+from sdf_timing import bench
+from sdf_timing import sdfparse
+
+
+def test_generate_deterministic():
+    assert bench.generate(50, seed=3) == bench.generate(50, seed=3)
+    assert bench.generate(50, seed=3) != bench.generate(50, seed=4)
+
+
+def test_generate_mix():
+    data = bench.generate(100, arcs_per_cell=10, escaped=0.5)
+    for keyword in ('IOPATH', 'COND', 'INTERCONNECT', 'TIMINGCHECK',
+                    'SETUPHOLD', 'TIMINGENV', 'PATHCONSTRAINT', '\\['):
+        assert keyword in data
+
+    timings = sdfparse.parse(data)
+    assert bench.count_arcs(timings) == 1000
+    assert sdfparse.parse(data, 'fast') == timings
+
+    data = bench.generate(100, mix={'iopath': 1})
+    for keyword in ('COND', 'INTERCONNECT', 'TIMINGCHECK', 'TIMINGENV'):
+        assert keyword not in data
+    assert bench.count_arcs(sdfparse.parse(data)) == 800
+
+
+def test_run():
+    data = bench.generate(20)
+    results = bench.run(data, repeat=1, isolate=False)
+    assert [r['phase'] for r in results] == ['parse', 'emit', 'roundtrip']
+    for result in results:
+        assert result['seconds'] > 0
+        assert result['MB/s'] > 0
+        assert result['arcs/s'] > 0
+
+
+@pytest.mark.parametrize('platform, expected', [('linux', 2048),
+                                                ('darwin', 2)])
+def test_peak_rss(monkeypatch, platform, expected):
+    if bench.resource is None:
+        pytest.skip("resource is not available")
+    usage = collections.namedtuple('usage', 'ru_maxrss')
+    monkeypatch.setattr(bench.resource, 'getrusage', lambda who: usage(2))
+    monkeypatch.setattr(bench.sys, 'platform', platform)
+    assert bench._peak_rss() == expected
+
+
+def test_main(capsys, tmpdir):
+    output = str(tmpdir.join('bench.sdf'))
+    bench.main(['--cells', '10', '--output', output])
+    with open(output) as fp:
+        assert fp.read() == bench.generate(10)
+
+    bench.main(['--cells', '10', '--repeat', '1', '--phases', 'parse'])
+    out = capsys.readouterr().out
+    assert 'parse' in out and 'roundtrip' not in out
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import os.path
+import shutil
+import time
+
+import pytest
+
+from sdf_timing import cache
+from sdf_timing import sdfparse
+
+from conftest import datafiles_path
+
+datafile = os.path.join(datafiles_path, 'timings_hx1k.sdf')
+
+
+def cache_entries(cache_dir):
+    return sorted(f for f in os.listdir(cache_dir) if f.endswith(cache.SUFFIX))
+
+
+def no_parse(*args, **kwargs):
+    raise AssertionError("the file should have been loaded from the cache")
+
+
+def test_parse_file(tmp_path, monkeypatch):
+    with open(datafile) as sdffile:
+        expected = sdfparse.parse(sdffile.read())
+
+    assert sdfparse.parse_file(datafile) == expected
+    assert sdfparse.parse_file(datafile, cache_dir=str(tmp_path)) == expected
+    assert len(cache_entries(str(tmp_path))) == 1
+
+    monkeypatch.setattr(sdfparse, 'parse', no_parse)
+    assert sdfparse.parse_file(datafile, cache_dir=str(tmp_path)) == expected
+
+
+def test_parser_change(tmp_path, monkeypatch):
+    sdfparse.parse_file(datafile, cache_dir=str(tmp_path))
+    old = cache_entries(str(tmp_path))
+
+    monkeypatch.setattr(cache, '_fingerprint', '0123456789abcdef')
+    sdfparse.parse_file(datafile, cache_dir=str(tmp_path))
+    new = cache_entries(str(tmp_path))
+    assert len(new) == 1
+    assert new != old
+    assert new[0].startswith('0123456789abcdef-')
+
+
+def test_broken_entry(tmp_path):
+    expected = sdfparse.parse_file(datafile, cache_dir=str(tmp_path))
+    entry, = cache_entries(str(tmp_path))
+    with open(os.path.join(str(tmp_path), entry), 'wb') as fp:
+        fp.write(b'broken')
+    assert sdfparse.parse_file(datafile, cache_dir=str(tmp_path)) == expected
+
+
+def key_of(path):
+    with open(path, 'rb') as fp:
+        return cache.digest(fp.read())
+
+
+def test_lru_eviction(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    files = list()
+    for f in ('test1.sdf', 'clb.sdf', 'bigchip.sdf'):
+        files.append(os.path.join(str(tmp_path), f))
+        shutil.copy(os.path.join(datafiles_path, f), files[-1])
+
+    sdfparse.parse_file(files[0], cache_dir=cache_dir)
+    sdfparse.parse_file(files[1], cache_dir=cache_dir)
+    sizes = [os.path.getsize(os.path.join(cache_dir, f))
+             for f in cache_entries(cache_dir)]
+    # make the first file the most recently used one
+    past = time.time() - 100
+    for f in cache_entries(cache_dir):
+        os.utime(os.path.join(cache_dir, f), (past, past))
+    sdfparse.parse_file(files[0], cache_dir=cache_dir)
+
+    # room for two small entries, bigchip.sdf evicts the second file
+    sdfparse.parse_file(files[2], cache_dir=cache_dir,
+                        max_cache_size=sum(sizes) + 1024)
+    keys = [cache.entry_path(cache_dir, key_of(f)) for f in files]
+    assert [os.path.exists(k) for k in keys] == [True, False, True]
+
+
+def best_time(function, repeat=3):
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+@pytest.mark.benchmark
+def test_warm_load_benchmark(tmp_path):
+    cold = best_time(lambda: sdfparse.parse_file(datafile))
+    sdfparse.parse_file(datafile, cache_dir=str(tmp_path))
+    warm = best_time(lambda: sdfparse.parse_file(datafile,
+                                                 cache_dir=str(tmp_path)))
+    print("parse: {:.1f} ms, cached: {:.1f} ms".format(
+        cold * 1e3, warm * 1e3))
+    assert warm < cold / 5
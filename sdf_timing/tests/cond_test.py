@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import itertools
+import os
+import os.path
+import warnings
+
+import pytest
+
+from sdf_timing import cond
+from sdf_timing import sdfparse
+from sdf_timing import utils
+
+from conftest import backend_fixture
+from conftest import datafiles_path
+
+# condition -> the same condition in Python, of the pins A, B and C
+EQUATIONS = {
+    'A': lambda A, B, C: A,
+    '!A': lambda A, B, C: not A,
+    '~A': lambda A, B, C: not A,
+    "A == 1'b1 && B == 1'b0": lambda A, B, C: A and not B,
+    'A || B && C': lambda A, B, C: A or (B and C),
+    '(A || B) && C': lambda A, B, C: (A or B) and C,
+    'A | B & C': lambda A, B, C: A or (B and C),
+    'A ^ B | C': lambda A, B, C: (A != B) or C,
+    'A ~^ B': lambda A, B, C: A == B,
+    'A ^~ B && !C': lambda A, B, C: A == B and not C,
+    'A ~& B': lambda A, B, C: not (A and B),
+    'A ~| B': lambda A, B, C: not (A or B),
+    '~&A || ~|B': lambda A, B, C: not A or not B,
+    'A + B == 2': lambda A, B, C: A and B,
+    'A + B * 2 == 3': lambda A, B, C: A and B,
+    'A - B < 0': lambda A, B, C: B and not A,
+    'A << 1 >= 2': lambda A, B, C: A,
+    '-A == -1': lambda A, B, C: A,
+    '-A / 2 == 0': lambda A, B, C: True,
+    '-A % 2 == -A': lambda A, B, C: True,
+    '(A - 2) / (B + 1) == -1': lambda A, B, C: A != B,
+    '(A - 2 * B) % 2 == -1': lambda A, B, C: A and B,
+    'A != B === C': lambda A, B, C: (A != B) == C,
+    'A !== 1 || C': lambda A, B, C: not A or C,
+    '1': lambda A, B, C: True,
+    "1'b0": lambda A, B, C: False,
+}
+
+SDF = """(DELAYFILE (SDFVERSION "3.0")
+(CELL (CELLTYPE "mux") (INSTANCE m)
+    (DELAY (ABSOLUTE
+        (COND S == 0 (IOPATH A Z (1:1:1)))
+        (COND S == 1 (IOPATH B Z (2:2:2)))
+        (COND A ^ B (IOPATH S Z (3:3:3)))
+        (IOPATH EN Z (4:4:4))))
+    (TIMINGCHECK
+        (SETUP D (COND EN == 1 (posedge CLK)) (1:1:1))))
+)"""
+
+
+backend = backend_fixture(cond, 'numpy')
+
+
+def states(pins):
+    for values in itertools.product((0, 1), repeat=len(pins)):
+        yield dict(zip(pins, values))
+
+
+@pytest.mark.parametrize('equation', sorted(EQUATIONS))
+def test_compile_cond(equation):
+    function = cond.compile_cond(equation)
+    for state in states('ABC'):
+        assert function(state) is bool(EQUATIONS[equation](**state))
+
+
+def test_cache():
+    assert cond.parse('A && B') is cond.parse('A && B')
+    assert cond.compile_cond('A && B') is cond.compile_cond('A && B')
+
+
+def test_tokens_as_joined_by_the_parser():
+    # the parser joins the tokens of a condition with spaces
+    timings = sdfparse.parse("""(DELAYFILE (SDFVERSION "3.0")
+    (CELL (CELLTYPE "and") (INSTANCE a) (DELAY (ABSOLUTE
+        (COND A==1'b0&&B==1'b1 (IOPATH C Z (1:1:1)))))))""")
+    entry = timings['cells']['and']['a']['iopath_C_Z']
+    assert entry['cond_equation'] == "A == 1'b0 && B == 1'b1"
+    assert cond.parse(entry['cond_equation']) == cond.parse(
+        "A==1'b0&&B==1'b1")
+    assert cond.pins(cond.parse(entry['cond_equation'])) == ['A', 'B']
+
+
+def test_names():
+    assert cond.pins(cond.parse(r'a/b[0] && \c.d || e_1')) == [
+        'a/b[0]', r'\c.d', 'e_1']
+    function = cond.compile_cond("a/b[0] == 1'b1")
+    assert function({'a/b[0]': 1}) and not function({'a/b[0]': 0})
+
+
+@pytest.mark.parametrize('equation', ['', 'A &&', 'A B', '(A', 'A)', '&& A',
+                                      'A $ B', 'A . B'])
+def test_syntax_errors(equation):
+    with pytest.raises(Exception, match='COND equation'):
+        cond.parse(equation)
+
+
+def test_missing_pin():
+    with pytest.raises(KeyError):
+        cond.compile_cond('A && B')({'A': 1})
+
+
+def test_data_files():
+    # all the conditions of the test files compile
+    count = 0
+    for name in sorted(os.listdir(datafiles_path)):
+        if not name.endswith('.sdf'):
+            continue
+        with open(os.path.join(datafiles_path, name)) as sdffile:
+            timings = sdfparse.parse(sdffile.read())
+        for instances in timings.get('cells', dict()).values():
+            for entries in instances.values():
+                arcs = cond.CondArcs(entries)
+                for state in states(arcs.pins):
+                    arcs.active(state)
+                count += len(arcs)
+    assert count > 0
+
+
+def test_active():
+    entries = sdfparse.parse(SDF)['cells']['mux']['m']
+    arcs = cond.CondArcs(entries)
+    assert arcs.keys == ['iopath_A_Z', 'iopath_B_Z', 'iopath_S_Z',
+                         'setup_CLK_D']
+    assert arcs.pins == ['S', 'A', 'B', 'EN']
+    assert arcs.active({'S': 0, 'A': 1, 'B': 0, 'EN': 0}) == [
+        'iopath_A_Z', 'iopath_S_Z']
+    assert arcs.active({'S': 1, 'A': 1, 'B': 1, 'EN': 1}) == [
+        'iopath_B_Z', 'setup_CLK_D']
+    assert arcs.mask({'S': 1, 'A': 0, 'B': 1, 'EN': 1}) == 0b1101
+
+
+def test_evaluate(backend):
+    entries = sdfparse.parse(SDF)['cells']['mux']['m']
+    arcs = cond.CondArcs(entries)
+    masks = list(range(1 << len(arcs.pins)))
+    result = arcs.evaluate(masks)
+    assert len(result) == len(masks)
+    for mask, row in zip(masks, result):
+        state = {pin: (mask >> i) & 1 for i, pin in enumerate(arcs.pins)}
+        assert arcs.mask(state) == mask
+        active = [key for key, value in zip(arcs.keys, row) if value]
+        assert active == arcs.active(state)
+
+
+def test_evaluate_all_equations(backend):
+    entries = dict()
+    for i, equation in enumerate(sorted(EQUATIONS)):
+        entries[i] = utils.prepare_entry(name=str(i), is_cond=True,
+                                         cond_equation=equation)
+    arcs = cond.CondArcs(entries)
+    masks = list(range(1 << len(arcs.pins)))
+    expected = list()
+    for mask in masks:
+        state = {pin: (mask >> i) & 1 for i, pin in enumerate(arcs.pins)}
+        expected.append([bool(EQUATIONS[equation](**state))
+                         for equation in sorted(EQUATIONS)])
+    result = arcs.evaluate(masks)
+    assert [[bool(value) for value in row] for row in result] == expected
+
+
+@pytest.mark.parametrize('equation', ['A / B == 0', 'A % B == 0',
+                                      'A / (B - B) == 0', '(A + 1) % 0 == 0',
+                                      'A / B + A % B == A', '2 / A == 2'])
+def test_divide_by_zero(backend, equation):
+    # 0, with and without NumPy and for single states, without warnings
+    arcs = cond.CondArcs({'x': utils.prepare_entry(
+        name='x', is_cond=True, cond_equation=equation)})
+    masks = list(range(1 << len(arcs.pins)))
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        result = [bool(row[0]) for row in arcs.evaluate(masks)]
+        expected = list()
+        for mask in masks:
+            state = {pin: (mask >> i) & 1 for i, pin in enumerate(arcs.pins)}
+            expected.append(arcs.active(state) == ['x'])
+    assert result == expected
+
+
+def test_divide_by_zero_is_zero():
+    for equation in ('A / B == 0', 'A % B == 0'):
+        assert cond.compile_cond(equation)({'A': 1, 'B': 0})
+
+
+def test_evaluate_many_pins(backend):
+    pins = ['P{}'.format(i) for i in range(70)]
+    entries = {
+        'first': utils.prepare_entry(name='first', is_cond=True,
+                                     cond_equation='P0 && !P1'),
+        'last': utils.prepare_entry(name='last', is_cond=True,
+                                    cond_equation=' || '.join(pins[2:])),
+    }
+    arcs = cond.CondArcs(entries)
+    assert len(arcs.pins) == 70
+    result = arcs.evaluate([1, 1 << 69, 2])
+    assert [[bool(value) for value in row] for row in result] == [
+        [True, False], [False, True], [False, False]]
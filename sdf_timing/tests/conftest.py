@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+
+import pytest
+
+# tests comparing wall-clock times are only run when this variable is set
+BENCHMARKS = 'SDF_TIMING_BENCHMARKS'
+
+datafiles_path = os.path.join(os.path.dirname(__file__), 'data')
+goldenfiles_path = os.path.join(datafiles_path, 'golden')
+datafiles = sorted(f for f in os.listdir(datafiles_path) if f.endswith('.sdf'))
+
+HEADER = '(DELAYFILE (SDFVERSION "3.0") (TIMESCALE {})\n'
+
+CELL = """(CELL (CELLTYPE "{}") (INSTANCE {})
+    (DELAY (ABSOLUTE (IOPATH A Z ({}:{}:{})))))
+"""
+
+
+def make_sdf(cells, timescale='1ps'):
+    """Return an SDF file with one IOPATH A Z of every
+    (celltype, instance, delay) in ``cells``"""
+    text = HEADER.format(timescale)
+    for celltype, instance, delay in cells:
+        text += CELL.format(celltype, instance, delay, delay, delay)
+    return text + ')\n'
+
+
+def backend_fixture(module, name):
+    """Return a ``backend`` fixture which runs a test with the optional
+    ``module.name`` (numpy, orjson) when it is installed, and once more
+    with it set to None as when it is not"""
+
+    @pytest.fixture(params=[name, 'python'])
+    def backend(request, monkeypatch):
+        if request.param == name:
+            if getattr(module, name) is None:
+                pytest.skip("{} is not installed".format(name))
+        else:
+            monkeypatch.setattr(module, name, None)
+        return request.param
+
+    return backend
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'benchmark: compares wall-clock times, only run with '
+        '{}=1'.format(BENCHMARKS))
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get(BENCHMARKS):
+        return
+    skip = pytest.mark.skip(reason='set {}=1 to run'.format(BENCHMARKS))
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
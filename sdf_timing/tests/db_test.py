@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import os
+import os.path
+
+import pytest
+
+from sdf_timing import db
+from sdf_timing import sdfparse
+from sdf_timing.table import TimingTable
+
+from conftest import datafiles
+from conftest import datafiles_path
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_db(f, tmp_path):
+    with open(os.path.join(datafiles_path, f)) as sdffile:
+        timings = sdfparse.parse(sdffile.read())
+    path = str(tmp_path / 'timings.db')
+    db.write_db(timings, path)
+
+    cells = [(celltype, instance)
+             for celltype, instances in timings.get('cells', dict()).items()
+             for instance in instances]
+    with db.TimingDB(path) as timing_db:
+        assert timing_db.header == timings['header']
+        assert len(timing_db) == len(cells)
+        assert list(timing_db) == cells
+        for celltype, instance in cells:
+            assert (celltype, instance) in timing_db
+            assert timing_db.get(celltype, instance) == \
+                timings['cells'][celltype][instance]
+
+
+def test_db_split_cells(tmp_path):
+    sdf = """(DELAYFILE
+    (SDFVERSION "3.0")
+    (CELL (CELLTYPE "buf") (INSTANCE b)
+        (DELAY (ABSOLUTE (IOPATH A Z (1:2:3)))))
+    (CELL (CELLTYPE "buf") (INSTANCE)
+        (DELAY (ABSOLUTE (IOPATH A Z (1:2:3)))))
+    (CELL (CELLTYPE "buf") (INSTANCE b)
+        (DELAY (ABSOLUTE (IOPATH A Z (4:5:6)) (IOPATH B Z ()))))
+)"""
+    table = TimingTable.from_events(sdfparse.iterparse(io.StringIO(sdf)))
+    strings = list(table.strings)
+    path = str(tmp_path / 'timings.db')
+    db.write_db(table, path)
+    # the table of the caller is not changed
+    assert table.strings == strings
+
+    timings = sdfparse.parse(sdf)
+    with db.TimingDB(path) as timing_db:
+        assert timing_db.get('buf', 'b') == timings['cells']['buf']['b']
+        assert timing_db.get('buf', None) == timings['cells']['buf'][None]
+        assert ('buf', 'c') not in timing_db
+        with pytest.raises(KeyError):
+            timing_db.get('inv', 'b')
+
+
+def test_db_not_a_db(tmp_path):
+    path = str(tmp_path / 'timings.db')
+    with open(path, 'wb') as fp:
+        fp.write(b'(DELAYFILE)' * 16)
+    with pytest.raises(Exception, match="Not an SDF timing database"):
+        db.TimingDB(path)
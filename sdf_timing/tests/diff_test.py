@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+
+import pytest
+
+from sdf_timing import sdfparse
+from sdf_timing.__main__ import main
+from sdf_timing.diff import Diff
+
+from conftest import datafiles
+from conftest import datafiles_path
+from conftest import make_sdf
+
+
+def write_sdf(path, cells, timescale='1ns'):
+    with open(path, 'w') as fp:
+        fp.write(make_sdf(cells, timescale))
+    return path
+
+
+def differences(diff):
+    return [(d.kind, d.celltype, d.instance, d.name) for d in diff]
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_diff_same_file(f):
+    path = os.path.join(datafiles_path, f)
+    diff = Diff(path, path)
+    assert list(diff) == []
+
+    with open(path) as fp:
+        timings = sdfparse.parse(fp.read())
+    assert diff.identical == sum(
+        len(instances) for instances in timings.get('cells', {}).values())
+
+
+def test_diff_emitted_file(tmpdir):
+    # the same timings written differently, all the cells are parsed
+    path = os.path.join(datafiles_path, 'timings_hx1k.sdf')
+    with open(path) as fp:
+        timings = sdfparse.parse(fp.read())
+    emitted = str(tmpdir.join('emitted.sdf'))
+    with open(emitted, 'w') as fp:
+        sdfparse.write(timings, fp, timings['header']['timescale'])
+
+    diff = Diff(path, emitted)
+    assert list(diff) == []
+    assert diff.identical == 0
+
+
+def test_diff_arcs(tmpdir):
+    a = write_sdf(str(tmpdir.join('a.sdf')), [
+        ('buf', 'b0', 1),
+        ('buf', 'b1', 1),
+        ('buf', 'b2', 1),
+        ('inv', 'i0', 1),
+    ])
+    b = write_sdf(str(tmpdir.join('b.sdf')), [
+        ('buf', 'b0', 1),
+        ('inv', 'i0', 1),
+        ('buf', 'b2', 1.5),
+        ('buf', 'b3', 1),
+    ])
+    diff = Diff(a, b)
+    assert differences(diff) == [
+        ('removed', 'buf', 'b1', 'iopath_A_Z'),
+        ('changed', 'buf', 'b2', 'iopath_A_Z'),
+        ('added', 'buf', 'b3', 'iopath_A_Z'),
+    ]
+    assert diff.identical == 2
+
+    # the files are compared again
+    changed = list(diff)[1]
+    assert changed.changes == [('nominal.min', 1.0, 1.5),
+                               ('nominal.avg', 1.0, 1.5),
+                               ('nominal.max', 1.0, 1.5)]
+    assert str(changed).startswith(
+        '~ buf b2 iopath_A_Z nominal.min: 1.0 -> 1.5, ')
+
+    assert differences(Diff(a, b, tolerance=0.5))[1:] == [
+        ('added', 'buf', 'b3', 'iopath_A_Z')]
+    assert len(list(Diff(a, b, relative=0.3))) == 3
+    assert len(list(Diff(a, b, relative=0.4))) == 2
+
+
+def test_diff_timescales(tmpdir):
+    cells = [('buf', 'b0', 1)]
+    a = write_sdf(str(tmpdir.join('a.sdf')), cells, '1ns')
+    b = write_sdf(str(tmpdir.join('b.sdf')),
+                  [('buf', 'b0', 1000.25)], '1ps')
+    diff = list(Diff(a, b, tolerance=0.001))
+    assert [d.kind for d in diff] == ['header']
+    assert diff[0].changes == [('timescale', '1ns', '1ps')]
+
+    # the same text in a different timescale has different values
+    b = write_sdf(str(tmpdir.join('b.sdf')), cells, '1ps')
+    diff = Diff(a, b)
+    assert differences(diff) == [
+        ('header', None, None, 'timescale'),
+        ('changed', 'buf', 'b0', 'iopath_A_Z')]
+    assert diff.identical == 0
+    changes = list(diff)[1].changes
+    assert changes[0] == ('nominal.min', 1.0, 0.001)
+
+
+def test_main_diff(tmpdir, capsys):
+    a = write_sdf(str(tmpdir.join('a.sdf')), [('buf', 'b0', 1)])
+    b = write_sdf(str(tmpdir.join('b.sdf')), [('buf', 'b0', 2)])
+    assert main(['diff', a, a]) == 0
+    assert main(['diff', a, b, '--lexer', 'fast']) == 1
+    out = capsys.readouterr().out.splitlines()
+    assert out[-2].startswith('~ buf b0 iopath_A_Z nominal.min: 1.0 -> 2.0')
+    assert out[-1] == ('0 identical cells, 0 added, 0 removed, 1 changed '
+                       'arcs, 0 header fields')
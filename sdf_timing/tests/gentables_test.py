@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import subprocess
+import sys
+
+from sdf_timing import gentables
+
+
+def test_tables_up_to_date():
+    # run `python -m sdf_timing.gentables` if this fails
+    assert gentables.check_tables() == []
+
+
+def test_write_tables(tmpdir):
+    gentables.write_tables(str(tmpdir))
+    assert sorted(os.listdir(str(tmpdir))) == [
+        '_cellparsetab.py', '_lextab.py', '_parsetab.py']
+
+
+def test_parsers_built_lazily():
+    code = ("from sdf_timing import sdfparse, sdfyacc\n"
+            "assert not sdfyacc._parsers\n"
+            "sdfparse.parse('(DELAYFILE (SDFVERSION \"3.0\"))')\n"
+            "assert list(sdfyacc._parsers) == [None, 'cell_list']\n")
+    root = os.path.dirname(gentables.PACKAGE_DIR)
+    subprocess.check_call([sys.executable, '-c', code], cwd=root)
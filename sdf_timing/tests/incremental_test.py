@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+
+import pytest
+
+from sdf_timing import sdfparse
+from sdf_timing.incremental import IncrementalSDF
+
+from conftest import datafiles
+from conftest import datafiles_path
+from conftest import make_sdf
+
+
+def max_delay(entries):
+    return entries['iopath_A_Z']['delay_paths']['nominal']['max']
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_incremental_same_as_parse(f):
+    path = os.path.join(datafiles_path, f)
+    with open(path) as fp:
+        timings = sdfparse.parse(fp.read())
+    sdf = IncrementalSDF(path)
+    assert sdf.timings == timings
+
+    # a second update with the same contents parses nothing
+    changes = sdf.update_file(path)
+    assert not changes
+    assert changes.parsed == 0
+    assert sdf.timings == timings
+
+
+def test_incremental_changes():
+    sdf = IncrementalSDF()
+    sdf.update(make_sdf([('buf', 'b{}'.format(i), i) for i in range(5)]))
+    b1 = sdf.timings['cells']['buf']['b1']
+
+    text = make_sdf([
+        ('buf', 'b0', 0),
+        ('buf', 'b1', 10),
+        ('buf', 'b3', 3),
+        ('inv', 'i0', 1),
+        ('buf', 'b4', 4),
+    ])
+    changes = sdf.update(text)
+    assert changes.added == [('inv', 'i0')]
+    assert changes.removed == [('buf', 'b2')]
+    assert changes.changed == [('buf', 'b1')]
+    assert not changes.header
+    assert changes.parsed == 2
+    assert sdf.timings == sdfparse.parse(text)
+    # the entries are updated in place
+    assert sdf.timings['cells']['buf']['b1'] is b1
+    assert max_delay(b1) == 10.0
+
+    # the spans point into the new version
+    offset, size, lineno = sdf.spans['inv', 'i0'][0]
+    assert text.encode()[offset:offset + size].startswith(b'(CELL')
+    assert lineno == 8
+
+
+def test_incremental_header_and_removed_celltype():
+    sdf = IncrementalSDF()
+    sdf.update(make_sdf([('buf', 'b0', 1), ('inv', 'i0', 1)]))
+    changes = sdf.update(make_sdf([('buf', 'b0', 1)], '1ns'))
+    assert changes.header
+    assert changes.removed == [('inv', 'i0')]
+    assert changes.parsed == 0
+    assert sdf.timings['header']['timescale'] == '1ns'
+    assert list(sdf.timings['cells']) == ['buf']
+
+    sdf.update(make_sdf([]))
+    assert 'cells' not in sdf.timings
+
+
+def test_incremental_split_cell():
+    # a cell split over several blocks is parsed again as a whole
+    cells = [('buf', 'b0', 1), ('buf', 'b1', 1), ('buf', 'b0', 2)]
+    sdf = IncrementalSDF()
+    sdf.update(make_sdf(cells))
+    assert max_delay(sdf.timings['cells']['buf']['b0']) == 2.0
+
+    cells[2] = ('buf', 'b0', 3)
+    text = make_sdf(cells)
+    changes = sdf.update(text)
+    assert changes.changed == [('buf', 'b0')]
+    assert sdf.timings == sdfparse.parse(text)
+    assert len(sdf.spans['buf', 'b0']) == 2
+
+    # the last block alone is removed, the cell stays
+    changes = sdf.update(make_sdf(cells[:2]))
+    assert changes.changed == [('buf', 'b0')]
+    assert max_delay(sdf.timings['cells']['buf']['b0']) == 1.0
+
+
+def test_incremental_syntax_error_line():
+    sdf = IncrementalSDF()
+    text = make_sdf([('buf', 'b0', 1), ('buf', 'b1', 1)])
+    sdf.update(text)
+    timings = sdfparse.parse(text)
+    head, tail = text.rsplit('(1:1:1)', 1)
+    with pytest.raises(Exception, match="line: 5"):
+        sdf.update(head + '(1:1:1) DELAY' + tail)
+    # a failed update leaves the previous version
+    assert sdf.timings == timings
+    assert not sdf.update(text)
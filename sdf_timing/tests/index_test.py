@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import os.path
+import time
+
+import pytest
+
+from sdf_timing import sdfparse
+from sdf_timing.index import TimingIndex
+
+from conftest import datafiles
+from conftest import datafiles_path
+
+
+def parse(f):
+    with open(os.path.join(datafiles_path, f)) as sdffile:
+        return sdfparse.parse(sdffile.read())
+
+
+def scan(timings, **query):
+    """Naive query over the timings dict"""
+    result = list()
+    for celltype, instances in timings.get('cells', dict()).items():
+        if 'celltype' in query and celltype != query['celltype']:
+            continue
+        for instance, entries in instances.items():
+            for entry in entries.values():
+                if all(entry[field] == value for field, value in query.items()
+                       if field != 'celltype'):
+                    result.append((celltype, instance, entry))
+    return result
+
+
+def queries(timings):
+    """A query for every value of every field and some combinations"""
+    for celltype, instances in timings.get('cells', dict()).items():
+        yield dict(celltype=celltype)
+        for entries in instances.values():
+            for entry in entries.values():
+                yield dict(to_pin=entry['to_pin'])
+                yield dict(from_pin=entry['from_pin'], type=entry['type'])
+                yield dict(type=entry['type'], is_cond=entry['is_cond'],
+                           celltype=celltype)
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_query(f):
+    timings = parse(f)
+    index = TimingIndex(timings)
+    for query in queries(timings):
+        assert index.query(**query) == scan(timings, **query)
+    assert index.query(to_pin='no such pin') == []
+    assert len(index.query()) == len(index)
+
+
+def test_unknown_field():
+    with pytest.raises(Exception, match="Unknown field 'to'"):
+        TimingIndex(dict()).query(to='O')
+
+
+@pytest.mark.benchmark
+def test_query_benchmark():
+    # 100 copies of every cell of timings_hx1k
+    timings = parse('timings_hx1k.sdf')
+    for instances in timings['cells'].values():
+        for instance in list(instances):
+            for i in range(100):
+                instances['{}_{}'.format(instance, i)] = instances[instance]
+    index = TimingIndex(timings)
+    query = dict(type='setup', from_pin='clk')
+
+    start = time.perf_counter()
+    expected = scan(timings, **query)
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = index.query(**query)
+    index_time = time.perf_counter() - start
+
+    print("{} entries, {} results, scan: {:.2f} ms, index: {:.2f} ms".format(
+        len(index), len(result), scan_time * 1e3, index_time * 1e3))
+    assert result == expected
+    assert index_time < scan_time / 10
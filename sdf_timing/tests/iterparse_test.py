@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import os
+import os.path
+
+import pytest
+
+from sdf_timing import sdfparse
+
+from conftest import datafiles
+from conftest import datafiles_path
+
+
+def collect(events):
+    timings = dict()
+    cells = dict()
+    for celltype, instance, entries in events:
+        if celltype is None and instance is None:
+            assert not cells, "header must come first"
+            timings['header'] = entries
+            continue
+        cells.setdefault(celltype, dict()).setdefault(instance, dict())
+        cells[celltype][instance].update(entries)
+    if cells:
+        timings['cells'] = cells
+    return timings
+
+
+@pytest.mark.parametrize('f', datafiles)
+@pytest.mark.parametrize('chunk_size', [7, 1 << 20])
+def test_iterparse(f, chunk_size):
+    with open(os.path.join(datafiles_path, f)) as sdffile:
+        expected = sdfparse.parse(sdffile.read())
+
+    with open(os.path.join(datafiles_path, f), 'rb') as sdffile:
+        timings = collect(sdfparse.iterparse(sdffile, chunk_size))
+
+    assert timings == expected
+
+
+def test_iterparse_error_line():
+    sdf = """(DELAYFILE
+    (SDFVERSION "3.0")
+    (CELL
+        (CELLTYPE "buf")
+        (INSTANCE b)
+        (DELAY (ABSOLUTE (IOPATH A Z (1:2:3) DELAY)))
+    )
+)"""
+    events = sdfparse.iterparse(io.StringIO(sdf))
+    assert next(events) == (None, None, {'sdfversion': '3.0'})
+    with pytest.raises(Exception, match="line: 6"):
+        next(events)
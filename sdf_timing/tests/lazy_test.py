@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import os.path
+import re
+
+import pytest
+
+from sdf_timing import lazy
+from sdf_timing import sdfparse
+from sdf_timing.lazy import LazySDF
+
+from conftest import datafiles
+from conftest import datafiles_path
+
+
+def check(path):
+    with open(path) as sdffile:
+        timings = sdfparse.parse(sdffile.read())
+    cells = dict(((celltype, instance), entries)
+                 for celltype, instances in timings.get('cells', {}).items()
+                 for instance, entries in instances.items())
+
+    sdf = LazySDF(path, cache_size=2)
+    assert sdf.header == timings['header']
+    # the cells come in file order, not grouped by celltype
+    assert sorted(sdf, key=str) == sorted(cells, key=str)
+    for key, entries in cells.items():
+        assert sdf[key] == entries
+    assert len(sdf.cache) == min(2, len(cells))
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_lazy(f):
+    check(os.path.join(datafiles_path, f))
+
+
+@pytest.mark.parametrize('f', ['timings_hx1k.sdf', 'spec-example1.sdf'])
+def test_lazy_parsed_keys(f, monkeypatch):
+    # the keys of cells which are not matched are taken from parsing them
+    monkeypatch.setattr(lazy, '_cell_key_re', re.compile(b'^$'))
+    check(os.path.join(datafiles_path, f))
+
+
+def test_lazy_missing_cell():
+    sdf = LazySDF(os.path.join(datafiles_path, 'test1.sdf'))
+    assert ('no', 'such') not in sdf
+    with pytest.raises(KeyError):
+        sdf['no', 'such']
+
+
+def test_lazy_parses_on_access(tmp_path):
+    # the body of a cell is only parsed when it is accessed
+    path = str(tmp_path / 'broken.sdf')
+    with open(path, 'w') as fp:
+        fp.write("""(DELAYFILE (SDFVERSION "3.0")
+    (CELL (CELLTYPE "buf") (INSTANCE good)
+        (DELAY (ABSOLUTE (IOPATH A Z (1:2:3)))))
+    (CELL (CELLTYPE "buf") (INSTANCE bad)
+        (DELAY (ABSOLUTE (IOPATH A Z (1:2:3) DELAY)))))""")
+    sdf = LazySDF(path)
+    assert list(sdf) == [('buf', 'good'), ('buf', 'bad')]
+    assert list(sdf['buf', 'good']) == ['iopath_A_Z']
+    with pytest.raises(Exception, match="line: 5"):
+        sdf['buf', 'bad']
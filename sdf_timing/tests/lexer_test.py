@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import os.path
+import time
+
+import pytest
+
+from sdf_timing import sdflex
+from sdf_timing import sdfparse
+
+from conftest import datafiles
+from conftest import datafiles_path
+
+operators = """(COND A&&B||!C==1'b0 ~^ x ^~ y === z !== w << 2 >= 3 <= - .5
+-2 . * / 0'b1 1'B0 'b1 % + ~& ~| & | ^ > < != "a (b)" 1abc a/b.c\\[0\\] r>>)
+\n  \t x"""
+
+
+def tokens(lexer, data):
+    lexer.lineno = 1
+    lexer.input(data)
+    return [(t.type, t.value, t.lineno) for t in lexer]
+
+
+def read(f):
+    with open(os.path.join(datafiles_path, f)) as sdffile:
+        return sdffile.read()
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_same_tokens(f):
+    data = read(f)
+    assert tokens(sdflex.FastLexer(), data) == \
+        tokens(sdflex.lexer.clone(), data)
+
+
+def test_same_tokens_operators():
+    assert tokens(sdflex.FastLexer(), operators) == \
+        tokens(sdflex.lexer.clone(), operators)
+
+
+@pytest.mark.parametrize('data', ['(A = B)', '(A\r\n)', '\n\n"abc'])
+def test_same_errors(data):
+    with pytest.raises(Exception) as ply_error:
+        tokens(sdflex.lexer.clone(), data)
+    with pytest.raises(Exception) as fast_error:
+        tokens(sdflex.FastLexer(), data)
+    assert str(fast_error.value) == str(ply_error.value)
+
+
+def test_same_syntax_errors():
+    data = '(DELAYFILE (SDFVERSION "3.0")\n(CELL (CELLTYPE "x") DELAY))'
+    with pytest.raises(Exception) as ply_error:
+        sdfparse.parse(data)
+    with pytest.raises(Exception) as fast_error:
+        sdfparse.parse(data, lexer='fast')
+    assert str(fast_error.value) == str(ply_error.value)
+    assert str(fast_error.value) == "Syntax error at 'DELAY' line: 2"
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_parse_fast_lexer(f):
+    data = read(f)
+    assert sdfparse.parse(data, lexer='fast') == sdfparse.parse(data)
+
+
+def tokens_per_second(lexer, data, repeat=3):
+    best = None
+    for i in range(repeat):
+        lexer.lineno = 1
+        # CPU time, other processes do not count
+        start = time.process_time()
+        lexer.input(data)
+        count = sum(1 for t in lexer)
+        elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return count / best
+
+
+@pytest.mark.benchmark
+def test_fast_lexer_benchmark():
+    # about 3x, the findall() and the creation of the token objects take
+    # most of the time of the fast lexer
+    data = read('timings_hx1k.sdf') * 10
+    ply_rate = tokens_per_second(sdflex.lexer.clone(), data)
+    fast_rate = tokens_per_second(sdflex.FastLexer(), data)
+    print("ply: {:.0f} tokens/s, fast: {:.0f} tokens/s ({:.1f}x)".format(
+        ply_rate, fast_rate, fast_rate / ply_rate))
+    assert fast_rate > 2.5 * ply_rate
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import os
+
+import pytest
+
+from sdf_timing import merge
+from sdf_timing import sdfparse
+from sdf_timing.merge import Merger
+
+from conftest import datafiles_path
+
+SDF = """(DELAYFILE (SDFVERSION "3.0") (TIMESCALE {timescale})
+    (CELL (CELLTYPE "buf") (INSTANCE b)
+        (DELAY ({kind} (IOPATH A Z {delay})))
+        (TIMINGCHECK (SETUP D (posedge CLK) ({setup}:{setup}:{setup}))))
+)
+"""
+
+
+def make_sdf(kind='ABSOLUTE', delay='(1:2:3)', setup=1, timescale='1ns'):
+    return sdfparse.parse(SDF.format(kind=kind, delay=delay, setup=setup,
+                                     timescale=timescale))
+
+
+def iopath(merger):
+    return merger.cells['buf']['b']['iopath_A_Z']['delay_paths']
+
+
+def setup(merger):
+    return merger.cells['buf']['b']['setup_CLK_D']['delay_paths'][
+        'nominal']['max']
+
+
+def test_increments_are_added():
+    merger = Merger()
+    merger.add(make_sdf())
+    merger.add(make_sdf('INCREMENT', '(1:1:1)'))
+    merger.add(make_sdf('INCREMENT', '(::1)'))
+    assert iopath(merger) == {'nominal': {'min': 2.0, 'avg': 3.0,
+                                          'max': 5.0}}
+    assert merger.cells['buf']['b']['iopath_A_Z']['is_absolute']
+    assert merger.sources == 3
+
+
+def test_increment_of_rise_and_fall():
+    merger = Merger()
+    merger.add(make_sdf())
+    merger.add(make_sdf('INCREMENT', '(1:1:1) (2:2:2)'))
+    assert iopath(merger) == {
+        'fast': {'min': 2.0, 'avg': 3.0, 'max': 4.0},
+        'slow': {'min': 3.0, 'avg': 4.0, 'max': 5.0},
+    }
+
+
+def test_increment_without_absolute():
+    merger = Merger()
+    merger.add(make_sdf('INCREMENT', '(1:1:1)'))
+    merger.add(make_sdf('INCREMENT', '(1:1:1)'))
+    entry = merger.cells['buf']['b']['iopath_A_Z']
+    assert entry['is_incremental']
+    assert entry['delay_paths']['nominal']['max'] == 2.0
+
+    # an absolute value replaces the increments whatever the policy
+    merger = Merger('error')
+    merger.add(make_sdf('INCREMENT', '(1:1:1)'))
+    merger.add(make_sdf(delay='(5:5:5)'))
+    assert iopath(merger)['nominal']['max'] == 5.0
+
+
+@pytest.mark.parametrize('policy, expected', [
+    ('last', (2.0, 4.0)),
+    ('first', (3.0, 1.0)),
+    ('min', (2.0, 1.0)),
+    ('max', (3.0, 4.0)),
+])
+def test_policies(policy, expected):
+    merger = Merger(policy)
+    merger.add(make_sdf(delay='(1:2:3)', setup=1))
+    merger.add(make_sdf(delay='(0:1:2)', setup=4))
+    assert (iopath(merger)['nominal']['max'], setup(merger)) == expected
+
+
+def test_policy_error():
+    merger = Merger('error')
+    merger.add(make_sdf())
+    # the same values are not a conflict
+    merger.add(make_sdf())
+    with pytest.raises(Exception, match="Conflicting values of iopath_A_Z"):
+        merger.add(make_sdf(delay='(0:1:2)'))
+
+    with pytest.raises(Exception, match="Unknown policy"):
+        Merger('average')
+
+
+def test_timescales():
+    merger = Merger(timescale='1ps')
+    merger.add(make_sdf(timescale='1ns'))
+    merger.add(make_sdf('INCREMENT', '(10:10:10)', timescale='10ps'))
+    assert iopath(merger) == {'nominal': {'min': 1100.0, 'avg': 2100.0,
+                                          'max': 3100.0}}
+    assert merger.header['timescale'] == '1ps'
+
+
+def test_merge_files(tmp_path):
+    paths = list()
+    for i, text in enumerate([
+            SDF.format(kind='ABSOLUTE', delay='(1:2:3)', setup=1,
+                       timescale='1ns'),
+            SDF.format(kind='INCREMENT', delay='(1:1:1)', setup=2,
+                       timescale='1ns')]):
+        paths.append(str(tmp_path / '{}.sdf'.format(i)))
+        with open(paths[-1], 'w') as fp:
+            fp.write(text)
+
+    out = io.StringIO()
+    merger = merge.merge_files(paths, out)
+    timings = sdfparse.parse(out.getvalue())
+    assert timings['header']['timescale'] == '1ns'
+    entries = timings['cells']['buf']['b']
+    assert entries['iopath_A_Z']['delay_paths']['nominal'] == {
+        'min': 2.0, 'avg': 3.0, 'max': 4.0}
+    assert entries['iopath_A_Z']['is_absolute']
+    assert entries['setup_CLK_D']['delay_paths']['nominal']['max'] == 2.0
+    assert merger.timings()['cells'] == merger.cells
+
+    output = str(tmp_path / 'merged.sdf')
+    assert merge.main(paths + ['--output', output, '--lexer', 'fast']) == 0
+    with open(output) as fp:
+        assert fp.read() == out.getvalue()
+
+
+def test_merge_same_as_parse():
+    # a single file merges to itself
+    path = os.path.join(datafiles_path, 'timings_hx1k.sdf')
+    merger = Merger()
+    merger.add_file(path)
+    with open(path) as fp:
+        timings = sdfparse.parse(fp.read())
+    assert merger.timings() == timings
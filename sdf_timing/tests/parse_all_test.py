@@ -18,6 +18,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
+import concurrent.futures
+import copy
+import json
 import os
 import os.path
 
@@ -65,3 +68,74 @@ def test_output_stability():
 def test_parse_generated():
     for s in generated_sdfs:
         sdfparse.parse(s)
+
+
+def test_parse_independent_results():
+    files = sorted(f for f in os.listdir(datafiles_path) if f.endswith('.sdf'))
+    with open(os.path.join(datafiles_path, files[0])) as sdffile:
+        first = sdfparse.parse(sdffile.read())
+    expected = copy.deepcopy(first)
+    with open(os.path.join(datafiles_path, files[1])) as sdffile:
+        sdfparse.parse(sdffile.read())
+    assert first == expected
+
+
+def test_init_compatible():
+    # init() is kept for old callers, parses do not need it any more
+    sdfparse.init()
+    assert sdfparse.parse(generated_sdfs[0]) == sdfparse.parse(
+        generated_sdfs[0])
+
+
+def test_parse_threads():
+    inputs = list()
+    for f in sorted(os.listdir(datafiles_path)):
+        if f.endswith('.sdf'):
+            with open(os.path.join(datafiles_path, f)) as sdffile:
+                inputs.append(sdffile.read())
+    expected = [sdfparse.parse(s) for s in inputs]
+
+    def parse_all(lexer):
+        parser = sdfparse.SDFParser(lexer)
+        return [copy.deepcopy(parser.parse(s)) for s in inputs]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(parse_all, ['ply', 'fast'] * 8))
+
+    for result in results:
+        assert result == expected
+
+
+def test_parse_parallel():
+    for f in sorted(os.listdir(datafiles_path)):
+        if not f.endswith('.sdf'):
+            continue
+        path = os.path.join(datafiles_path, f)
+        with open(path) as sdffile:
+            expected = sdfparse.parse(sdffile.read())
+        for chunk_size in (1, None):
+            timings = sdfparse.parse_parallel(path, workers=2,
+                                              chunk_size=chunk_size)
+            # compare the order of the keys as well
+            assert json.dumps(timings) == json.dumps(expected)
+
+
+def test_cond_applies_to_its_entries_only():
+    # the entries before and after a COND in the same ABSOLUTE block share
+    # its delay list and must not get its condition
+    timings = sdfparse.parse("""(DELAYFILE (SDFVERSION "3.0")
+    (CELL (CELLTYPE "and") (INSTANCE a) (DELAY (ABSOLUTE
+        (IOPATH A Z (1:1:1))
+        (COND B == 1 (IOPATH B Z (2:2:2)))
+        (COND (C == 0) (IOPATH C Z (3:3:3)) (IOPATH D Z (4:4:4)))
+        (IOPATH E Z (5:5:5))))))""")
+    entries = timings['cells']['and']['a']
+    conditions = {name: (entry['is_cond'], entry['cond_equation'])
+                  for name, entry in entries.items()}
+    assert conditions == {
+        'iopath_A_Z': (False, None),
+        'iopath_B_Z': (True, 'B == 1'),
+        'iopath_C_Z': (True, 'C == 0'),
+        'iopath_D_Z': (True, 'C == 0'),
+        'iopath_E_Z': (False, None),
+    }
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import json
+import os
+
+import pytest
+
+from sdf_timing import sdfjson
+from sdf_timing import sdfparse
+from sdf_timing.__main__ import main
+
+from conftest import backend_fixture
+from conftest import datafiles
+from conftest import datafiles_path
+
+
+backend = backend_fixture(sdfjson, 'orjson')
+
+
+def parse(f):
+    with open(os.path.join(datafiles_path, f)) as sdffile:
+        return sdfparse.parse(sdffile.read())
+
+
+def dumps(timings, format):
+    fp = io.StringIO()
+    sdfjson.dump(timings, fp, format)
+    return fp.getvalue()
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_formats(f, backend):
+    timings = parse(f)
+    # JSON turns the None instance into "null"
+    document = json.loads(json.dumps(timings))
+
+    pretty = dumps(timings, 'pretty')
+    assert pretty == json.dumps(timings, indent=4, sort_keys=True)
+    compact = dumps(timings, 'compact')
+    assert json.loads(compact) == document
+    assert '\n' not in compact
+    ndjson = dumps(timings, 'ndjson')
+    assert len(ndjson.splitlines()) == 1 + sum(
+        len(instances) for instances in timings.get('cells', {}).values())
+
+    assert sdfjson.load(io.StringIO(pretty)) == document
+    assert sdfjson.load(io.StringIO(compact)) == document
+    assert sdfjson.load(io.StringIO(ndjson)) == timings
+
+
+def test_compact_json_backend(monkeypatch):
+    timings = parse('timings_hx1k.sdf')
+    monkeypatch.setattr(sdfjson, 'orjson', None)
+    assert dumps(timings, 'compact') == json.dumps(
+        timings, sort_keys=True, separators=(',', ':'))
+
+
+def test_load_events_stream():
+    lines = [
+        '{"header": {"sdfversion": "3.0"}}\n',
+        '{"celltype": "buf", "instance": "b1", "entries": {}}\n',
+        '{"celltype": "buf", "instance": null, "entries": {}}\n',
+    ]
+
+    def stream():
+        # fails if more than the current line is read
+        for line in lines:
+            yield line
+
+    class LineReader(object):
+        def __init__(self):
+            self.lines = stream()
+
+        def readline(self):
+            return next(self.lines)
+
+        def __iter__(self):
+            return self.lines
+
+    events = sdfjson.load_events(LineReader())
+    assert next(events) == (None, None, {'sdfversion': '3.0'})
+    assert next(events) == ('buf', 'b1', {})
+    assert list(events) == [('buf', None, {})]
+
+
+def test_unknown_format():
+    with pytest.raises(Exception, match='Unknown format'):
+        dumps({}, 'yaml')
+
+
+@pytest.mark.parametrize('format', sdfjson.FORMATS)
+def test_main_format(tmpdir, format):
+    sdf = os.path.join(datafiles_path, 'timings_hx1k.sdf')
+    output = str(tmpdir.join('out.json'))
+    emitted = str(tmpdir.join('out.sdf'))
+    assert main(['--sdf', sdf, '--json', output, '--format', format]) == 0
+    assert main(['--emit', '--sdf', emitted, '--json', output]) == 0
+
+    with open(output) as fp:
+        assert sdfjson.load(fp) == json.loads(json.dumps(parse(sdf)))
+    with open(emitted) as fp:
+        assert sdfparse.parse(fp.read()) == parse(sdf)
+
+
+def test_main_emit_sorted(tmpdir):
+    document = str(tmpdir.join('cells.json'))
+    with open(document, 'w') as fp:
+        fp.write('{"cells": {"inv": {"i": {}}, "buf": {"b2": {}, "b1": {}}}, '
+                 '"header": {}}')
+    emitted = str(tmpdir.join('out.sdf'))
+    assert main(['--emit', '--sdf', emitted, '--json', document]) == 0
+    with open(emitted) as fp:
+        text = fp.read()
+    assert text.index('b1') < text.index('b2') < text.index('(INSTANCE i)')
+
+
+def test_main_emit_keeps_output_on_error(tmpdir):
+    emitted = tmpdir.join('out.sdf')
+    emitted.write('old')
+    for text in ('{"cells": ', '{"header": {}}\n{"celltype": "buf"'):
+        bad = tmpdir.join('bad.json')
+        bad.write(text)
+        with pytest.raises(ValueError):
+            main(['--emit', '--sdf', str(emitted), '--json', str(bad)])
+        assert emitted.read() == 'old'
+    assert sorted(tmpdir.listdir()) == [bad, emitted]
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+import os
+import os.path
+import time
+
+import pytest
+
+from sdf_timing import sdfparse
+from sdf_timing import sdfwrite
+
+from conftest import datafiles
+from conftest import datafiles_path
+from conftest import goldenfiles_path
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_golden(f):
+    with open(os.path.join(datafiles_path, f)) as sdffile:
+        timings = sdfparse.parse(sdffile.read())
+    # compare bytes, without newline translation
+    with open(os.path.join(goldenfiles_path, f), 'rb') as sdffile:
+        golden = sdffile.read()
+    assert sdfparse.emit(timings).encode() == golden
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_write_sdf(f):
+    with open(os.path.join(datafiles_path, f)) as sdffile:
+        timings = sdfparse.parse(sdffile.read())
+    fileobj = io.StringIO()
+    sdfwrite.write_sdf(timings, fileobj)
+    assert fileobj.getvalue() == sdfparse.emit(timings)
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_write_sdf_stream(f):
+    # the cells of the golden files are sorted, so streaming them through
+    # iterparse() gives the same result as parsing and emitting them
+    with open(os.path.join(goldenfiles_path, f)) as sdffile:
+        expected = sdfparse.emit(sdfparse.parse(sdffile.read()))
+    with open(os.path.join(goldenfiles_path, f), 'rb') as sdffile:
+        fileobj = io.StringIO()
+        sdfwrite.write_sdf(sdfparse.iterparse(sdffile, chunk_size=64),
+                           fileobj)
+    assert fileobj.getvalue() == expected
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_emit_entries(f):
+    with open(os.path.join(datafiles_path, f)) as sdffile:
+        timings = sdfparse.parse(sdffile.read())
+    emitted = sdfparse.emit(timings)
+    for instances in timings.get('cells', dict()).values():
+        for location, entries in instances.items():
+            sections = sdfwrite.emit_delay_entries(entries) \
+                + sdfwrite.emit_timingcheck_entries(entries) \
+                + sdfwrite.emit_timingenv_entries(entries)
+            if location is None:
+                location = ""
+            assert "(INSTANCE {}){}\n    )".format(location, sections) \
+                in emitted
+
+
+def test_none_in_names():
+    sdf = """(DELAYFILE
+    (SDFVERSION "3.0")
+    (CELL
+        (CELLTYPE "NoneCell")
+        (INSTANCE None_1)
+        (DELAY (ABSOLUTE (IOPATH ANone Z (::1) ())))
+    )
+)"""
+    emitted = sdfparse.emit(sdfparse.parse(sdf))
+    assert '(CELLTYPE "NoneCell")' in emitted
+    assert '(INSTANCE None_1)' in emitted
+    assert '(IOPATH ANone Z (::1.0)())' in emitted
+
+
+def best_time(function, repeat=5):
+    best = None
+    for i in range(repeat):
+        start = time.process_time()
+        function()
+        elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def test_emit_benchmark():
+    # The budget is relative to the parse time of the same design, so that
+    # it does not depend on the speed of the machine. Emitting takes 1/10
+    # to 1/18 of the parse time (the 384 arcs of the design), emitting the
+    # document once per top-level key took 1/6.
+    with open(os.path.join(datafiles_path, 'timings_hx1k.sdf')) as sdffile:
+        data = sdffile.read()
+    timings = sdfparse.parse(data)
+    parse_time = best_time(lambda: sdfparse.parse(data))
+    emit_time = best_time(lambda: sdfparse.emit(timings))
+    print("parse: {:.1f} ms, emit: {:.1f} ms".format(
+        parse_time * 1e3, emit_time * 1e3))
+    assert emit_time < parse_time / 7
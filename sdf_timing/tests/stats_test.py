@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+
+from sdf_timing import bench
+from sdf_timing import sdfparse
+from sdf_timing import stats as parse_stats
+
+SDF = bench.generate(cells=20, arcs_per_cell=5, seed=2)
+
+
+@pytest.mark.parametrize('lexer', ['ply', 'fast'])
+def test_stats(lexer):
+    stats = parse_stats.Stats()
+    timings = sdfparse.parse(SDF, lexer, stats=stats)
+    assert timings == sdfparse.parse(SDF, lexer)
+
+    assert stats.cell_entries == {5: 20}
+    assert stats.tokens['CELL'] == 20
+    assert stats.tokens['LPAR'] == stats.tokens['RPAR'] == SDF.count('(')
+    cells = [rule for rule in stats.reductions if rule.startswith('cell ->')]
+    assert sum(stats.reductions[rule] for rule in cells) == 20
+
+    sdfparse.emit(timings, stats=stats)
+    phases = stats.phases()
+    for phase in ('parse', 'lex', 'lr', 'entries', 'merge', 'actions',
+                  'emit'):
+        assert phases[phase] > 0
+    parts = sum(phases[phase] for phase in
+                ('lex', 'lr', 'entries', 'merge', 'actions'))
+    assert parts == pytest.approx(phases['parse'])
+
+    data = json.loads(stats.to_json())
+    assert data['cell_entries'] == {'5': 20}
+    assert data['tokens']['CELL'] == 20
+
+
+def test_stats_accumulate():
+    stats = parse_stats.Stats()
+    parser = sdfparse.SDFParser(stats=stats)
+    parser.parse(SDF)
+    parser.parse(SDF)
+    assert stats.tokens['CELL'] == 40
+    assert stats.cell_entries == {5: 40}
+
+
+def test_stats_env(tmpdir, monkeypatch):
+    path = str(tmpdir.join('stats.jsonl'))
+    monkeypatch.setenv(parse_stats.ENV_VAR, path)
+    timings = sdfparse.parse(SDF)
+    sdfparse.emit(timings)
+
+    with open(path) as fp:
+        lines = [json.loads(line) for line in fp]
+    assert len(lines) == 2
+    assert lines[0]['tokens']['CELL'] == 20
+    assert 'emit' in lines[1]['phases']
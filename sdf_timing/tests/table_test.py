@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import os.path
+
+import pytest
+
+from sdf_timing import sdfparse
+from sdf_timing.table import TimingTable
+
+from conftest import datafiles
+from conftest import datafiles_path
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_table(f):
+    with open(os.path.join(datafiles_path, f)) as sdffile:
+        timings = sdfparse.parse(sdffile.read())
+
+    table = TimingTable.from_timings(timings)
+    assert table.to_timings() == timings
+
+    for celltype, instances in timings.get('cells', dict()).items():
+        for instance, entries in instances.items():
+            assert table.cell(celltype, instance) == entries
+
+
+@pytest.mark.parametrize('f', datafiles)
+def test_table_from_events(f):
+    with open(os.path.join(datafiles_path, f)) as sdffile:
+        timings = sdfparse.parse(sdffile.read())
+
+    with open(os.path.join(datafiles_path, f), 'rb') as sdffile:
+        table = TimingTable.from_events(sdfparse.iterparse(sdffile))
+    assert table.to_timings() == timings
+
+
+def test_table_missing_cell():
+    table = TimingTable()
+    with pytest.raises(KeyError):
+        table.cell('buf', 'b')
+
+
+def test_table_split_cell():
+    # the entries of a cell added in several parts, between other cells
+    timings = sdfparse.parse("""(DELAYFILE (SDFVERSION "3.0")
+    (CELL (CELLTYPE "buf") (INSTANCE a)
+        (DELAY (ABSOLUTE (IOPATH A Z (1:1:1)))))
+    (CELL (CELLTYPE "buf") (INSTANCE b)
+        (DELAY (ABSOLUTE (IOPATH A Z (2:2:2)))))
+    (CELL (CELLTYPE "buf") (INSTANCE a)
+        (DELAY (ABSOLUTE (IOPATH B Z (3:3:3))))))""")
+    a = timings['cells']['buf']['a']
+    table = TimingTable()
+    table.add_cell('buf', 'a', {'iopath_A_Z': a['iopath_A_Z']})
+    table.add_cell('buf', 'b', timings['cells']['buf']['b'])
+    table.add_cell('buf', 'a', {'iopath_B_Z': a['iopath_B_Z']})
+    assert table.cell('buf', 'a') == timings['cells']['buf']['a']
+    assert table.cell('buf', 'b') == timings['cells']['buf']['b']
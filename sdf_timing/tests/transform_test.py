@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# Copyright 2020-2022 F4PGA Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import os.path
+
+import pytest
+
+from sdf_timing import sdfparse
+from sdf_timing import transform
+from sdf_timing import utils
+from sdf_timing.table import TimingTable
+
+from conftest import backend_fixture
+from conftest import datafiles_path
+
+
+backend = backend_fixture(transform, 'numpy')
+
+
+def parse(f):
+    with open(os.path.join(datafiles_path, f)) as sdffile:
+        return sdfparse.parse(sdffile.read())
+
+
+def apply(timings, function):
+    """Apply function to every triple of the timings dict"""
+    for instances in timings.get('cells', dict()).values():
+        for entries in instances.values():
+            for entry in entries.values():
+                for triple in (entry['delay_paths'] or dict()).values():
+                    function(triple)
+    return timings
+
+
+def multiply(value, factor):
+    return None if value is None else value * factor
+
+
+def test_scale(backend):
+    table = TimingTable.from_timings(parse('timings_hx1k.sdf'))
+    transform.scale(table, 3.0)
+
+    def expected(triple):
+        for corner in utils.CORNERS:
+            triple[corner] = multiply(triple[corner], 3.0)
+
+    assert table.to_timings() == apply(parse('timings_hx1k.sdf'), expected)
+
+
+def test_convert_timescale(backend):
+    timings = parse('timings_hx1k.sdf')
+    assert timings['header']['timescale'] == '1ps'
+    table = transform.convert_timescale(TimingTable.from_timings(timings),
+                                        '1ns')
+    assert table.header['timescale'] == '1ns'
+    assert timings['header']['timescale'] == '1ps'
+
+    def expected(triple):
+        for corner in utils.CORNERS:
+            triple[corner] = multiply(triple[corner], 0.001)
+
+    result = table.to_timings()
+    result['header']['timescale'] = '1ps'
+    assert result == apply(parse('timings_hx1k.sdf'), expected)
+
+
+def test_derate(backend):
+    table = TimingTable.from_timings(parse('real_triple.sdf'))
+    transform.derate(table, early=0.5, late=2.0)
+
+    def expected(triple):
+        triple['min'] = multiply(triple['min'], 0.5)
+        triple['max'] = multiply(triple['max'], 2.0)
+
+    assert table.to_timings() == apply(parse('real_triple.sdf'), expected)
+
+
+@pytest.mark.parametrize('corner', utils.CORNERS)
+def test_select_corner(corner):
+    table = TimingTable.from_timings(parse('real_triple.sdf'))
+    transform.select_corner(table, corner)
+
+    def expected(triple):
+        triple['min'] = triple['avg'] = triple['max'] = triple[corner]
+
+    assert table.to_timings() == apply(parse('real_triple.sdf'), expected)
+
+
+def test_select_unknown_corner():
+    with pytest.raises(Exception, match="Unknown corner 'typ'"):
+        transform.select_corner(TimingTable(), 'typ')
@@ -18,6 +18,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import re
+import sys
+
+CORNERS = ('min', 'avg', 'max')
+
+# timescale of a file without TIMESCALE, as defined by the SDF standard
+DEFAULT_TIMESCALE = '1ns'
 
 
 def get_scale_fs(timescale):
@@ -87,6 +93,19 @@ def get_scale_seconds(timescale):
     return 1e-15 * get_scale_fs(timescale)
 
 
+def iter_cells(timings):
+    """Return the timings returned by sdfparse.parse() as a stream of
+    (celltype, instance, entries) tuples, as yielded by sdfparse.iterparse()
+
+    >>> list(iter_cells({'header': {}, 'cells': {'buf': {'b': {}}}}))
+    [(None, None, {}), ('buf', 'b', {})]
+    """
+    yield None, None, timings.get('header', dict())
+    for celltype, instances in timings.get('cells', dict()).items():
+        for instance, entries in instances.items():
+            yield celltype, instance, entries
+
+
 def prepare_entry(name=None,
                   type=None,
                   from_pin=None,
@@ -121,7 +140,7 @@ def prepare_entry(name=None,
 
 def add_port(portname, paths):
 
-    name = "port_" + portname['port']
+    name = sys.intern("port_" + portname['port'])
     return prepare_entry(name=name,
                          type='port',
                          from_pin=portname['port'],
@@ -131,8 +150,7 @@ def add_port(portname, paths):
 
 def add_interconnect(pfrom, pto, paths):
 
-    name = "interconnect_"
-    name += pfrom['port'] + "_" + pto['port']
+    name = sys.intern("interconnect_" + pfrom['port'] + "_" + pto['port'])
     return prepare_entry(name=name,
                          type='interconnect',
                          from_pin=pfrom['port'],
@@ -144,8 +162,7 @@ def add_interconnect(pfrom, pto, paths):
 
 def add_iopath(pfrom, pto, paths):
 
-    name = "iopath_"
-    name += pfrom['port'] + "_" + pto['port']
+    name = sys.intern("iopath_" + pfrom['port'] + "_" + pto['port'])
     return prepare_entry(name=name,
                          type='iopath',
                          from_pin=pfrom['port'],
@@ -157,8 +174,7 @@ def add_iopath(pfrom, pto, paths):
 
 def add_device(port, paths):
 
-    name = "device_"
-    name += port['port']
+    name = sys.intern("device_" + port['port'])
     return prepare_entry(name=name,
                          type='device',
                          from_pin=port['port'],
@@ -168,8 +184,7 @@ def add_device(port, paths):
 
 def add_tcheck(type, pto, pfrom, paths):
 
-    name = type + "_"
-    name += pfrom['port'] + "_" + pto['port']
+    name = sys.intern(type + "_" + pfrom['port'] + "_" + pto['port'])
     return prepare_entry(name=name,
                          type=type,
                          is_timing_check=True,
@@ -184,8 +199,7 @@ def add_tcheck(type, pto, pfrom, paths):
 
 def add_constraint(type, pto, pfrom, paths):
 
-    name = type + "_"
-    name += pfrom['port'] + "_" + pto['port']
+    name = sys.intern(type + "_" + pfrom['port'] + "_" + pto['port'])
     return prepare_entry(name=name,
                          type=type,
                          is_timing_env=True,
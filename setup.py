@@ -84,6 +84,10 @@ setuptools.setup(
         'ply',
         'pyjson',
     ],
+    extras_require={
+        'numpy': ['numpy'],
+        'orjson': ['orjson'],
+    },
     tests_require=[
         "pytest",
     ],